@@ -0,0 +1,172 @@
+import errno
+import os
+import struct
+import sys
+from unittest.mock import MagicMock, patch, call
+
+import pytest
+
+for module in ['swsscommon', 'swsscommon.swsscommon', 'sonic_py_common', 'pyroute2', 'pyroute2.netlink',
+               'pyroute2.netlink.exceptions', 'scapy', 'scapy.layers', 'scapy.layers.inet', 'scapy.layers.inet6',
+               'scapy.sendrecv']:
+    sys.modules.setdefault(module, MagicMock())
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import tunnel_packet_handler
+from tunnel_packet_handler import NeighborProber, TunnelPacketHandler, icmp_checksum, \
+                                  PROBE_BATCH_SIZE, PROBE_HOLDDOWN, COUNTERS_DB, COUNTER_KEY
+
+
+class StopLoop(Exception):
+    pass
+
+
+@pytest.fixture
+def mock_socket():
+    with patch('tunnel_packet_handler.socket.socket') as mock_socket, \
+         patch('tunnel_packet_handler.os.getpid', return_value=0x12345):
+        sock_v4, sock_v6 = MagicMock(), MagicMock()
+        mock_socket.side_effect = [sock_v4, sock_v6]
+        yield sock_v4, sock_v6
+
+
+@pytest.fixture
+def handler():
+    with patch('tunnel_packet_handler.ConfigDBConnector'), \
+         patch('tunnel_packet_handler.IPRoute'), \
+         patch('tunnel_packet_handler.SonicV2Connector') as mock_v2:
+        mock_v2.return_value.get_db_separator.return_value = ':'
+        handler = TunnelPacketHandler()
+    handler.prober = MagicMock()
+    handler.counters_pipe = MagicMock()
+    return handler
+
+
+def test_icmp_checksum():
+    # Example of RFC 1071, the checksum is the complement of the sum
+    assert icmp_checksum(b'\x00\x01\xf2\x03\xf4\xf5\xf6\xf7') == ~0xddf2 & 0xffff
+    assert icmp_checksum(b'\x08\x00\x00\x00\x00\x01\x00\x01\x01') == ~0x0902 & 0xffff
+
+
+def test_probe_ipv4(mock_socket):
+    sock_v4, sock_v6 = mock_socket
+    prober = NeighborProber()
+    sock_v4.setsockopt.assert_called_once_with(tunnel_packet_handler.SOL_RAW, tunnel_packet_handler.ICMP_FILTER,
+                                               struct.pack('I', 0xffffffff))
+    sock_v4.setblocking.assert_called_once_with(False)
+
+    prober.probe('192.168.0.2', 4)
+    prober.probe('192.168.0.3', 4)
+    assert sock_v4.sendto.call_args_list == [
+        call(b'\x08\x00\xd4\xb9\x23\x45\x00\x01', ('192.168.0.2', 0)),
+        call(b'\x08\x00\xd4\xb8\x23\x45\x00\x02', ('192.168.0.3', 0)),
+    ]
+    # The checksum of a message including its checksum is 0
+    for args in sock_v4.sendto.call_args_list:
+        assert icmp_checksum(args[0][0]) == 0
+    sock_v6.sendto.assert_not_called()
+
+
+def test_probe_ipv6(mock_socket):
+    sock_v4, sock_v6 = mock_socket
+    prober = NeighborProber()
+    prober.probe('fc02:1000::2', 6)
+    # The kernel fills in the checksum of ICMPv6 messages
+    sock_v6.sendto.assert_called_once_with(b'\x80\x00\x00\x00\x23\x45\x00\x01', ('fc02:1000::2', 0))
+    sock_v4.sendto.assert_not_called()
+
+
+def test_probe_send_error(mock_socket):
+    sock_v4, _ = mock_socket
+    prober = NeighborProber()
+    sock_v4.sendto.side_effect = OSError(errno.EAGAIN, 'Resource temporarily unavailable')
+    with patch.object(tunnel_packet_handler.logger, 'log_warning') as mock_log:
+        prober.probe('192.168.0.2', 4)
+        mock_log.assert_not_called()
+        sock_v4.sendto.side_effect = OSError(errno.ENETUNREACH, 'Network is unreachable')
+        prober.probe('192.168.0.2', 4)
+        mock_log.assert_called_once()
+
+
+def test_probe_holddown(handler):
+    handler.pending_dsts = {'192.168.0.2': 4, 'fc02:1000::2': 6}
+    assert handler.probe_pending_dsts(10) == [('192.168.0.2', 4), ('fc02:1000::2', 6)]
+    handler.prober.probe.assert_has_calls([call('192.168.0.2', 4), call('fc02:1000::2', 6)])
+
+    # A destination is not probed again within the holddown
+    handler.prober.reset_mock()
+    handler.pending_dsts = {'192.168.0.2': 4}
+    assert handler.probe_pending_dsts(10 + PROBE_HOLDDOWN / 2) == []
+    handler.prober.probe.assert_not_called()
+    assert handler.pending_dsts == {}
+
+    handler.pending_dsts = {'192.168.0.2': 4}
+    assert handler.probe_pending_dsts(10 + PROBE_HOLDDOWN) == [('192.168.0.2', 4)]
+    handler.prober.probe.assert_called_once_with('192.168.0.2', 4)
+
+
+def test_probe_batch_limit(handler):
+    dsts = ['192.168.0.{}'.format(i) for i in range(PROBE_BATCH_SIZE * 2 + 5)]
+    handler.pending_dsts = dict.fromkeys(dsts, 4)
+    handler.pending_event.set()
+
+    assert [dst for dst, _ in handler.probe_pending_dsts(10)] == dsts[:PROBE_BATCH_SIZE]
+    assert handler.prober.probe.call_count == PROBE_BATCH_SIZE
+    assert handler.pending_event.is_set()
+    assert [dst for dst, _ in handler.probe_pending_dsts(10)] == dsts[PROBE_BATCH_SIZE:PROBE_BATCH_SIZE * 2]
+    assert [dst for dst, _ in handler.probe_pending_dsts(10)] == dsts[PROBE_BATCH_SIZE * 2:]
+    assert handler.prober.probe.call_count == len(dsts)
+    assert not handler.pending_event.is_set()
+
+
+def test_ping_inner_dst(handler):
+    packet = MagicMock()
+    packet.__getitem__.return_value.payload.__getitem__.return_value.dst = '192.168.0.2'
+    with patch.object(handler, 'get_inner_pkt_type', return_value=tunnel_packet_handler.IP):
+        handler.ping_inner_dst(packet)
+        handler.ping_inner_dst(packet)
+    assert handler.pkt_count == 2
+    assert handler.pending_dsts == {'192.168.0.2': 4}
+    assert handler.pending_event.is_set()
+
+
+@patch('tunnel_packet_handler.RedisCommand')
+def test_flush_count_to_db(mock_cmd, handler):
+    handler.pkt_count = 5
+    assert handler.flush_count_to_db(0) == 5
+    mock_cmd.return_value.formatHSET.assert_called_once_with('COUNTERS:IPINIP_TUNNEL_CPU_PKTS', {COUNTER_KEY: '5'})
+    handler.counters_pipe.push.assert_called_once_with(mock_cmd.return_value)
+    handler.counters_pipe.flush.assert_called_once()
+
+    # An unchanged count is not written again
+    mock_cmd.reset_mock()
+    handler.counters_pipe.reset_mock()
+    assert handler.flush_count_to_db(5) == 5
+    mock_cmd.return_value.formatHSET.assert_not_called()
+    handler.counters_pipe.push.assert_not_called()
+
+
+@patch('tunnel_packet_handler.time.sleep')
+@patch('tunnel_packet_handler.time.monotonic')
+@patch('tunnel_packet_handler.NeighborProber')
+@patch('tunnel_packet_handler.RedisPipeline')
+@patch('tunnel_packet_handler.RedisCommand')
+def test_probe_inner_dsts(mock_cmd, mock_pipe, mock_prober, mock_monotonic, mock_sleep, handler):
+    handler.counters_db.get.return_value = '3'
+    handler.pending_dsts = {'192.168.0.2': 4}
+    handler.pkt_count = 1
+    handler.pending_event = MagicMock()
+    handler.pending_event.wait.side_effect = [True, False, StopLoop]
+    mock_monotonic.side_effect = [100, 100, 100.5, 100.5, 101, 101]
+
+    with pytest.raises(StopLoop):
+        handler.probe_inner_dsts()
+
+    # The counter continues from the value in COUNTERS_DB
+    handler.counters_db.get.assert_called_once_with(COUNTERS_DB, 'COUNTERS:IPINIP_TUNNEL_CPU_PKTS', COUNTER_KEY)
+    mock_prober.return_value.probe.assert_called_once_with('192.168.0.2', 4)
+    mock_sleep.assert_called_once_with(tunnel_packet_handler.PROBE_INTERVAL)
+    # The counter is flushed once every COUNTER_FLUSH_INTERVAL
+    mock_cmd.return_value.formatHSET.assert_called_once_with('COUNTERS:IPINIP_TUNNEL_CPU_PKTS', {COUNTER_KEY: '4'})
+    mock_pipe.return_value.flush.assert_called_once()
+    assert handler.last_probe == {'192.168.0.2': 100.5}
@@ -7,7 +7,10 @@ information for the inner packet's destination IP, the entire encapsulated
 packet is trapped to the CPU. In this case, we should ping the inner
 destination IP to trigger the process of obtaining neighbor information
 """
-import subprocess
+import errno
+import os
+import socket
+import struct
 import sys
 import time
 from datetime import datetime
@@ -16,7 +19,8 @@ from queue import Queue
 from threading import Lock, Event, Thread
 
 from swsscommon.swsscommon import ConfigDBConnector, SonicV2Connector, \
-                                  DBConnector, Select, SubscriberStateTable
+                                  DBConnector, Select, SubscriberStateTable, \
+                                  RedisPipeline, RedisCommand
 from sonic_py_common import logger as log
 
 from pyroute2 import IPRoute
@@ -46,6 +50,18 @@ OPER_STATUS_KEY = 'oper_status'
 IPINIP_TUNNEL = 'ipinip'
 RTM_NEWLINK = 'RTM_NEWLINK'
 SELECT_TIMEOUT = 1000
+# Inner destinations are probed in batches of at most PROBE_BATCH_SIZE
+# every PROBE_INTERVAL seconds, a destination is probed at most once
+# every PROBE_HOLDDOWN seconds
+PROBE_INTERVAL = 0.05
+PROBE_BATCH_SIZE = 10
+PROBE_HOLDDOWN = 1
+COUNTER_FLUSH_INTERVAL = 1
+ICMP_ECHO_REQUEST = 8
+ICMPV6_ECHO_REQUEST = 128
+SOL_RAW = 255
+ICMP_FILTER = 1
+ICMPV6_FILTER = 1
 
 nl_msgs = Queue()
 portchannel_intfs = None
@@ -62,6 +78,61 @@ def add_msg_to_queue(target, msg):
     if msg.get_attr('IFLA_IFNAME') in portchannel_intfs:
         nl_msgs.put(msg)
 
+def icmp_checksum(data):
+    """
+    Computes the internet checksum of an ICMP message
+    """
+    if len(data) % 2:
+        data += b'\x00'
+    csum = sum(struct.unpack('!{}H'.format(len(data) // 2), data))
+    csum = (csum >> 16) + (csum & 0xffff)
+    csum += csum >> 16
+    return ~csum & 0xffff
+
+
+class NeighborProber(object):
+    """
+    Sends ICMP/ICMPv6 echo requests from raw sockets
+
+    The replies are not needed, sending the request makes the kernel
+    resolve the neighbor (ARP or NS) for the destination like ping does.
+    """
+
+    def __init__(self):
+        self.ident = os.getpid() & 0xffff
+        self.seq = 0
+        self.sock_v4 = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+        self.sock_v6 = socket.socket(socket.AF_INET6, socket.SOCK_RAW, socket.IPPROTO_ICMPV6)
+        # Block all incoming ICMP messages, nothing is read from the sockets
+        self.sock_v4.setsockopt(SOL_RAW, ICMP_FILTER, struct.pack('I', 0xffffffff))
+        self.sock_v6.setsockopt(socket.IPPROTO_ICMPV6, ICMPV6_FILTER, b'\xff' * 32)
+        self.sock_v4.setblocking(False)
+        self.sock_v6.setblocking(False)
+
+    def probe(self, dst_ip, version):
+        """
+        Sends an echo request to dst_ip
+
+        Args:
+            dst_ip: (str) destination IP address
+            version: (int) 4 or 6
+        """
+        self.seq = (self.seq + 1) & 0xffff
+        if version == 6:
+            # The kernel computes the checksum for ICMPv6 raw sockets
+            msg = struct.pack('!BBHHH', ICMPV6_ECHO_REQUEST, 0, 0, self.ident, self.seq)
+            sock = self.sock_v6
+        else:
+            msg = struct.pack('!BBHHH', ICMP_ECHO_REQUEST, 0, 0, self.ident, self.seq)
+            msg = msg[:2] + struct.pack('!H', icmp_checksum(msg)) + msg[4:]
+            sock = self.sock_v4
+        try:
+            sock.sendto(msg, (dst_ip, 0))
+        except OSError as error:
+            if error.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                logger.log_warning('Failed to probe {}: {}'.format(dst_ip, error))
+
+
 class TunnelPacketHandler(object):
     """
     This class handles unroutable tunnel packets that are trapped
@@ -84,7 +155,15 @@ class TunnelPacketHandler(object):
         self.self_ip = ''
         self.packet_filter = ''
         self.sniff_intfs = set()
-        self.pending_cmds = Queue()
+        # Inner destinations waiting to be probed, and the number of
+        # tunnel packets, updated by the sniffer thread
+        self.lock = Lock()
+        self.pending_dsts = {}
+        self.pending_event = Event()
+        self.pkt_count = 0
+        self.last_probe = {}
+        self.prober = None
+        self.counters_pipe = None
 
         global portchannel_intfs
         portchannel_intfs = [name for name, _ in self.portchannel_intfs]
@@ -313,43 +392,98 @@ class TunnelPacketHandler(object):
         while not hasattr(self.sniffer, 'stop_cb'):
             time.sleep(0.1)
 
-    def write_count_to_db(self):
+    def flush_count_to_db(self, flushed_count):
+        """
+        Writes the tunnel packet count to COUNTERS_DB if it changed
+
+        Returns:
+            (int) the count in COUNTERS_DB
+        """
+        with self.lock:
+            pkt_count = self.pkt_count
+        if pkt_count != flushed_count:
+            command = RedisCommand()
+            command.formatHSET(self.tunnel_counter_table, {COUNTER_KEY: str(pkt_count)})
+            self.counters_pipe.push(command)
+            self.counters_pipe.flush()
+        return pkt_count
+
+    def probe_pending_dsts(self, now):
+        """
+        Probes the next batch of pending inner destinations
+
+        Args:
+            now: (float) current time.monotonic() value
+
+        Returns:
+            (list) Tuples of the probed destination IP (str) and IP version (int)
+        """
+        batch = []
+        with self.lock:
+            while self.pending_dsts and len(batch) < PROBE_BATCH_SIZE:
+                dst_ip = next(iter(self.pending_dsts))
+                version = self.pending_dsts.pop(dst_ip)
+                if now - self.last_probe.get(dst_ip, -PROBE_HOLDDOWN) >= PROBE_HOLDDOWN:
+                    batch.append((dst_ip, version))
+            if not self.pending_dsts:
+                self.pending_event.clear()
+
+        for dst_ip, version in batch:
+            logger.log_info('Probing {}'.format(dst_ip))
+            self.prober.probe(dst_ip, version)
+            self.last_probe[dst_ip] = now
+
+        return batch
+
+    def probe_inner_dsts(self):
+        """
+        Probes the pending inner destinations and flushes the packet counter
+
+        Destinations are deduplicated, probed in rate limited batches and
+        skipped if they were probed within PROBE_HOLDDOWN seconds
+        """
+        try:
+            flushed_count = int(self.counters_db.get(COUNTERS_DB, self.tunnel_counter_table, COUNTER_KEY))
+        except TypeError:
+            flushed_count = 0
+        with self.lock:
+            self.pkt_count += flushed_count
+        self.counters_pipe = RedisPipeline(self.counters_db.get_redis_client(COUNTERS_DB))
+        self.prober = NeighborProber()
+        next_flush = time.monotonic() + COUNTER_FLUSH_INTERVAL
+
         while True:
-            # use a set to automatically deduplicate destination IPs
-            to_run = set()
-
-            to_run.add(tuple(self.pending_cmds.get()))
-            pkt_count = 1
-            while not self.pending_cmds.empty() and len(to_run) < 100:
-                to_run.add(tuple(self.pending_cmds.get()))
-                # we should always count each packet, but only ping for each unique IP
-                pkt_count += 1
-
-            for cmds in to_run:
-                logger.log_info("Running command '{}'".format(' '.join(cmds)))
-                subprocess.run(cmds, stdout=subprocess.DEVNULL)
-            try:
-                curr_count = int(self.counters_db.get(COUNTERS_DB, self.tunnel_counter_table, COUNTER_KEY))
-            except TypeError:
-                curr_count = 0
-            self.counters_db.set(COUNTERS_DB, self.tunnel_counter_table, COUNTER_KEY, str(curr_count + pkt_count))
+            self.pending_event.wait(max(next_flush - time.monotonic(), 0))
+            now = time.monotonic()
+            batch = self.probe_pending_dsts(now)
+
+            if now >= next_flush:
+                flushed_count = self.flush_count_to_db(flushed_count)
+                self.last_probe = {dst_ip: ts for dst_ip, ts in self.last_probe.items()
+                                   if now - ts < PROBE_HOLDDOWN}
+                next_flush = now + COUNTER_FLUSH_INTERVAL
+
+            if batch:
+                # Rate limit the probes
+                time.sleep(PROBE_INTERVAL)
 
     def ping_inner_dst(self, packet):
         """
-        Pings the inner destination IP for an encapsulated packet
+        Queues the inner destination IP of an encapsulated packet for probing
+
+        The BPF filter of the sniffer only passes IPinIP packets sent from
+        the peer to this device
 
         Args:
             packet: The encapsulated packet received
         """
         inner_packet_type = self.get_inner_pkt_type(packet)
-        if inner_packet_type and packet[IP].dst == self.self_ip:
-            cmds = ['timeout', '0.2', 'ping', '-c1',
-                    '-W1', '-i0', '-n', '-q']
-            if inner_packet_type == IPv6:
-                cmds.append('-6')
+        if inner_packet_type:
             dst_ip = packet[IP].payload[inner_packet_type].dst
-            cmds.append(dst_ip)
-            self.pending_cmds.put(cmds)
+            with self.lock:
+                self.pkt_count += 1
+                self.pending_dsts[dst_ip] = 6 if inner_packet_type == IPv6 else 4
+            self.pending_event.set()
 
     def listen_for_tunnel_pkts(self):
         """
@@ -364,7 +498,8 @@ class TunnelPacketHandler(object):
                               'config DB, exiting...')
             return None
 
-        self.packet_filter = 'host {} and host {}'.format(self.self_ip, peer_ip)
+        self.packet_filter = ('src host {} and dst host {} and (ip proto 4 or ip proto 41)'
+                              .format(peer_ip, self.self_ip))
         logger.log_notice('Starting tunnel packet handler for {}'
                           .format(self.packet_filter))
 
@@ -402,7 +537,7 @@ class TunnelPacketHandler(object):
         Entry point for the TunnelPacketHandler class
         """
         self.wait_for_portchannels()
-        db_thread = Thread(target=self.write_count_to_db, daemon=True)
+        db_thread = Thread(target=self.probe_inner_dsts, daemon=True)
         db_thread.start()
         self.listen_for_tunnel_pkts()
 
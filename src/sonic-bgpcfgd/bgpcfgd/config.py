@@ -1,9 +1,71 @@
+import re
+from collections import defaultdict
+
+
+class FrrConfigIndex(object):
+    """ Lookup tables built in one pass over a FRR running config snapshot """
+    RE_PEER_GROUP = re.compile(r'^\s*neighbor (\S+) peer-group$')
+    RE_NEIGHBOR_RM_IN = re.compile(r'^\s*neighbor (\S+) route-map (\S+) in$')
+    RE_ROUTE_MAP = re.compile(r'^route-map (\S+) (permit|deny) (\d+)$')
+    RE_CALL = re.compile(r'^\s*call (\S+)$')
+    RE_PREFIX_LIST = re.compile(r'^(ip|ipv6) prefix-list (\S+) seq (\d+) (.*)$')
+    RE_COMMUNITY_LIST = re.compile(r'^bgp community-list standard (\S+) permit (.*)$')
+
+    def __init__(self, text):
+        """
+        Build the indexes
+        :param text: FRR config as a list of lines, as returned by ConfigMgr.get_text()
+        """
+        self.peer_groups = []  # peer-group names in the config order
+        self.neighbor_route_map_in = {}  # neighbor or peer-group name -> route-map in
+        self.route_map_calls = {}  # route-map name -> name of the route-map called by the route-map
+        self.route_map_entries = defaultdict(dict)  # (route-map name, action) -> seq number -> body lines
+        self.prefix_lists = defaultdict(list)  # (family, prefix-list name) -> [(seq number, rule)]
+        self.community_lists = {}  # standard community-list name -> permitted value
+        call_rm = None
+        body = None
+        for line in text:
+            s_line = line.strip()
+            if body is not None and line.startswith(' '):
+                body.append(s_line)
+            else:
+                body = None
+            m = self.RE_PEER_GROUP.match(line)
+            if m:
+                self.peer_groups.append(m.group(1))
+                continue
+            m = self.RE_NEIGHBOR_RM_IN.match(line)
+            if m:
+                self.neighbor_route_map_in.setdefault(m.group(1), m.group(2))
+                continue
+            if call_rm is not None:
+                m = self.RE_CALL.match(line)
+                if m:
+                    self.route_map_calls[call_rm] = m.group(1)
+                    call_rm = None
+                    continue
+            m = self.RE_ROUTE_MAP.match(line)
+            if m:
+                call_rm = m.group(1)
+                body = []
+                self.route_map_entries[(m.group(1), m.group(2))][int(m.group(3))] = body
+                continue
+            m = self.RE_PREFIX_LIST.match(s_line)
+            if m:
+                self.prefix_lists[(m.group(1), m.group(2))].append((int(m.group(3)), m.group(4)))
+                continue
+            m = self.RE_COMMUNITY_LIST.match(s_line)
+            if m:
+                self.community_lists.setdefault(m.group(1), m.group(2))
+
+
 class ConfigMgr(object):
     """ The class represents frr configuration """
     def __init__(self, frr):
         self.frr = frr
         self.current_config = None
         self.current_config_raw = None
+        self.current_index = None
         self.changes = ""
         self.peer_groups_to_restart = []
 
@@ -11,13 +73,25 @@ class ConfigMgr(object):
         """ Reset stored config """
         self.current_config = None
         self.current_config_raw = None
+        self.current_index = None
         self.changes = ""
         self.peer_groups_to_restart = []
 
-    def update(self):
-        """ Read current config from FRR """
+    def invalidate(self):
+        """ Drop the running config snapshot, the next update() reads it from FRR again """
         self.current_config = None
         self.current_config_raw = None
+        self.current_index = None
+
+    def update(self):
+        """
+        Read current config from FRR.
+        The snapshot stays valid until commit() or invalidate() is called, so all managers
+        handling events in the same Runner iteration share one 'show running-config'
+        """
+        if self.current_config_raw is not None:
+            return
+        self.invalidate()
         out = self.frr.get_config()
         text = []
         for line in out.split('\n'):
@@ -45,16 +119,19 @@ class ConfigMgr(object):
 
     def restart_peer_groups(self, peer_groups):
         """
-        Schedule peer_groups for restart on commit
+        Schedule peer_groups for restart on commit. Every peer_group is restarted once per commit
         :param peer_groups: List of peer_groups
         """
-        self.peer_groups_to_restart.extend(peer_groups)
+        for peer_group in peer_groups:
+            if peer_group not in self.peer_groups_to_restart:
+                self.peer_groups_to_restart.append(peer_group)
 
     def commit(self):
         """
         Write configuration change to FRR.
         :return: True if change was applied successfully, False otherwise
         """
+        self.invalidate()
         if self.changes.strip() == "":
             return True
         rc_write = self.frr.write(self.changes)
@@ -65,6 +142,15 @@ class ConfigMgr(object):
     def get_text(self):
         return self.current_config_raw
 
+    def get_index(self):
+        """
+        Get lookup tables for the current config snapshot. The tables are built on first use
+        :return: FrrConfigIndex object
+        """
+        if self.current_index is None:
+            self.current_index = FrrConfigIndex(self.get_text() or [])
+        return self.current_index
+
     @staticmethod
     def to_canonical(raw_config):
         """
@@ -1,13 +1,127 @@
 import os
 import datetime
+import socket
+import threading
 import time
 import tempfile
 
-from bgpcfgd.log import log_err, log_info, log_warn, log_crit
+from bgpcfgd.log import log_debug, log_err, log_info, log_warn, log_crit
 from .vars import g_debug
 from .utils import run_command
 
 
+class VtyClient(object):
+    """
+    Persistent connection to the vty socket of a FRR daemon.
+    Uses the vtysh protocol: every command is terminated by '\0',
+    every reply is terminated by three '\0' bytes followed by the command return code
+    """
+    VTY_DIR = '/run/frr'
+    TIMEOUT = 60
+    PIPELINE_DEPTH = 64  # max number of commands sent before the replies are read
+    REPLY_END = b'\0\0\0'
+
+    def __init__(self, daemon, vty_dir=VTY_DIR):
+        self.daemon = daemon
+        self.path = os.path.join(vty_dir, '%s.vty' % daemon)
+        self.sock = None
+        self.buf = b''
+        self.lock = threading.Lock()
+
+    def connect(self):
+        """
+        Connect to the daemon and enter the enable mode
+        :return: True if the client is connected, False otherwise
+        """
+        if self.sock is not None:
+            return True
+        if not os.path.exists(self.path):
+            return False
+        try:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(self.TIMEOUT)
+            self.sock.connect(self.path)
+            self.buf = b''
+            rc, out = self.__exchange(['enable'])[0]
+            if rc != 0:
+                log_err("VtyClient: 'enable' failed on %s: rc=%d out='%s'" % (self.daemon, rc, out))
+                self.close()
+                return False
+        except (OSError, socket.error) as e:
+            log_warn("VtyClient: can't connect to %s: %s" % (self.path, str(e)))
+            self.close()
+            return False
+        log_info("VtyClient: connected to %s" % self.path)
+        return True
+
+    def close(self):
+        """ Close the connection """
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except (OSError, socket.error):
+                pass
+        self.sock = None
+        self.buf = b''
+
+    def run(self, commands):
+        """
+        Run exec commands on the daemon. The commands are pipelined
+        :param commands: list of commands
+        :return: list of tuples (return code, output) in the order of the commands, or None when the daemon is not reachable
+        """
+        with self.lock:
+            if not self.connect():
+                return None
+            results = []
+            try:
+                for i in range(0, len(commands), self.PIPELINE_DEPTH):
+                    results += self.__exchange(commands[i:i + self.PIPELINE_DEPTH])
+            except (OSError, socket.error, EOFError) as e:
+                log_warn("VtyClient: connection to %s failed: %s" % (self.path, str(e)))
+                self.close()
+                return None
+            return results
+
+    def __exchange(self, commands):
+        self.sock.sendall(b''.join(command.encode('utf-8') + b'\0' for command in commands))
+        return [self.__read_reply() for _ in commands]
+
+    def __read_reply(self):
+        while True:
+            pos = self.buf.find(self.REPLY_END)
+            if pos != -1 and len(self.buf) > pos + len(self.REPLY_END):
+                out = self.buf[:pos].decode('utf-8', errors='replace')
+                rc = self.buf[pos + len(self.REPLY_END)]
+                self.buf = self.buf[pos + len(self.REPLY_END) + 1:]
+                return rc, out
+            data = self.sock.recv(65536)
+            if not data:
+                raise EOFError("connection closed by %s" % self.daemon)
+            self.buf += data
+
+
+g_vty_clients = {}
+
+
+def vtysh_exec(commands, daemon='bgpd'):
+    """
+    Run FRR exec commands (show, clear) on a daemon.
+    The commands are pipelined through a persistent vty connection to the daemon.
+    Falls back to a vtysh process per command when the daemon vty socket is not available
+    :param commands: list of commands
+    :param daemon: name of the FRR daemon which runs the commands
+    :return: list of tuples (return code, stdout, stderr) in the order of the commands
+    """
+    if daemon not in g_vty_clients:
+        g_vty_clients[daemon] = VtyClient(daemon)
+    results = g_vty_clients[daemon].run(commands)
+    if results is not None:
+        return [(rc, out, out if rc != 0 else "") for rc, out in results]
+    log_debug("vtysh_exec: fallback to vtysh for %d commands" % len(commands))
+    return [run_command(["vtysh", "-c", command]) for command in commands]
+
+
 class FRR(object):
     """Proxy object with FRR"""
     def __init__(self, daemons):
@@ -61,8 +175,9 @@ class FRR(object):
         :return: True if restart of all peer-groups was successful, False otherwise
         """
         res = True
-        for peer_group in sorted(peer_groups):
-            rc, out, err = run_command(["vtysh", "-c", "clear bgp peer-group %s soft in" % peer_group])
+        peer_groups = sorted(set(peer_groups))
+        results = vtysh_exec(["clear bgp peer-group %s soft in" % peer_group for peer_group in peer_groups])
+        for peer_group, (rc, out, err) in zip(peer_groups, results):
             if rc != 0:
                 log_value = peer_group, rc, out, err
                 log_crit("Can't restart bgp peer-group '%s'. rc='%d', out='%s', err='%s'" % log_value)
@@ -131,7 +131,11 @@ def do_work():
         managers.append(AsPathMgr(common_objs, "CONFIG_DB", "DEVICE_METADATA"))
         log_notice("Prefix List Manager and AsPath Manager are enabled for UpperSpineRouter/UpstreamLC")
 
-    runner = Runner(common_objs['cfg_mgr'])
+    window = common_objs['constants'].get('bgp', {}).get('coalescing_window', {})
+    runner = Runner(common_objs['cfg_mgr'],
+                    max_delay=int(window.get('max_delay_ms', Runner.MAX_DELAY)),
+                    max_batch=int(window.get('max_batch', Runner.MAX_BATCH)),
+                    state_db_conn=common_objs['state_db_conn'])
     for mgr in managers:
         runner.add_manager(mgr)
     runner.run()
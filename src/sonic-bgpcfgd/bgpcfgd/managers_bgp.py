@@ -8,7 +8,7 @@ import os
 from .log import log_warn, log_err, log_info, log_debug, log_crit
 from .manager import Manager
 from .template import TemplateFabric
-from .utils import run_command
+from .frr import vtysh_exec
 from .managers_device_global import DeviceGlobalCfgMgr
 
 
@@ -368,11 +368,11 @@ class BGPPeerMgrBase(Manager):
         ipv4_ranges = []
         ipv6_ranges = []
         if vrf == 'default':
-            command = ["vtysh", "-c", "show bgp peer-group %s json" % (nbr)]
+            command = "show bgp peer-group %s json" % (nbr)
         else:
-            command = ["vtysh", "-c", "show bgp vrf %s peer-group %s json" % (vrf, nbr)]
+            command = "show bgp vrf %s peer-group %s json" % (vrf, nbr)
         try:
-            ret_code, out, err = run_command(command)
+            ret_code, out, err = vtysh_exec([command])[0]
             if ret_code == 0:
                 js_bgp = json.loads(out)
                 if nbr in js_bgp and 'dynamicRanges' in js_bgp[nbr] and 'IPv4' in js_bgp[nbr]['dynamicRanges'] and 'ranges' in js_bgp[nbr]['dynamicRanges']['IPv4']:
@@ -547,18 +547,17 @@ class BGPPeerMgrBase(Manager):
         Load peers from FRR.
         :return: set of peers, which are already installed in FRR
         """
-        command = ["vtysh", "-H", "/dev/null", "-c", "show bgp vrfs json"]
-        ret_code, out, err = run_command(command)
+        ret_code, out, err = vtysh_exec(["show bgp vrfs json"])[0]
         if ret_code == 0:
             js_vrf = json.loads(out)
-            vrfs = js_vrf['vrfs'].keys()
+            vrfs = list(js_vrf['vrfs'].keys())
         else:
             log_crit("Can't read bgp vrfs: %s" % err)
             raise Exception("Can't read bgp vrfs: %s" % err)
         peers = set()
-        for vrf in vrfs:
-            command = ["vtysh", "-c", 'show bgp vrf %s neighbors json' % str(vrf)]
-            ret_code, out, err = run_command(command)
+        # Query neighbors of all vrfs in one pipelined batch
+        results = vtysh_exec(['show bgp vrf %s neighbors json' % str(vrf) for vrf in vrfs])
+        for vrf, (ret_code, out, err) in zip(vrfs, results):
             if ret_code == 0:
                 js_bgp = json.loads(out)
                 for nbr in js_bgp.keys():
@@ -1,3 +1,4 @@
+import time
 from collections import defaultdict
 from swsscommon import swsscommon
 
@@ -17,16 +18,32 @@ class Runner(object):
     """ Implements main io-loop of the application
         It will run event handlers inside of Manager objects
         when corresponding db/table is updated
+        Events are collected into a coalescing window. Events for the same key
+        are merged inside of the window and the changes are committed to FRR once per window
     """
     SELECT_TIMEOUT = 1000
+    MAX_DELAY = 200    # max time in milliseconds to collect events of one window
+    MAX_BATCH = 1000   # max number of distinct keys in one window
+    STATS_TABLE_NAME = "BGPCFGD_RUNNER_STATS"
+    STATS_KEY = "window"
 
-    def __init__(self, cfg_manager):
-        """ Constructor """
+    def __init__(self, cfg_manager, max_delay=MAX_DELAY, max_batch=MAX_BATCH, state_db_conn=None):
+        """
+        Constructor
+        :param cfg_manager: ConfigMgr object
+        :param max_delay: max time in milliseconds to collect events before commit. 0 - commit on every wakeup
+        :param max_batch: max number of distinct keys collected before commit
+        :param state_db_conn: STATE_DB connector to export the window metrics. None - don't export metrics
+        """
         self.cfg_manager = cfg_manager
+        self.max_delay = max_delay
+        self.max_batch = max_batch
         self.db_connectors = {}
         self.selector = swsscommon.Select()
         self.callbacks = defaultdict(lambda: defaultdict(list))  # db -> table -> handlers[]
         self.subscribers = set()
+        self.stats_table = swsscommon.Table(state_db_conn, self.STATS_TABLE_NAME) if state_db_conn is not None else None
+        self.stats = {'windows': 0, 'events': 0, 'coalesced': 0}
 
     def add_manager(self, manager):
         """
@@ -59,15 +76,84 @@ class Runner(object):
                 continue
             elif state == self.selector.ERROR:
                 raise Exception("Received error from select")
+            self.process_window()
+
+    def process_window(self):
+        """ Collect events of one coalescing window, run the handlers and commit the changes """
+        events, received, coalesced = self.collect_events()
+        for (db, table_name, key), ops in events.items():
+            for op, fvs in ops:
+                for callback in self.callbacks[db][table_name]:
+                    callback(key, op, fvs)
+        start = time.monotonic()
+        rc = self.cfg_manager.commit()
+        commit_duration = time.monotonic() - start
+        if not rc:
+            log_crit("Runner::commit was unsuccessful")
+        self.update_stats(received, coalesced, commit_duration)
 
+    def collect_events(self):
+        """
+        Read events from the subscribers until the window is closed.
+        The window is opened by the first event and closed max_delay milliseconds later, a hard
+        deadline which new events do not extend, or earlier when the window has max_batch distinct keys.
+        Events for the same key are merged: the last 'SET' wins, 'DEL' cancels all previous events.
+        'DEL' followed by 'SET' is kept as both events, so the handlers see the entry recreated
+        :return: a tuple: ordered dictionary (db, table, key) -> list of (op, fvs), number of received events, number of merged events
+        """
+        events = {}
+        received = 0
+        coalesced = 0
+        deadline = time.monotonic() + self.max_delay / 1000.0
+        while True:
             for subscriber in self.subscribers:
+                db = subscriber.getDbConnector().getDbId()
+                table_name = subscriber.getTableName()
                 while True:
                     key, op, fvs = subscriber.pop()
                     if not key:
                         break
                     log_debug("Received message : '%s'" % str((key, op, fvs)))
-                    for callback in self.callbacks[subscriber.getDbConnector().getDbId()][subscriber.getTableName()]:
-                        callback(key, op, dict(fvs))
-            rc = self.cfg_manager.commit()
-            if not rc:
-                log_crit("Runner::commit was unsuccessful")
+                    received += 1
+                    event = (op, dict(fvs))
+                    ops = events.get((db, table_name, key))
+                    if ops is None:
+                        events[(db, table_name, key)] = [event]
+                        continue
+                    coalesced += 1
+                    if op == swsscommon.SET_COMMAND and ops[0][0] == swsscommon.DEL_COMMAND:
+                        events[(db, table_name, key)] = [ops[0], event]
+                    else:
+                        events[(db, table_name, key)] = [event]
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or len(events) >= self.max_batch:
+                break
+            state, _ = self.selector.select(int(remaining * 1000))
+            if state == self.selector.TIMEOUT:
+                break
+            elif state == self.selector.ERROR:
+                raise Exception("Received error from select")
+        return events, received, coalesced
+
+    def update_stats(self, received, coalesced, commit_duration):
+        """
+        Export metrics of the last window to STATE_DB
+        :param received: number of events received in the window
+        :param coalesced: number of events merged in the window
+        :param commit_duration: duration of the commit in seconds
+        """
+        self.stats['windows'] += 1
+        self.stats['events'] += received
+        self.stats['coalesced'] += coalesced
+        log_debug("Runner: window events=%d coalesced=%d commit_duration=%.3fs" % (received, coalesced, commit_duration))
+        if self.stats_table is None:
+            return
+        fvs = swsscommon.FieldValuePairs([
+            ('events', str(received)),
+            ('coalesced', str(coalesced)),
+            ('commit_duration_ms', str(int(commit_duration * 1000))),
+            ('total_windows', str(self.stats['windows'])),
+            ('total_events', str(self.stats['events'])),
+            ('total_coalesced', str(self.stats['coalesced'])),
+        ])
+        self.stats_table.set(self.STATS_KEY, fvs)
@@ -1,5 +1,6 @@
 from .log import log_err, log_info, log_debug
 from swsscommon import swsscommon
+import heapq
 import time
 
 class StaticRouteTimer(object):
@@ -9,11 +10,16 @@ class StaticRouteTimer(object):
         self.db.connect(self.db.APPL_DB)
         self.timer = None
         self.start = None
+        self.pipe = None
+        self.routes = {}        # key -> [deadline, refresh], routes which can expire
+        self.expiry_heap = []   # (deadline, key), entries which don't match self.routes are stale
 
     DEFAULT_TIMER = 180
     DEFAULT_SLEEP = 60
     # keep same range as value defined in sonic-restapi/sonic_api.yaml
     MAX_TIMER     = 172800
+    TABLE_NAME = "STATIC_ROUTE"
+    PIPE_BATCH_MAX_COUNT = 1000
 
     def set_timer(self):
         """ Check for custom route expiry time in STATIC_ROUTE_EXPIRY_TIME """
@@ -27,34 +33,120 @@ class StaticRouteTimer(object):
                 log_err("Custom static route expiry time of {}s is invalid!".format(timer))
         return
 
-    def alarm(self):
-        """ Clear unrefreshed static routes """
-        static_routes = self.db.keys(self.db.APPL_DB, "STATIC_ROUTE:*")
-        if static_routes is not None:
-            for sr in static_routes:
-                expiry = self.db.get(self.db.APPL_DB, sr, "expiry")
-                if expiry == "false":
-                    continue
-                refresh = self.db.get(self.db.APPL_DB, sr, "refresh")
-                if refresh == "true":
-                    self.db.set(self.db.APPL_DB, sr, "refresh", "false")
-                    log_debug("Refresh status of static route {} is set to false".format(sr))
-                else:
-                    self.db.delete(self.db.APPL_DB, sr)
-                    log_debug("Static route {} deleted".format(sr))
-        self.start = time.time()
+    def get_expiry_period(self):
+        """ Time after which a route is deleted if it was not refreshed """
+        return self.timer if self.timer else self.DEFAULT_TIMER
+
+    def schedule(self, key, deadline):
+        """
+        Put the route into the expiry index
+        :param key: route key in STATIC_ROUTE table
+        :param deadline: time when the refresh status of the route is checked
+        """
+        self.routes[key][0] = deadline
+        heapq.heappush(self.expiry_heap, (deadline, key))
+
+    def on_route_update(self, key, op, fvs, now):
+        """
+        Update the expiry index on a STATIC_ROUTE update
+        :param key: route key in STATIC_ROUTE table
+        :param op: operation, SET or DEL
+        :param fvs: route fields
+        :param now: current time
+        """
+        if op != swsscommon.SET_COMMAND:
+            self.routes.pop(key, None)
+            return
+        data = dict(fvs)
+        if data.get("expiry") == "false":
+            self.routes.pop(key, None)
+            return
+        if key not in self.routes:
+            self.routes[key] = [None, data.get("refresh")]
+            self.schedule(key, now + self.get_expiry_period())
+        else:
+            self.routes[key][1] = data.get("refresh")
+
+    def alarm(self, now=None):
+        """ Clear unrefreshed static routes which reached their deadline """
+        if now is None:
+            now = time.time()
+        data = {}
+        while self.expiry_heap and self.expiry_heap[0][0] <= now:
+            deadline, key = heapq.heappop(self.expiry_heap)
+            route = self.routes.get(key)
+            if route is None or route[0] != deadline:
+                continue # stale entry, the route was removed or rescheduled
+            sr = "{}:{}".format(self.TABLE_NAME, key)
+            if route[1] == "true":
+                data[sr] = {"refresh": "false"}
+                route[1] = "false"
+                self.schedule(key, now + self.get_expiry_period())
+                log_debug("Refresh status of static route {} is set to false".format(sr))
+            else:
+                data[sr] = None
+                del self.routes[key]
+                log_debug("Static route {} deleted".format(sr))
+            if len(data) >= self.PIPE_BATCH_MAX_COUNT:
+                self.flush_pipe(data)
+        if data:
+            self.flush_pipe(data)
+        self.start = now
         return
 
+    def flush_pipe(self, data):
+        """
+        Write the refresh status updates and route deletions through the redis pipeline.
+        The data{} is cleared when written
+        :param data: {'STATIC_ROUTE:key': {'refresh': 'false'} or None to delete the route}
+        """
+        for key, value in data.items():
+            command = swsscommon.RedisCommand()
+            if value is None:
+                command.formatDEL(key)
+            else:
+                command.formatHSET(key, value)
+            self.pipe.push(command)
+        self.pipe.flush()
+        data.clear()
+
+    def get_select_timeout(self, now, next_timer_check):
+        """ Time in milliseconds until the next route deadline or timer check """
+        wakeup = next_timer_check
+        if self.expiry_heap:
+            wakeup = min(wakeup, self.expiry_heap[0][0])
+        return max(int((wakeup - now) * 1000), 0)
+
     def run(self):
+        """
+        Main loop. The expiry index is populated from the STATIC_ROUTE updates,
+        the subscriber reads the existing routes on creation.
+        Each wakeup only touches the routes which reached their deadline
+        """
         self.start = time.time()
+        conn = self.db.get_redis_client(self.db.APPL_DB)
+        self.pipe = swsscommon.RedisPipeline(conn)
+        sel = swsscommon.Select()
+        sst = swsscommon.SubscriberStateTable(conn, self.TABLE_NAME)
+        sel.addSelectable(sst)
+        next_timer_check = self.start
         while True:
-            self.set_timer()
-            if self.timer:
-                log_info("Static route expiry set to {}s".format(self.timer))
-                time.sleep(self.timer)
-                self.alarm()
-            else:
-                time.sleep(self.DEFAULT_SLEEP)
-                if time.time() - self.start >= self.DEFAULT_TIMER:
-                    self.alarm()
-
+            now = time.time()
+            if now >= next_timer_check:
+                timer = self.timer
+                self.set_timer()
+                if self.timer != timer:
+                    log_info("Static route expiry set to {}s".format(self.timer))
+                next_timer_check = now + self.DEFAULT_SLEEP
+            state, _ = sel.select(self.get_select_timeout(now, next_timer_check))
+            if state == sel.ERROR:
+                log_err("Received error from select")
+                continue
+            now = time.time()
+            if state == sel.OBJECT:
+                while True:
+                    key, op, fvs = sst.pop()
+                    if not key:
+                        break
+                    self.on_route_update(key, op, fvs, now)
+            self.alarm(now)
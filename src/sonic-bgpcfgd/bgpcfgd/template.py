@@ -5,14 +5,38 @@ import jinja2
 import netaddr
 import os
 
-from .log import log_err
+from .log import log_err, log_info
+
+JINJA2_BYTECODE_CACHE_DIR = '/var/cache/sonic/jinja'
+
+
+class TemplateBytecodeCache(jinja2.FileSystemBytecodeCache):
+    """ Jinja2 bytecode cache which counts cache hits and misses """
+    def __init__(self, directory):
+        super().__init__(directory, 'bgpcfgd-%s.cache')
+        self.hits = 0
+        self.misses = 0
+
+    def load_bytecode(self, bucket):
+        super().load_bytecode(bucket)
+        if bucket.code is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
 
 class TemplateFabric(object):
     """ Fabric for rendering jinja2 templates """
-    def __init__(self, template_path = '/usr/share/sonic/templates'):
+    def __init__(self, template_path = '/usr/share/sonic/templates', cache_path = JINJA2_BYTECODE_CACHE_DIR):
+        self.template_path = template_path
+        # The bytecode cache is used only when the cache directory was created by the precompile step
+        if cache_path is not None and os.path.isdir(cache_path) and os.access(cache_path, os.W_OK):
+            self.bytecode_cache = TemplateBytecodeCache(cache_path)
+        else:
+            self.bytecode_cache = None
         j2_template_paths = [template_path]
         j2_loader = jinja2.FileSystemLoader(j2_template_paths)
-        j2_env = jinja2.Environment(loader=j2_loader, trim_blocks=False)
+        j2_env = jinja2.Environment(loader=j2_loader, trim_blocks=False, bytecode_cache=self.bytecode_cache)
         j2_env.filters['ipv4'] = self.is_ipv4
         j2_env.filters['ipv6'] = self.is_ipv6
         j2_env.filters['pfx_filter'] = self.pfx_filter
@@ -37,6 +61,23 @@ class TemplateFabric(object):
         """
         return self.env.from_string(tmpl)
 
+    def precompile(self):
+        """
+        Compile all templates under the template path into the bytecode cache
+        :return: a tuple with the number of compiled and failed templates
+        """
+        compiled = failed = 0
+        for name in self.env.list_templates(filter_func=lambda name: name.endswith('.j2')):
+            try:
+                self.env.get_template(name)
+                compiled += 1
+            except jinja2.exceptions.TemplateError as e:
+                log_err("Can't compile template '%s': %s" % (name, str(e)))
+                failed += 1
+        if self.bytecode_cache is not None:
+            log_info("Template bytecode cache: %d hits, %d misses" % (self.bytecode_cache.hits, self.bytecode_cache.misses))
+        return compiled, failed
+
     @staticmethod
     def is_ipv4(value):
         """ Return True if the value is an ipv4 address """
@@ -11,12 +11,14 @@ Description: bgpmon.py -- populating bgp related information in stateDB.
     BGP related items that needs to be updated in a periodic manner in the
     future, then more can be added into this process.
 
-    The script check if there are any bgp activities by monitoring the bgp
-    frr.log file timestamp.  If activity is detected, then it will request bgp
-    neighbor state via vtysh cli interface. This bgp activity monitoring is
-    done periodically (every 15 second). When triggered, it looks specifically
-    for the neighbor state in the json output of show ip bgp neighbors json
-    and update the state DB for each neighbor accordingly.
+    The script follows the lines appended to the bgp frr.log file. A neighbor
+    state change logged by bgpd (%ADJCHANGE) triggers a request of the bgp
+    neighbor state right away, within a fraction of a second. Any other
+    activity in the log triggers the request at most every 15 seconds.
+    The request goes through a persistent connection to the bgpd vty socket.
+    When triggered, it looks specifically for the neighbor state in the json
+    output of show bgp summary json and update the state DB for each neighbor
+    whose state changed.
     In order to not disturb and hold on to the State DB access too long and
     removal of the stale neighbors (neighbors that was there previously on
     previous get request but no longer there in the current get request), a
@@ -30,9 +32,14 @@ import sys
 import syslog
 from swsscommon import swsscommon
 import time
-from sonic_py_common.general import getstatusoutput_noshell
+from bgpcfgd.frr import vtysh_exec
 
 PIPE_BATCH_MAX_COUNT = 50
+FRR_LOG_FILE = "/var/log/frr/frr.log"
+POLL_INTERVAL = 0.2         # seconds between checks of the frr log
+REFRESH_INTERVAL = 15       # min seconds between requests triggered by other log activity
+NEIGHBOR_CHANGE_TAG = b"%ADJCHANGE"
+MAX_LOG_READ = 1024 * 1024  # max bytes of the log read at once
 
 class BgpStateGet:
     def __init__(self):
@@ -44,45 +51,79 @@ class BgpStateGet:
         self.peer_state = {}
         self.new_peer_l = set()
         self.new_peer_state = {}
-        self.cached_timestamp = 0
+        self.log_fd = None
+        self.log_inode = None
         self.db = swsscommon.SonicV2Connector()
         self.db.connect(self.db.STATE_DB, False)
         self.pipe = swsscommon.RedisPipeline(self.db.get_redis_client(self.db.STATE_DB))
         self.db.delete_all_by_pattern(self.db.STATE_DB, "NEIGH_STATE_TABLE|*" )
         self.MAX_RETRY_ATTEMPTS = 3
 
-    # A quick way to check if there are anything happening within BGP is to
-    # check its log file has any activities. This is by checking its modified
-    # timestamp against the cached timestamp that we keep and if there is a
-    # difference, there is activity detected. In case the log file got wiped
-    # out, it will default back to constant pulling every 15 seconds
-    def bgp_activity_detected(self):
+    # Follow the lines appended to the frr log since the previous check and look
+    # for neighbor state changes logged by bgpd. The log is kept open, when it is
+    # rotated the rest of the rotated file is read before the new log is read from
+    # the beginning. When it is truncated it is read from the beginning. In case
+    # the log file got wiped out, it reports activity on every check.
+    def check_frr_log(self):
+        """Check the frr log for the bgp activity.
+        Returns:
+            (activity, neighbor_change): new lines in the log, neighbor state change in the new lines
+        """
         try:
-            timestamp = os.stat("/var/log/frr/frr.log").st_mtime
-            if timestamp != self.cached_timestamp:
-                self.cached_timestamp = timestamp
-                return True
-            else:
-                return False
+            try:
+                st = os.stat(FRR_LOG_FILE)
+            except FileNotFoundError:
+                st = None
+            rotated_data = b''
+            if self.log_fd is not None and (st is None or st.st_ino != self.log_inode):
+                rotated_data = self.log_fd.read(MAX_LOG_READ + 1)
+                self.log_fd.close()
+                self.log_fd = None
+            # too much to read, assume a neighbor changed
+            rotated_change = NEIGHBOR_CHANGE_TAG in rotated_data or len(rotated_data) > MAX_LOG_READ
+            if st is None:
+                return True, rotated_change
+            if self.log_fd is None:
+                self.log_fd = open(FRR_LOG_FILE, 'rb')
+                if self.log_inode is None:
+                    # first check, skip the history
+                    self.log_inode = os.fstat(self.log_fd.fileno()).st_ino
+                    self.log_fd.seek(0, os.SEEK_END)
+                    return True, False
+                self.log_inode = os.fstat(self.log_fd.fileno()).st_ino
+            size = os.fstat(self.log_fd.fileno()).st_size
+            if size < self.log_fd.tell():
+                self.log_fd.seek(0)
+            if size - self.log_fd.tell() > MAX_LOG_READ:
+                self.log_fd.seek(0, os.SEEK_END)
+                return True, True
+            data = self.log_fd.read(size - self.log_fd.tell())
+            if not data:
+                return bool(rotated_data), rotated_change
+            # keep an incomplete last line for the next check
+            end = data.rfind(b'\n') + 1
+            if end < len(data):
+                self.log_fd.seek(end - len(data), os.SEEK_CUR)
+            return True, rotated_change or NEIGHBOR_CHANGE_TAG in data[:end]
         except (IOError, OSError):
-            return True
+            return True, False
 
     def update_new_peer_states(self, peer_dict):
         peer_l = peer_dict["peers"].keys()
         self.new_peer_l.update(peer_l)
         for peer in peer_l:
-            self.new_peer_state[peer] = (peer_dict["peers"][peer]["state"], 
-                                         peer_dict["peers"][peer]["remoteAs"],
-                                         peer_dict["peers"][peer]["localAs"])
+            peerType = "i-BGP" if peer_dict["peers"][peer]["remoteAs"] == peer_dict["peers"][peer]["localAs"] else "e-BGP"
+            self.new_peer_state[peer] = (peer_dict["peers"][peer]["state"], peerType)
 
     # Get a new snapshot of BGP neighbors and store them in the "new" location
     def get_all_neigh_states(self):
-        cmd = ["vtysh", "-H", "/dev/null",  "-c", 'show bgp summary json']
+        cmd = 'show bgp summary json'
         retry_attempt = 0
+        output = ""
 
         while retry_attempt < self.MAX_RETRY_ATTEMPTS:
             try:
-                rc, output = getstatusoutput_noshell(cmd)
+                rc, output, _ = vtysh_exec([cmd])[0]
                 if rc:
                     syslog.syslog(syslog.LOG_ERR, "*ERROR* Failed with rc:{} when execute: {}".format(rc, cmd))
                     return
@@ -153,21 +194,19 @@ class BgpStateGet:
         for peer in self.new_peer_l:
             key = "NEIGH_STATE_TABLE|%s" % peer
             if peer in self.peer_l:
-                # only update the entry if state changed
-                if self.peer_state[peer] != self.new_peer_state[peer][0]:
+                # only update the entry if state or peer type changed
+                if self.peer_state[peer] != self.new_peer_state[peer]:
                     # state changed. Update state DB for this entry
-                    state = self.new_peer_state[peer][0]
-                    peerType = "i-BGP" if self.new_peer_state[peer][1] == self.new_peer_state[peer][2] else "e-BGP"
+                    state, peerType = self.new_peer_state[peer]
                     data[key] = {'state':state, 'peerType':peerType}
-                    self.peer_state[peer] = state
+                    self.peer_state[peer] = self.new_peer_state[peer]
                 # remove this neighbor from old set since it is accounted for
                 self.peer_l.remove(peer)
             else:
                 # New neighbor found case. Add to dictionary and state DB
-                state = self.new_peer_state[peer][0]
-                peerType = "i-BGP" if self.new_peer_state[peer][1] == self.new_peer_state[peer][2] else "e-BGP"
+                state, peerType = self.new_peer_state[peer]
                 data[key] = {'state':state, 'peerType':peerType}
-                self.peer_state[peer] = state
+                self.peer_state[peer] = self.new_peer_state[peer]
             if len(data) > PIPE_BATCH_MAX_COUNT:
                 self.flush_pipe(data)
         # Check for stale state entries to be cleaned up
@@ -195,12 +234,20 @@ def main():
         syslog.syslog(syslog.LOG_ERR, "{}: error exit 1, reason {}".format("THIS_MODULE", str(e)))
         sys.exit(1)
 
-    # periodically obtain the new neighbor information and update if necessary
+    # obtain the new neighbor information on a neighbor change logged by bgpd,
+    # or periodically on other bgp activity, and update if necessary
+    activity_pending = False
+    last_update = 0
     while True:
-        time.sleep(15)
-        if bgp_state_get.bgp_activity_detected():
+        time.sleep(POLL_INTERVAL)
+        activity, neighbor_change = bgp_state_get.check_frr_log()
+        activity_pending = activity_pending or activity
+        now = time.monotonic()
+        if neighbor_change or (activity_pending and now - last_update >= REFRESH_INTERVAL):
             bgp_state_get.get_all_neigh_states()
             bgp_state_get.update_neigh_states()
+            activity_pending = False
+            last_update = now
 
 if __name__ == '__main__':
     main()
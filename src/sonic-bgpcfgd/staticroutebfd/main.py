@@ -3,6 +3,7 @@ import signal
 import sys
 import syslog
 import threading
+import time
 import traceback
 from collections import defaultdict
 from ipaddress import IPv4Address, IPv6Address
@@ -245,47 +246,97 @@ class StaticRouteBfd(object):
     def strip_table_name(self, key, splitter):
         return key.split(splitter, 1)[1]
 
+    def load_config_db_tables(self, tables):
+        """
+        Read CONFIG_DB tables, only the given tables are read rather than the whole database
+        :param tables: list of table names
+        :return: dictionary table -> key -> data
+        """
+        config_db = swsscommon.ConfigDBConnector()
+        config_db.connect(False)
+        result = {}
+        for table in tables:
+            entries = {}
+            for key, data in config_db.get_table(table).items():
+                if isinstance(key, tuple):
+                    key = "|".join(key)
+                entries[key] = data
+            result[table] = entries
+        return result
+
+    def load_table(self, db, db_id, table, splitter):
+        """
+        Read a table of APPL_DB or STATE_DB through SonicV2Connector
+        :param db: connected SonicV2Connector
+        :param db_id: database of the table
+        :param table: table name
+        :param splitter: separator of table name and key
+        :return: dictionary key -> data
+        """
+        entries = {}
+        keys = db.keys(db_id, table + splitter + "*")
+        if keys:
+            for key in keys:
+                entries[self.strip_table_name(key, splitter)] = db.get_all(db_id, key)
+        return entries
+
     def reconciliation(self):
+        start = time.time()
+        config = self.load_config_db_tables(["LOOPBACK_INTERFACE", INTERFACE_TABLE_NAME,
+                                             PORTCHANNEL_INTERFACE_TABLE_NAME, STATIC_ROUTE_TABLE_NAME])
+
         #to use SonicV2Connector get_all method, DBConnector doesn't have get_all
         db = swsscommon.SonicV2Connector()
-        db.connect(db.CONFIG_DB)
         db.connect(db.APPL_DB)
         db.connect(db.STATE_DB)
 
+        #APPL_DB entries created during reconciliation are written in one pipeline
+        appl_pipe = swsscommon.RedisPipeline(self.appl_db)
+        bfd_appl_tbl, static_route_appl_tbl = self.bfd_appl_tbl, self.static_route_appl_tbl
+        self.bfd_appl_tbl = swsscommon.ProducerStateTable(appl_pipe, BFD_SESSION_TABLE_NAME, True)
+        self.static_route_appl_tbl = swsscommon.Table(appl_pipe, STATIC_ROUTE_TABLE_NAME, True)
+        try:
+            counts = self.reconcile_tables(db, config)
+        except Exception as e:
+            log_err("SRT_BFD: reconciliation failed: %s" % str(e))
+            raise
+        finally:
+            #local tables hold the entries restored before a failure, write them to APPL_DB as well
+            self.bfd_appl_tbl, self.static_route_appl_tbl = bfd_appl_tbl, static_route_appl_tbl
+            appl_pipe.flush()
+
+        log_notice("SRT_BFD: reconciliation done in %.3fs, interfaces %d, bfd sessions %d, static routes %d, bfd states %d"
+                   % (time.time() - start, counts[0], counts[1], counts[2], counts[3]))
+
+    def reconcile_tables(self, db, config):
+        """
+        Restore local tables from the databases
+        :param db: SonicV2Connector connected to APPL_DB and STATE_DB
+        :param config: CONFIG_DB tables, see load_config_db_tables()
+        :return: number of restored interfaces, bfd sessions, static routes and bfd states
+        """
         #MUST keep the restore sequene
         #restore interface(loopback/interface/portchannel_interface) tables
 
         #restore interface tables
         log_info("restore interface table -->")
-        keys = db.keys(db.CONFIG_DB, "LOOPBACK_INTERFACE|*")
-        for key in keys:
-            key_new = self.strip_table_name(key, "|")
-            self.interface_set_handler(key_new, "")
-        keys = db.keys(db.CONFIG_DB, "INTERFACE|*")
-        for key in keys:
-            key_new = self.strip_table_name(key, "|")
-            self.interface_set_handler(key_new, "")
-        keys = db.keys(db.CONFIG_DB, "PORTCHANNEL_INTERFACE|*")
-        for key in keys:
-            key_new = self.strip_table_name(key, "|")
-            self.interface_set_handler(key_new, "")
+        interfaces = 0
+        for table in ["LOOPBACK_INTERFACE", INTERFACE_TABLE_NAME, PORTCHANNEL_INTERFACE_TABLE_NAME]:
+            for key in config[table]:
+                self.interface_set_handler(key, "")
+            interfaces += len(config[table])
 
         #restore bfd session table, static route won't create bfd session if it is already in appl_db
         log_info("restore bfd session table -->")
-        keys = db.keys(db.APPL_DB, "BFD_SESSION_TABLE:*")
-        for key in keys:
-            data = db.get_all(db.APPL_DB, key)
-            key_new = self.strip_table_name(key, ":")
-            self.set_local_db(LOCAL_BFD_TABLE, key_new, data)
+        bfd_sessions = self.load_table(db, db.APPL_DB, BFD_SESSION_TABLE_NAME, ":")
+        for key, data in bfd_sessions.items():
+            self.set_local_db(LOCAL_BFD_TABLE, key, data)
 
         #restore static route table
         log_info("restore static route table -->")
-        keys = db.keys(db.CONFIG_DB, "STATIC_ROUTE|*")
-        for key in keys:
-            data = db.get_all(db.CONFIG_DB, key)
-            key_new = self.strip_table_name(key, "|")
+        for key, data in config[STATIC_ROUTE_TABLE_NAME].items():
             log_debug("SRT_BFD: restore static route from config_db, key %s, data %s"%(key, str(data)))
-            self.static_route_set_handler(key_new, data)
+            self.static_route_set_handler(key, data)
 
         #clean up local bfd table, remove non static route bfd session
         log_info("cleanup bfd session table -->")
@@ -293,11 +344,11 @@ class StaticRouteBfd(object):
 
         #restore bfd state table
         log_info("restore bfd state table -->")
-        keys = db.keys(db.STATE_DB, "BFD_SESSION_TABLE|*")
-        for key in keys:
-            data = db.get_all(db.STATE_DB, key)
-            key_new = self.strip_table_name(key, "|")
-            self.bfd_state_set_handler(key_new, data)
+        bfd_states = self.load_table(db, db.STATE_DB, BFD_SESSION_TABLE_NAME, "|")
+        for key, data in bfd_states.items():
+            self.bfd_state_set_handler(key, data)
+
+        return interfaces, len(bfd_sessions), len(config[STATIC_ROUTE_TABLE_NAME]), len(bfd_states)
 
     def cleanup_local_bfd_table(self):
         kl=[]
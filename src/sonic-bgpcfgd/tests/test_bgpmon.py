@@ -0,0 +1,86 @@
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+from bgpmon import bgpmon
+
+
+def summary(peers):
+    """ Render 'show bgp summary json' output of a fake FRR """
+    return json.dumps({
+        "ipv4Unicast": {
+            "peers": {peer: {"state": state, "remoteAs": remote_as, "localAs": 65100}
+                      for peer, (state, remote_as) in peers.items()}
+        }
+    })
+
+@patch('swsscommon.swsscommon.RedisPipeline')
+@patch('swsscommon.swsscommon.SonicV2Connector')
+def constructor(mock_conn, mock_pipe):
+    bgp_state_get = bgpmon.BgpStateGet()
+    bgp_state_get.pipe = MagicMock()
+    return bgp_state_get
+
+@patch('swsscommon.swsscommon.RedisCommand')
+def test_peer_flaps_replay(mock_cmd):
+    # replay of the fake FRR answers while the peers flap
+    replay = [
+        {"10.0.0.1": ("Established", 65200), "10.0.0.2": ("Established", 65100)},
+        {"10.0.0.1": ("Active", 65200), "10.0.0.2": ("Established", 65100)},
+        {"10.0.0.1": ("Active", 65200), "10.0.0.2": ("Established", 65100)},
+        {"10.0.0.1": ("Established", 65200), "10.0.0.2": ("Established", 65300)},
+        {"10.0.0.1": ("Established", 65200)},
+    ]
+    expected = [
+        {"NEIGH_STATE_TABLE|10.0.0.1": {"state": "Established", "peerType": "e-BGP"},
+         "NEIGH_STATE_TABLE|10.0.0.2": {"state": "Established", "peerType": "i-BGP"}},
+        {"NEIGH_STATE_TABLE|10.0.0.1": {"state": "Active", "peerType": "e-BGP"}},
+        {},
+        {"NEIGH_STATE_TABLE|10.0.0.1": {"state": "Established", "peerType": "e-BGP"},
+         "NEIGH_STATE_TABLE|10.0.0.2": {"state": "Established", "peerType": "e-BGP"}},
+        {"NEIGH_STATE_TABLE|10.0.0.2": None},
+    ]
+    bgp_state_get = constructor()
+    commands = mock_cmd.return_value
+    for peers, writes in zip(replay, expected):
+        commands.reset_mock()
+        bgp_state_get.pipe.reset_mock()
+        with patch('bgpmon.bgpmon.vtysh_exec', return_value=[(0, summary(peers), "")]) as mock_exec:
+            bgp_state_get.get_all_neigh_states()
+            mock_exec.assert_called_once_with(['show bgp summary json'])
+        bgp_state_get.update_neigh_states()
+        hset = {c[0][0]: c[0][1] for c in commands.formatHSET.call_args_list}
+        dels = {c[0][0]: None for c in commands.formatDEL.call_args_list}
+        assert {**hset, **dels} == writes
+        assert bgp_state_get.pipe.push.call_count == len(writes)
+
+def test_check_frr_log(tmpdir):
+    log = tmpdir.join("frr.log")
+    log.write("bgpd[41]: Configuration Read in Took: 00:00:00\n")
+    bgp_state_get = constructor()
+    with patch('bgpmon.bgpmon.FRR_LOG_FILE', str(log)):
+        # history is skipped on the first check
+        assert bgp_state_get.check_frr_log() == (True, False)
+        assert bgp_state_get.check_frr_log() == (False, False)
+        log.write("bgpd[41]: [M59KS-A3ZXZ] bgp_update_receive: rcvd End-of-RIB\n", mode="a")
+        assert bgp_state_get.check_frr_log() == (True, False)
+        # incomplete line is read on the next check
+        log.write("bgpd[41]: [M59KS-A3ZXZ] %ADJCHANGE: neighbor 10.0.0.1", mode="a")
+        assert bgp_state_get.check_frr_log() == (True, False)
+        log.write(" in vrf default Down Peer closed the session\n", mode="a")
+        assert bgp_state_get.check_frr_log() == (True, True)
+        assert bgp_state_get.check_frr_log() == (False, False)
+        # rotated log is read from the beginning
+        os.remove(str(log))
+        assert bgp_state_get.check_frr_log() == (True, False)
+        log.write("bgpd[41]: %ADJCHANGE: neighbor 10.0.0.1 in vrf default Up\n")
+        assert bgp_state_get.check_frr_log() == (True, True)
+        # lines written to the rotated log before the rotation are not lost
+        log.write("bgpd[41]: %ADJCHANGE: neighbor 10.0.0.1 in vrf default Down\n", mode="a")
+        os.rename(str(log), str(log) + ".1")
+        log.write("bgpd[41]: [M59KS-A3ZXZ] bgp_update_receive: rcvd End-of-RIB\n")
+        assert bgp_state_get.check_frr_log() == (True, True)
+        assert bgp_state_get.check_frr_log() == (False, False)
+        # truncated log is read from the beginning
+        log.write("bgpd[41]: %ADJCHANGE: neighbor 10.0.0.1 in vrf default Up\n")
+        assert bgp_state_get.check_frr_log() == (True, True)
@@ -67,6 +67,8 @@ def test_restart_peer_groups():
     assert c.peer_groups_to_restart == ["pg_1", "pg_2"]
     c.restart_peer_groups(["pg_3", "pg_4"])
     assert c.peer_groups_to_restart == ["pg_1", "pg_2", "pg_3", "pg_4"]
+    c.restart_peer_groups(["pg_2", "pg_4"])
+    assert c.peer_groups_to_restart == ["pg_1", "pg_2", "pg_3", "pg_4"]
 
 def test_commit_empty_changes():
     frr = MagicMock()
@@ -115,6 +117,63 @@ def test_restart_get_text():
     c.update()
     assert c.get_text() == [' text1', ' text2', ' text3', ' text4', '    ', '     ']
 
+def test_update_snapshot_is_reused_until_commit():
+    frr = MagicMock()
+    frr.get_config = MagicMock(return_value = " text1\n")
+    frr.write = MagicMock(return_value = True)
+    frr.restart_peer_groups = MagicMock(return_value = True)
+    c = ConfigMgr(frr)
+    c.update()
+    c.update()
+    assert frr.get_config.call_count == 1
+    index = c.get_index()
+    assert c.get_index() is index
+    c.push("change1")
+    c.update()
+    assert frr.get_config.call_count == 1
+    assert c.commit()
+    assert c.current_config_raw is None
+    c.update()
+    assert frr.get_config.call_count == 2
+    assert c.get_index() is not index
+    # commit without changes still drops the snapshot
+    assert c.commit()
+    c.update()
+    assert frr.get_config.call_count == 3
+
+def test_config_index():
+    frr = MagicMock()
+    frr.get_config = MagicMock(return_value = """!
+ip prefix-list PL_1 seq 10 deny 0.0.0.0/0 le 17
+ip prefix-list PL_1 seq 20 permit 10.0.0.0/8 le 32
+ipv6 prefix-list PL_1 seq 10 deny ::/0 le 59
+bgp community-list standard COMMUNITY_1 permit 1010:2020
+route-map FROM_PEER permit 100
+ match ip address prefix-list PL_1
+ call ALLOW_LIST_DEPLOYMENT_ID_0_V4
+route-map ALLOW_LIST_DEPLOYMENT_ID_0_V4 permit 65535
+ set community 123:123 additive
+router bgp 65100
+ neighbor PEER_V4 peer-group
+ neighbor PEER_V6 peer-group
+ address-family ipv4
+  neighbor PEER_V4 route-map FROM_PEER in
+  neighbor PEER_V4 route-map TO_PEER out
+""")
+    c = ConfigMgr(frr)
+    c.update()
+    index = c.get_index()
+    assert index.peer_groups == ['PEER_V4', 'PEER_V6']
+    assert index.neighbor_route_map_in == {'PEER_V4': 'FROM_PEER'}
+    assert index.route_map_calls == {'FROM_PEER': 'ALLOW_LIST_DEPLOYMENT_ID_0_V4'}
+    assert index.prefix_lists[('ip', 'PL_1')] == [(10, 'deny 0.0.0.0/0 le 17'), (20, 'permit 10.0.0.0/8 le 32')]
+    assert index.prefix_lists[('ipv6', 'PL_1')] == [(10, 'deny ::/0 le 59')]
+    assert index.community_lists == {'COMMUNITY_1': '1010:2020'}
+    assert index.route_map_entries[('FROM_PEER', 'permit')] == {
+        100: ['match ip address prefix-list PL_1', 'call ALLOW_LIST_DEPLOYMENT_ID_0_V4']
+    }
+    assert index.route_map_entries[('ALLOW_LIST_DEPLOYMENT_ID_0_V4', 'permit')] == {65535: ['set community 123:123 additive']}
+
 def to_canonical_common(raw_text, expected_canonical):
     frr = MagicMock()
     c = ConfigMgr(frr)
@@ -1,4 +1,6 @@
 from unittest.mock import patch
+import socket
+import threading
 import bgpcfgd.frr
 import pytest
 
@@ -66,3 +68,49 @@ def test_restart_peer_groups_fail(mocked_log_crit):
     res = f.restart_peer_groups(["pg_1", "pg_2"])
     assert not res, "Expect False return value"
     mocked_log_crit.assert_called_with("Can't restart bgp peer-group 'pg_2'. rc='1', out='some output', err='some error'")
+
+def start_vty_server(path, replies):
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+    received = []
+    def serve():
+        conn, _ = server.accept()
+        buf = b''
+        while True:
+            data = conn.recv(4096)
+            if not data:
+                break
+            buf += data
+            while b'\0' in buf:
+                command, buf = buf.split(b'\0', 1)
+                command = command.decode()
+                received.append(command)
+                rc, out = replies.get(command, (0, ""))
+                conn.sendall(out.encode() + b'\0\0\0' + bytes([rc]))
+        conn.close()
+        server.close()
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    return received
+
+def test_vty_client_run(tmp_path):
+    received = start_vty_server(str(tmp_path / "bgpd.vty"), {
+        "show bgp vrfs json": (0, "{\"vrfs\": {}}"),
+        "clear bgp peer-group pg_1 soft in": (1, "% Unknown peer-group"),
+    })
+    client = bgpcfgd.frr.VtyClient("bgpd", str(tmp_path))
+    res = client.run(["show bgp vrfs json", "clear bgp peer-group pg_1 soft in"])
+    client.close()
+    assert res == [(0, "{\"vrfs\": {}}"), (1, "% Unknown peer-group")]
+    assert received == ["enable", "show bgp vrfs json", "clear bgp peer-group pg_1 soft in"]
+
+def test_vty_client_no_socket(tmp_path):
+    client = bgpcfgd.frr.VtyClient("bgpd", str(tmp_path))
+    assert client.run(["show bgp vrfs json"]) is None
+
+def test_vtysh_exec_fallback(tmp_path):
+    bgpcfgd.frr.run_command = lambda cmd: (0, str(cmd), "")
+    with patch.dict(bgpcfgd.frr.g_vty_clients, {"bgpd": bgpcfgd.frr.VtyClient("bgpd", str(tmp_path))}):
+        res = bgpcfgd.frr.vtysh_exec(["show bgp vrfs json"])
+    assert res == [(0, "['vtysh', '-c', 'show bgp vrfs json']", "")]
@@ -0,0 +1,101 @@
+from unittest.mock import MagicMock, patch
+
+from . import swsscommon_test
+
+with patch.dict("sys.modules", swsscommon=swsscommon_test):
+    from bgpcfgd.runner import Runner
+    import bgpcfgd.runner
+
+SET = swsscommon_test.swsscommon.SET_COMMAND
+DEL = swsscommon_test.swsscommon.DEL_COMMAND
+
+
+class FakeSubscriber(object):
+    def __init__(self, table_name, events):
+        self.table_name = table_name
+        self.events = list(events)
+
+    def pop(self):
+        if not self.events:
+            return "", "", ()
+        return self.events.pop(0)
+
+    def getDbConnector(self):
+        return MagicMock(getDbId=MagicMock(return_value=4))
+
+    def getTableName(self):
+        return self.table_name
+
+
+def constructor(events, max_delay=0, max_batch=1000, state_db_conn=None):
+    cfg_mgr = MagicMock()
+    cfg_mgr.commit.return_value = True
+    runner = Runner(cfg_mgr, max_delay=max_delay, max_batch=max_batch, state_db_conn=state_db_conn)
+    runner.selector = MagicMock(TIMEOUT=1, ERROR=2)
+    runner.selector.select.return_value = (1, None)
+    subscriber = FakeSubscriber("BGP_NEIGHBOR", events)
+    runner.subscribers.add(subscriber)
+    handler = MagicMock()
+    runner.callbacks[4]["BGP_NEIGHBOR"].append(handler)
+    return runner, handler
+
+def test_process_window_coalesce():
+    runner, handler = constructor([
+        ("10.0.0.1", SET, (("asn", "65001"),)),
+        ("10.0.0.2", SET, (("asn", "65002"),)),
+        ("10.0.0.1", SET, (("asn", "65003"),)),
+        ("10.0.0.2", DEL, ()),
+        ("10.0.0.3", DEL, ()),
+        ("10.0.0.3", SET, (("asn", "65004"),)),
+    ], max_delay=100)
+    runner.process_window()
+    assert [c.args for c in handler.call_args_list] == [
+        ("10.0.0.1", SET, {"asn": "65003"}),
+        ("10.0.0.2", DEL, {}),
+        ("10.0.0.3", DEL, {}),
+        ("10.0.0.3", SET, {"asn": "65004"}),
+    ]
+    runner.cfg_manager.commit.assert_called_once()
+    assert runner.stats == {'windows': 1, 'events': 6, 'coalesced': 3}
+
+def test_process_window_waits_for_events():
+    runner, handler = constructor([("10.0.0.1", SET, (("asn", "65001"),))], max_delay=1000)
+    subscriber = next(iter(runner.subscribers))
+    def select(timeout):
+        assert 0 < timeout <= 1000
+        if runner.selector.select.call_count == 1:
+            subscriber.events.append(("10.0.0.1", SET, (("asn", "65002"),)))
+            return 0, subscriber
+        return runner.selector.TIMEOUT, None
+    runner.selector.select.side_effect = select
+    runner.process_window()
+    handler.assert_called_once_with("10.0.0.1", SET, {"asn": "65002"})
+    runner.cfg_manager.commit.assert_called_once()
+    # The window is closed by the select timeout once no more events arrive
+    assert runner.selector.select.call_count == 2
+
+def test_process_window_max_batch():
+    runner, handler = constructor([("10.0.0.1", SET, ()), ("10.0.0.2", SET, ())], max_delay=1000, max_batch=2)
+    runner.process_window()
+    assert handler.call_count == 2
+    runner.selector.select.assert_not_called()
+
+@patch.object(bgpcfgd.runner, 'log_crit')
+def test_process_window_commit_fail(mocked_log_crit):
+    runner, handler = constructor([])
+    runner.cfg_manager.commit.return_value = False
+    runner.process_window()
+    handler.assert_not_called()
+    mocked_log_crit.assert_called_with("Runner::commit was unsuccessful")
+
+def test_process_window_stats():
+    state_db_conn = MagicMock()
+    runner, _ = constructor([("10.0.0.1", SET, ()), ("10.0.0.1", SET, ())], state_db_conn=state_db_conn)
+    runner.stats_table = MagicMock()
+    with patch.object(swsscommon_test.swsscommon, 'FieldValuePairs', side_effect=dict):
+        runner.process_window()
+    key, fvs = runner.stats_table.set.call_args.args
+    assert key == "window"
+    assert fvs["events"] == "2"
+    assert fvs["coalesced"] == "1"
+    assert fvs["total_windows"] == "1"
@@ -1,3 +1,4 @@
+import pytest
 from unittest.mock import patch
 #from unittest.mock import MagicMock, patch
 
@@ -750,3 +751,73 @@ def test_set_del_ifname_only_route():
 
     assert "Static route bfd set Failed, nexthop, interface and vrf lists do not match or some of them is empty."\
         in test_set_del_ifname_only_route.logs
+
+def test_reconciliation():
+    dut = constructor()
+    config = {
+        "LOOPBACK_INTERFACE": {"Loopback0": {}, ("Loopback0", "10.1.0.1/32"): {}},
+        "INTERFACE": {"if1": {}, ("if1", "192.168.1.1/24"): {}},
+        "PORTCHANNEL_INTERFACE": {},
+        "STATIC_ROUTE": {
+            "2.2.2.0/24": {"bfd": "true", "nexthop": "192.168.1.2", "ifname": "if1"},
+            ("vrf1", "3.3.3.0/24"): {"nexthop": "10.0.0.1"}
+        },
+    }
+    state_db = {"BFD_SESSION_TABLE|default|default|192.168.1.2": {"state": "Up"}}
+
+    with patch('swsscommon.swsscommon.ConfigDBConnector') as mock_cfg_db, \
+         patch('swsscommon.swsscommon.SonicV2Connector') as mock_v2, \
+         patch('swsscommon.swsscommon.RedisPipeline') as mock_pipe, \
+         patch('swsscommon.swsscommon.ProducerStateTable') as mock_producer, \
+         patch('swsscommon.swsscommon.Table') as mock_tbl, \
+         patch('staticroutebfd.main.log_notice') as mock_log:
+        mock_cfg_db.return_value.get_table.side_effect = lambda table: config[table]
+        v2 = mock_v2.return_value
+        v2.APPL_DB, v2.STATE_DB = "APPL_DB", "STATE_DB"
+        v2.keys.side_effect = lambda db, pattern: list(state_db.keys()) if db == "STATE_DB" else []
+        v2.get_all.side_effect = lambda db, key: state_db[key]
+        bfd_appl_tbl, static_route_appl_tbl = dut.bfd_appl_tbl, dut.static_route_appl_tbl
+
+        dut.reconciliation()
+
+        # only the needed CONFIG_DB tables are read
+        mock_cfg_db.return_value.get_config.assert_not_called()
+        tables = [c[0][0] for c in mock_cfg_db.return_value.get_table.call_args_list]
+        assert sorted(tables) == sorted(config.keys())
+        assert dut.get_local_db(LOCAL_INTERFACE_TABLE, "if1") == {True: "192.168.1.1"}
+        assert dut.get_local_db(LOCAL_INTERFACE_TABLE, "Loopback0") == {True: "10.1.0.1"}
+
+        # APPL_DB writes go through one buffered pipeline
+        mock_producer.assert_called_once_with(mock_pipe.return_value, BFD_SESSION_TABLE_NAME, True)
+        mock_tbl.assert_called_once_with(mock_pipe.return_value, STATIC_ROUTE_TABLE_NAME, True)
+        bfd_keys = [c[0][0] for c in mock_producer.return_value.set.call_args_list]
+        assert bfd_keys == ["default:default:192.168.1.2"]
+        srt_keys = [c[0][0] for c in mock_tbl.return_value.set.call_args_list]
+        assert srt_keys == ["default:2.2.2.0/24"]
+        mock_pipe.return_value.flush.assert_called_once()
+
+        # the tables are restored after reconciliation
+        assert dut.bfd_appl_tbl is bfd_appl_tbl
+        assert dut.static_route_appl_tbl is static_route_appl_tbl
+        assert "interfaces 4, bfd sessions 0, static routes 2, bfd states 1" in mock_log.call_args[0][0]
+
+def test_reconciliation_failure():
+    dut = constructor()
+    with patch('swsscommon.swsscommon.ConfigDBConnector') as mock_cfg_db, \
+         patch('swsscommon.swsscommon.SonicV2Connector'), \
+         patch('swsscommon.swsscommon.RedisPipeline') as mock_pipe, \
+         patch('swsscommon.swsscommon.ProducerStateTable'), \
+         patch('swsscommon.swsscommon.Table'), \
+         patch.object(dut, 'reconcile_tables', side_effect=RuntimeError("redis error")), \
+         patch('staticroutebfd.main.log_err') as mock_log:
+        mock_cfg_db.return_value.get_table.return_value = {}
+        bfd_appl_tbl, static_route_appl_tbl = dut.bfd_appl_tbl, dut.static_route_appl_tbl
+
+        with pytest.raises(RuntimeError):
+            dut.reconciliation()
+
+        # APPL_DB writes pushed before the failure are not dropped
+        mock_pipe.return_value.flush.assert_called_once()
+        mock_log.assert_called_once()
+        assert dut.bfd_appl_tbl is bfd_appl_tbl
+        assert dut.static_route_appl_tbl is static_route_appl_tbl
@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock, patch, call
+
+from swsscommon import swsscommon
+from bgpcfgd.static_rt_timer import StaticRouteTimer
+
+
+@patch('swsscommon.swsscommon.SonicV2Connector')
+def constructor(mock_conn):
+    timer = StaticRouteTimer()
+    timer.pipe = MagicMock()
+    return timer
+
+@patch('swsscommon.swsscommon.RedisCommand')
+@patch('swsscommon.swsscommon.SET_COMMAND', 'SET', create=True)
+def test_expiry_index(mock_cmd):
+    timer = constructor()
+    timer.timer = 10
+    timer.on_route_update("10.1.0.0/24", "SET", (("nexthop", "10.0.0.1"), ("refresh", "true")), 100)
+    timer.on_route_update("10.2.0.0/24", "SET", (("nexthop", "10.0.0.1"), ("refresh", "false")), 100)
+    timer.on_route_update("10.3.0.0/24", "SET", (("nexthop", "10.0.0.1"), ("expiry", "false")), 100)
+    timer.on_route_update("10.4.0.0/24", "SET", (("nexthop", "10.0.0.1"),), 105)
+    timer.on_route_update("10.5.0.0/24", "SET", (("nexthop", "10.0.0.1"),), 105)
+    timer.on_route_update("10.5.0.0/24", "DEL", (), 106)
+    assert set(timer.routes.keys()) == {"10.1.0.0/24", "10.2.0.0/24", "10.4.0.0/24"}
+
+    # nothing reached the deadline
+    timer.alarm(109)
+    timer.pipe.push.assert_not_called()
+
+    # only the routes of the first deadline are touched, in one pipeline flush
+    timer.alarm(110)
+    commands = mock_cmd.return_value
+    commands.formatHSET.assert_called_once_with("STATIC_ROUTE:10.1.0.0/24", {"refresh": "false"})
+    commands.formatDEL.assert_called_once_with("STATIC_ROUTE:10.2.0.0/24")
+    assert timer.pipe.push.call_count == 2
+    timer.pipe.flush.assert_called_once()
+    assert set(timer.routes.keys()) == {"10.1.0.0/24", "10.4.0.0/24"}
+
+    # refreshed route is rescheduled, our own refresh=false update doesn't move the deadline
+    timer.on_route_update("10.1.0.0/24", "SET", (("nexthop", "10.0.0.1"), ("refresh", "false")), 110)
+    commands.reset_mock()
+    timer.pipe.reset_mock()
+    timer.alarm(115)
+    commands.formatDEL.assert_called_once_with("STATIC_ROUTE:10.4.0.0/24")
+    timer.alarm(120)
+    commands.formatDEL.assert_called_with("STATIC_ROUTE:10.1.0.0/24")
+    assert timer.routes == {}
+    assert timer.pipe.flush.call_count == 2
+
+def test_select_timeout():
+    timer = constructor()
+    assert timer.get_select_timeout(100, 160) == 60000
+    timer.routes["10.1.0.0/24"] = [None, "true"]
+    timer.schedule("10.1.0.0/24", 110.5)
+    assert timer.get_select_timeout(100, 160) == 10500
+    assert timer.get_select_timeout(111, 160) == 0
@@ -164,3 +164,23 @@ def test_sentinel_pg():
 def test_sentinel_instance():
     test_data = load_tests("sentinels", "instance.conf")
     run_tests("sentinel_instance", *test_data)
+
+def test_bytecode_cache(tmp_path):
+    tf = TemplateFabric(TEMPLATE_PATH, cache_path=str(tmp_path))
+    compiled, failed = tf.precompile()
+    assert failed == 0
+    assert compiled > 0
+    assert tf.bytecode_cache.misses == compiled
+    assert tf.bytecode_cache.hits == 0
+    # A new process loads the precompiled templates from the cache
+    tf = TemplateFabric(TEMPLATE_PATH, cache_path=str(tmp_path))
+    test_data = load_tests("general", "policies.conf")
+    run_tests("general_policies", *test_data)
+    tf.from_file(test_data[0])
+    assert tf.bytecode_cache.hits == 1
+    assert tf.bytecode_cache.misses == 0
+
+def test_bytecode_cache_disabled(tmp_path):
+    tf = TemplateFabric(TEMPLATE_PATH, cache_path=str(tmp_path / "missing"))
+    assert tf.bytecode_cache is None
+    assert tf.env.bytecode_cache is None
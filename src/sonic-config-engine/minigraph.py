@@ -1959,6 +1959,114 @@ def update_forced_mgmt_route(mgmt_intf, mgmt_routes):
         if len(forced_mgmt_routes) > 0:
             mgmt_intf[mgmt_intf_key]['forced_mgmt_routes'] = forced_mgmt_routes
 
+###############################################################################
+#
+# Parsed minigraph cache
+#
+###############################################################################
+
+# Bump when the layout of the on-disk lookup cache changes
+MINIGRAPH_CACHE_VERSION = 1
+MINIGRAPH_CACHE_SUFFIX = '.cache.json'
+
+_parsed_minigraphs = {}
+
+
+class ParsedMinigraph(object):
+    """ Minigraph xml file parsed once and shared by all parse_* entry points.
+
+    The xml tree is parsed lazily on first access to 'root'. Results of the
+    small lookups (hostname, asic sub role, asic switch type) are memoized
+    and, when the on-disk cache is enabled, persisted next to the xml file so
+    that later processes can answer them without parsing the xml at all.
+    """
+
+    def __init__(self, filename, disk_cache=False):
+        self.filename = filename
+        stat = os.stat(filename)
+        self.key = (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+        self.cache_file = filename + MINIGRAPH_CACHE_SUFFIX if disk_cache else None
+        self.parse_count = 0
+        self._root = None
+        self._lookups = self._load_lookups()
+
+    @property
+    def root(self):
+        if self._root is None:
+            self._root = ET.parse(self.filename).getroot()
+            self.parse_count += 1
+        return self._root
+
+    def lookup(self, name, func, *args):
+        """ Return memoized result of func(root, *args) stored under name """
+        if name not in self._lookups:
+            self._lookups[name] = func(self.root, *args)
+            self._save_lookups()
+        return self._lookups[name]
+
+    def _load_lookups(self):
+        if self.cache_file is None:
+            return {}
+        try:
+            with open(self.cache_file) as f:
+                cache = json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+        if (cache.get('version') != MINIGRAPH_CACHE_VERSION or
+            cache.get('mtime_ns') != self.key[1] or cache.get('size') != self.key[2]):
+            return {}
+        return cache.get('lookups', {})
+
+    def _save_lookups(self):
+        if self.cache_file is None:
+            return
+        cache = {
+            'version': MINIGRAPH_CACHE_VERSION,
+            'mtime_ns': self.key[1],
+            'size': self.key[2],
+            'lookups': self._lookups
+        }
+        tmp_file = '{}.{}.tmp'.format(self.cache_file, os.getpid())
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(cache, f)
+            os.rename(tmp_file, self.cache_file)
+        except (IOError, OSError):
+            # The cache is an optimization only, e.g. /etc/sonic may be read-only
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+
+def load_minigraph(filename, disk_cache=False):
+    """ Return the ParsedMinigraph for filename.
+
+    The object is cached in-process and keyed by file path, mtime and size, so
+    a modified minigraph is parsed again. A ParsedMinigraph passed in is
+    returned as is, which lets every parse_* function accept either.
+    """
+    if isinstance(filename, ParsedMinigraph):
+        return filename
+
+    stat = os.stat(filename)
+    key = (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+    minigraph = _parsed_minigraphs.get(key[0])
+    if minigraph is None or minigraph.key != key or (disk_cache and minigraph.cache_file is None):
+        minigraph = ParsedMinigraph(filename, disk_cache=disk_cache)
+        _parsed_minigraphs[key[0]] = minigraph
+    return minigraph
+
+
+def clear_minigraph_cache():
+    _parsed_minigraphs.clear()
+
+
+def _minigraph_path(filename):
+    if isinstance(filename, ParsedMinigraph):
+        return filename.filename
+    return filename
+
 ###############################################################################
 #
 # Main functions
@@ -1968,7 +2076,7 @@ def parse_xml(filename, platform=None, port_config_file=None, asic_name=None, hw
     """ Parse minigraph xml file.
 
     Keyword arguments:
-    filename -- minigraph file name
+    filename -- minigraph file name or ParsedMinigraph object
     platform -- device platform
     port_config_file -- port config file name
     asic_name -- asic name; to parse multi-asic device minigraph to
@@ -1976,7 +2084,8 @@ def parse_xml(filename, platform=None, port_config_file=None, asic_name=None, hw
     fabric_port_config_file -- fabric port config file name
      """
 
-    root = ET.parse(filename).getroot()
+    minigraph = load_minigraph(filename)
+    root = minigraph.root
 
     u_neighbors = None
     u_devices = None
@@ -2853,7 +2962,7 @@ def get_mux_cable_entries(ports, mux_cable_ports, active_active_ports, neighbors
 
 
 def parse_device_desc_xml(filename):
-    root = ET.parse(filename).getroot()
+    root = load_minigraph(filename).root
     (lo_prefix, lo_prefix_v6, mgmt_prefix, mgmt_prefix_v6, hostname, hwsku, d_type, _, _, _, _) = parse_device(root)
 
     results = {}
@@ -2881,11 +2990,8 @@ def parse_device_desc_xml(filename):
 
     return results
 
-def parse_hostname(filename):
+def _get_hostname(root):
     hostName = None
-    if not os.path.isfile(filename):
-        return None
-    root = ET.parse(filename).getroot()
     hostname_qn = QName(ns, "Hostname")
     for child in root:
         if child.tag == str(hostname_qn):
@@ -2894,25 +3000,37 @@ def parse_hostname(filename):
 
     return hostName
 
-def parse_asic_sub_role(filename, asic_name):
-    if not os.path.isfile(filename):
-        return None
-    root = ET.parse(filename).getroot()
+def _get_asic_sub_role(root, asic_name):
     for child in root:
         if child.tag == str(QName(ns, "MetadataDeclaration")):
             sub_role, _, _, _, _, _= parse_asic_meta(child, asic_name)
             return sub_role
 
-def parse_asic_switch_type(filename, asic_name, hostname):
-    if os.path.isfile(filename):
-        root = ET.parse(filename).getroot()
-        switch_type, _ = get_chassis_type_and_hostname(root, hostname)
-        if switch_type:
+def _get_asic_switch_type(root, asic_name, hostname):
+    switch_type, _ = get_chassis_type_and_hostname(root, hostname)
+    if switch_type:
+        return switch_type
+    for child in root:
+        if child.tag == str(QName(ns, "MetadataDeclaration")):
+            _, _, switch_type, _, _, _ = parse_asic_meta(child, asic_name)
             return switch_type
-        for child in root:
-            if child.tag == str(QName(ns, "MetadataDeclaration")):
-                _, _, switch_type, _, _, _ = parse_asic_meta(child, asic_name)
-                return switch_type
+    return None
+
+def parse_hostname(filename):
+    if not os.path.isfile(_minigraph_path(filename)):
+        return None
+    return load_minigraph(filename).lookup('hostname', _get_hostname)
+
+def parse_asic_sub_role(filename, asic_name):
+    if not os.path.isfile(_minigraph_path(filename)):
+        return None
+    return load_minigraph(filename).lookup('asic_sub_role:{}'.format(asic_name),
+                                           _get_asic_sub_role, asic_name)
+
+def parse_asic_switch_type(filename, asic_name, hostname):
+    if os.path.isfile(_minigraph_path(filename)):
+        return load_minigraph(filename).lookup('asic_switch_type:{}:{}'.format(asic_name, hostname),
+                                               _get_asic_switch_type, asic_name, hostname)
     return None
 
 def parse_asic_meta_get_devices(root):
@@ -1,6 +1,8 @@
 import json
 import subprocess
 import os
+import shutil
+import tempfile
 import tests.common_utils as utils
 
 from unittest import TestCase
@@ -203,6 +205,65 @@ class TestCfgGen(TestCase):
         with open(self.output2_file) as tf:
             self.assertEqual(tf.read().strip(), 'value')
 
+    def test_batch_manifest(self):
+        manifest = [
+            {'template': os.path.join(self.test_dir, 'test.j2'), 'output': self.output_file},
+            {'template': os.path.join(self.test_dir, 'test2.j2')},
+            {'var': 'key1'},
+            {'var_json': 'jk1_1'}
+        ]
+        manifest_file = os.path.join(self.test_dir, 'batch_manifest.json')
+        with open(manifest_file, 'w') as f:
+            json.dump(manifest, f)
+        try:
+            argument = ['-y', os.path.join(self.test_dir, 'test.yml')]
+            argument += ['-a', '{"key1":"value", "jk1_1":{"k":"v"}}']
+            argument += ['--batch', manifest_file]
+            output = self.run_script(argument)
+        finally:
+            os.remove(manifest_file)
+        with open(self.output_file) as tf:
+            self.assertEqual(tf.read().strip(), 'value1\nvalue2')
+        self.assertEqual(output.split('\n', 2)[:2], ['value', 'value'])
+        self.assertEqual(json.loads(output.split('\n', 2)[2]), {'k': 'v'})
+
+    def test_batch_manifest_invalid(self):
+        argument = ['--batch', '-']
+        proc = subprocess.Popen(self.script_file + argument, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        _, err = proc.communicate(b'[{"template": "a.j2", "var": "b"}]')
+        self.assertEqual(proc.returncode, 1)
+        self.assertIn(b'Failed to load batch manifest', err)
+
+    def test_precompile_templates(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            argument = ['-T', os.path.join(self.test_dir, 'data', 'j2_template'), '--precompile-templates', '--template-cache-dir', cache_dir]
+            output = self.run_script(argument)
+            self.assertIn('0 failed, 0 already cached', output)
+            self.assertTrue(len(os.listdir(cache_dir)) > 0)
+            output = self.run_script(argument)
+            self.assertIn('0 failed, {} already cached'.format(len(os.listdir(cache_dir))), output)
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_precompile_templates_cache_hit(self):
+        template_dir = tempfile.mkdtemp()
+        cache_dir = tempfile.mkdtemp()
+        try:
+            os.mkdir(os.path.join(template_dir, 'bgpd'))
+            template_file = os.path.join(template_dir, 'bgpd', 'cache-test.j2')
+            with open(template_file, 'w') as f:
+                f.write('{{ key1 }}\n')
+            self.run_script(['-T', template_dir, '--precompile-templates', '--template-cache-dir', cache_dir])
+            cache = {name: os.path.getmtime(os.path.join(cache_dir, name)) for name in os.listdir(cache_dir)}
+            # jinja2 only writes the bytecode of a template on a cache miss
+            output = self.run_script(['-a', '{"key1": "value1"}', '-t', template_file, '--template-cache-dir', cache_dir])
+            self.assertEqual(output.strip(), 'value1')
+            self.assertEqual({name: os.path.getmtime(os.path.join(cache_dir, name)) for name in os.listdir(cache_dir)}, cache)
+        finally:
+            shutil.rmtree(template_dir)
+            shutil.rmtree(cache_dir)
+
     def test_template_json_batch_mode(self):
         data = {"key1_1":"value1_1", "key1_2":"value1_2", "key2_1":"value2_1", "key2_2":"value2_2"}
         argument = ["-a", '{0}'.format(repr(data).replace('\'', '"'))]
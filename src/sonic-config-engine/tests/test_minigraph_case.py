@@ -2,6 +2,8 @@ import json
 import os
 import subprocess
 import ipaddress
+import shutil
+import tempfile
 import tests.common_utils as utils
 import minigraph
 
@@ -575,3 +577,42 @@ class TestCfgGenCaseInsensitive(TestCase):
         # TC2: For other minigraph, result should not contain FLEX_COUNTER_TABLE
         result = minigraph.parse_xml(self.sample_graph, port_config_file=self.port_config)
         self.assertNotIn('FLEX_COUNTER_TABLE', result)
+
+    def test_parsed_minigraph_cache(self):
+        minigraph.clear_minigraph_cache()
+        parsed = minigraph.load_minigraph(self.sample_graph)
+        self.assertIs(minigraph.load_minigraph(self.sample_graph), parsed)
+        self.assertIs(minigraph.load_minigraph(parsed), parsed)
+
+        # All entry points share a single parse of the xml file
+        self.assertEqual(minigraph.parse_hostname(self.sample_graph), 'switch-t0')
+        minigraph.parse_xml(self.sample_graph, port_config_file=self.port_config)
+        minigraph.parse_asic_sub_role(self.sample_graph, 'asic0')
+        self.assertEqual(parsed.parse_count, 1)
+
+    def test_parsed_minigraph_disk_cache(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            graph = os.path.join(tmp_dir, 'minigraph.xml')
+            shutil.copy(self.sample_graph, graph)
+            minigraph.clear_minigraph_cache()
+            self.assertEqual(minigraph.parse_hostname(minigraph.load_minigraph(graph, disk_cache=True)), 'switch-t0')
+            self.assertTrue(os.path.isfile(graph + minigraph.MINIGRAPH_CACHE_SUFFIX))
+
+            # A new process answers lookups from the cache file without parsing the xml
+            minigraph.clear_minigraph_cache()
+            parsed = minigraph.load_minigraph(graph, disk_cache=True)
+            self.assertEqual(minigraph.parse_hostname(parsed), 'switch-t0')
+            self.assertEqual(parsed.parse_count, 0)
+
+            # A modified minigraph invalidates both caches
+            with open(graph) as f:
+                content = f.read()
+            with open(graph, 'w') as f:
+                f.write(content.replace('<Hostname>switch-t0</Hostname>', '<Hostname>switch-t0-new</Hostname>'))
+            parsed = minigraph.load_minigraph(graph, disk_cache=True)
+            self.assertEqual(minigraph.parse_hostname(parsed), 'switch-t0-new')
+            self.assertEqual(parsed.parse_count, 1)
+        finally:
+            shutil.rmtree(tmp_dir)
+            minigraph.clear_minigraph_cache()
@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 
 import datetime
+import heapq
 import inspect
+import itertools
 import json
 import os
 import sys
 import syslog
 import subprocess
+import time
 from collections import defaultdict
 from ctrmgr.ctrmgr_iptables import iptable_proxy_rule_upd
 
@@ -180,13 +183,27 @@ class MainServer:
 
     SELECT_TIMEOUT = 1000
 
+    # Main loop statistics in STATE_DB, refreshed every STATS_INTERVAL seconds
+    STATS_TABLE = "CTRMGRD_STATS"
+    STATS_KEY = "MAIN_LOOP"
+    STATS_INTERVAL = 60
+
     def __init__(self):
         """ Constructor """
         self.db_connectors = {}
         self.selector = swsscommon.Select()
         self.callbacks = defaultdict(lambda: defaultdict(list))  # db -> table -> handlers[]
-        self.timer_handlers = defaultdict(list)
+        self.timer_handlers = []    # heap of (ts, seq, handler, args)
+        self.timer_seq = itertools.count()  # keeps registration order for same ts
         self.subscribers = set()
+        self.tables = {}    # (db, table) -> swsscommon.Table
+        self.stats = {
+                "loop_latency_ms": 0,
+                "max_loop_latency_ms": 0,
+                "events": 0,
+                "max_events": 0,
+                "timer_queue_depth": 0
+                }
 
     def register_db(self, db_name):
         """ Get DB connector, if not there """
@@ -198,7 +215,7 @@ class MainServer:
         """ Register timer based handler.
             The handler will be called on/after give timestamp, ts
         """
-        self.timer_handlers[ts].append((handler, args))
+        heapq.heappush(self.timer_handlers, (ts, next(self.timer_seq), handler, args))
 
 
     def register_handler(self, db_name, table_name, handler):
@@ -217,17 +234,24 @@ class MainServer:
         self.callbacks[db_name][table_name].append(handler)
 
 
+    def get_table(self, db_name, table_name):
+        """ Return table handle, created once per db/table """
+        tbl = self.tables.get((db_name, table_name))
+        if tbl is None:
+            tbl = swsscommon.Table(self.db_connectors[db_name], table_name)
+            self.tables[(db_name, table_name)] = tbl
+        return tbl
+
+
     def get_db_entry(self, db_name, table_name, key):
         """ Return empty dict if key not present """
-        conn = self.db_connectors[db_name]
-        tbl = swsscommon.Table(conn, table_name)
+        tbl = self.get_table(db_name, table_name)
         return dict(tbl.get(key)[1])
 
 
     def mod_db_entry(self, db_name, table_name, key, data):
         """ Modify entry for given table|key with given dict type data """
-        conn = self.db_connectors[db_name]
-        tbl = swsscommon.Table(conn, table_name)
+        tbl = self.get_table(db_name, table_name)
         log_debug("mod_db_entry: db={} tbl={} key={} data={}".format(db_name, table_name, key, str(data)))
         tbl.set(key, list(data.items()))
 
@@ -236,8 +260,7 @@ class MainServer:
         """ Set given data as complete data, which includes
             removing any fields that are in DB but not in data
         """
-        conn = self.db_connectors[db_name]
-        tbl = swsscommon.Table(conn, table_name)
+        tbl = self.get_table(db_name, table_name)
         ct_data = dict(tbl.get(key)[1])
         for k in ct_data:
             if k not in data:
@@ -246,24 +269,64 @@ class MainServer:
         tbl.set(key, list(data.items()))
 
 
+    def run_timers(self):
+        """ Call handlers of expired timers.
+            Return select timeout in ms until the next timer
+        """
+        ct_ts = datetime.datetime.now()
+        while self.timer_handlers:
+            ts = self.timer_handlers[0][0]
+            if ts > ct_ts:
+                ms = int((ts - ct_ts).total_seconds() * 1000) + 1
+                return min(ms, MainServer.SELECT_TIMEOUT)
+            _, _, handler, args = heapq.heappop(self.timer_handlers)
+            if args is None:
+                handler()
+            else:
+                handler(*args)
+        return MainServer.SELECT_TIMEOUT
+
+
+    def drain_subscriber(self, subscriber):
+        """ Read all pending updates of the subscriber.
+            Updates are coalesced per key, as the subscriber reports the
+            complete entry, only the last update of a key is relevant.
+            Return list of (key, op, fvs)
+        """
+        updates = {}
+        for key, op, fvs in subscriber.pops():
+            if not key:
+                continue
+            updates.pop(key, None)
+            updates[key] = (op, fvs)
+        return [(key, op, fvs) for key, (op, fvs) in updates.items()]
+
+
+    def update_stats(self, latency, events):
+        """ Update main loop statistics of one wakeup """
+        latency_ms = int(latency * 1000)
+        self.stats["loop_latency_ms"] = latency_ms
+        self.stats["max_loop_latency_ms"] = max(self.stats["max_loop_latency_ms"], latency_ms)
+        self.stats["events"] = events
+        self.stats["max_events"] = max(self.stats["max_events"], events)
+
+
+    def publish_stats(self):
+        """ Write main loop statistics to STATE_DB and reschedule """
+        self.stats["timer_queue_depth"] = len(self.timer_handlers)
+        self.register_db(STATE_DB_NAME)
+        self.mod_db_entry(STATE_DB_NAME, MainServer.STATS_TABLE, MainServer.STATS_KEY,
+                {k: str(v) for k, v in self.stats.items()})
+        self.register_timer(datetime.datetime.now() +
+                datetime.timedelta(seconds=MainServer.STATS_INTERVAL), self.publish_stats)
+
+
     def run(self):
         """ Main loop """
+        self.register_timer(datetime.datetime.now() +
+                datetime.timedelta(seconds=MainServer.STATS_INTERVAL), self.publish_stats)
         while True:
-            timeout = MainServer.SELECT_TIMEOUT
-            ct_ts = datetime.datetime.now()
-            while self.timer_handlers:
-                k = sorted(self.timer_handlers.keys())[0]
-                if k <= ct_ts:
-                    lst = self.timer_handlers[k]
-                    del self.timer_handlers[k]
-                    for fn in lst:
-                        if fn[1] is None:
-                            fn[0]()
-                        else:
-                            fn[0](*fn[1])
-                else:
-                    timeout = (k - ct_ts).seconds
-                    break
+            timeout = self.run_timers()
 
             state, _ = self.selector.select(timeout)
             if state == self.selector.TIMEOUT:
@@ -275,17 +338,23 @@ class MainServer:
                     log_debug("Skipped Exception; Received error from select")
                     return
 
+            start = time.monotonic()
+            events = 0
             for subscriber in self.subscribers:
-                key, op, fvs = subscriber.pop()
-                if not key:
-                    continue
-                if subscriber.getTableName() == FEATURE_TABLE and key in DISABLED_FEATURE_SET:
+                updates = self.drain_subscriber(subscriber)
+                if not updates:
                     continue
-                log_debug("Received message : '%s'" % str((key, op, fvs)))
-                for callback in (self.callbacks
+                events += len(updates)
+                callbacks = (self.callbacks
                         [subscriber.getDbConnector().getDbName()]
-                        [subscriber.getTableName()]):
-                    callback(key, op, dict(fvs))
+                        [subscriber.getTableName()])
+                for key, op, fvs in updates:
+                    if subscriber.getTableName() == FEATURE_TABLE and key in DISABLED_FEATURE_SET:
+                        continue
+                    log_debug("Received message : '%s'" % str((key, op, fvs)))
+                    for callback in callbacks:
+                        callback(key, op, dict(fvs))
+            self.update_stats(time.monotonic() - start, events)
 
 
 
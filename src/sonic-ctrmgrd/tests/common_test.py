@@ -446,6 +446,12 @@ class mock_subscriber:
             return ("", "", {})
 
 
+    def pops(self):
+        # One update per select, same as pop
+        key, op, fvs = self.pop()
+        return [(key, op, fvs)] if key else []
+
+
     def getDbConnector(self):
         return self.dbconn
 
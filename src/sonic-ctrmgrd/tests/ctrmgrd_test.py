@@ -1,3 +1,4 @@
+import datetime
 import os
 import sys
 from unittest.mock import MagicMock, patch
@@ -609,3 +610,65 @@ class TestContainerStartup(object):
             ret = common_test.check_kube_actions()
             assert ret == 0
         self.clear()
+
+
+    @patch("ctrmgrd.swsscommon.DBConnector")
+    @patch("ctrmgrd.swsscommon.Table")
+    @patch("ctrmgrd.swsscommon.Select")
+    @patch("ctrmgrd.swsscommon.SubscriberStateTable")
+    def test_main_server(self, mock_subs, mock_select, mock_table, mock_conn):
+        self.init()
+        server = ctrmgrd.MainServer()
+        selector = mock_select.return_value
+        selector.TIMEOUT = 1
+        selector.ERROR = 2
+
+        # Timers are called in order of timestamp, then registration
+        calls = []
+        now = datetime.datetime.now()
+        server.register_timer(now + datetime.timedelta(seconds=30), calls.append, ("late",))
+        server.register_timer(now - datetime.timedelta(seconds=1), calls.append, ("first",))
+        server.register_timer(now - datetime.timedelta(seconds=2), calls.append, ("earliest",))
+        server.register_timer(now - datetime.timedelta(seconds=1), calls.append, ("second",))
+        timeout = server.run_timers()
+        assert calls == ["earliest", "first", "second"]
+        assert timeout == ctrmgrd.MainServer.SELECT_TIMEOUT
+        server.register_timer(datetime.datetime.now() + datetime.timedelta(milliseconds=200), calls.append, ("soon",))
+        assert 0 < server.run_timers() <= 201
+        assert len(server.timer_handlers) == 2
+
+        # All pending updates are drained on one wakeup, coalesced per key
+        subscriber = mock_subs.return_value
+        subscriber.getTableName.return_value = ctrmgrd.FEATURE_TABLE
+        subscriber.getDbConnector.return_value.getDbName.return_value = ctrmgrd.CONFIG_DB_NAME
+        subscriber.pops.side_effect = [[
+            ("snmp", "SET", (("set_owner", "local"),)),
+            ("database", "SET", (("set_owner", "kube"),)),
+            ("dhcp_relay", "SET", (("set_owner", "local"),)),
+            ("snmp", "SET", (("set_owner", "kube"),)),
+            ]]
+        updates = []
+        server.register_handler(ctrmgrd.CONFIG_DB_NAME, ctrmgrd.FEATURE_TABLE,
+                lambda key, op, data: updates.append((key, data)))
+        selector.select.side_effect = [(0, None), (2, None)]
+        server.run()
+        assert updates == [("dhcp_relay", {"set_owner": "local"}), ("snmp", {"set_owner": "kube"})]
+        assert subscriber.pops.call_count == 1
+        assert server.stats["events"] == 3
+        assert server.stats["max_events"] == 3
+
+        # Table handles are created once per table
+        mock_table.reset_mock()
+        server.register_db(ctrmgrd.STATE_DB_NAME)
+        server.mod_db_entry(ctrmgrd.STATE_DB_NAME, ctrmgrd.FEATURE_TABLE, "snmp", {"restart": "true"})
+        server.get_db_entry(ctrmgrd.STATE_DB_NAME, ctrmgrd.FEATURE_TABLE, "snmp")
+        server.set_db_entry(ctrmgrd.STATE_DB_NAME, ctrmgrd.FEATURE_TABLE, "snmp", {})
+        assert mock_table.call_count == 1
+
+        # Loop statistics are exported to STATE_DB
+        server.publish_stats()
+        key, fvs = mock_table.return_value.set.call_args[0]
+        assert key == ctrmgrd.MainServer.STATS_KEY
+        assert dict(fvs)["events"] == "3"
+        assert dict(fvs)["timer_queue_depth"] == "3"
+        self.clear()
@@ -44,15 +44,25 @@ class DhcpServCfgGenerator(object):
         self.lease_path = lease_path
         self.lease_update_script_path = lease_update_script_path
         self.hook_lib_path = hook_lib_path
+        # Tables read from config_db, kept while they are not changed
+        self.config_db_tables = {}
+        # Parsed port config and subnets of each DHCP interface together with their inputs, recomputed only when
+        # inputs changed
+        self.port_cache = {}
+        self.subnet_cache = {}
+        self.generate_count = 0
+        self.recomputed_subnet_count = 0
         # Read port alias map file, this file is render after container start, so it would not change any more
         self._parse_port_map_alias()
         # Get kea config template
         self._get_render_template(kea_conf_template_path)
         self._read_dhcp_option(dhcp_option_path)
 
-    def generate(self):
+    def generate(self, unchanged_tables=None):
         """
         Generate dhcp server config
+        Args:
+            unchanged_tables: set of tables not changed since last generation, cached content of them would be used
         Returns:
             config string
             set of ranges used
@@ -61,18 +71,22 @@ class DhcpServCfgGenerator(object):
             set of db table need to be monitored
         """
         # Generate from running config_db
+        self.generate_count += 1
+        unchanged_tables = unchanged_tables or set()
+        self.config_db_tables = {table_name: table for table_name, table in self.config_db_tables.items()
+                                 if table_name in unchanged_tables}
         # Get host name
-        device_metadata = self.db_connector.get_config_db_table("DEVICE_METADATA")
+        device_metadata = self._get_config_db_table("DEVICE_METADATA")
         hostname = self._parse_hostname(device_metadata)
         smart_switch = is_smart_switch(device_metadata)
         # Get ip information of vlan
-        vlan_interface = self.db_connector.get_config_db_table(VLAN_INTERFACE)
-        vlan_member_table = self.db_connector.get_config_db_table(VLAN_MEMBER)
+        vlan_interface = self._get_config_db_table(VLAN_INTERFACE)
+        vlan_member_table = self._get_config_db_table(VLAN_MEMBER)
         vlan_interfaces, vlan_members = self._parse_vlan(vlan_interface, vlan_member_table)
 
         # Parse dpu
-        dpus_table = self.db_connector.get_config_db_table(DPUS)
-        mid_plane_table = self.db_connector.get_config_db_table(MID_PLANE_BRIDGE)
+        dpus_table = self._get_config_db_table(DPUS)
+        mid_plane_table = self._get_config_db_table(MID_PLANE_BRIDGE)
         mid_plane, dpus = self._parse_dpu(dpus_table, mid_plane_table) if smart_switch else ({}, {})
 
         dhcp_server_ipv4, customized_options_ipv4, range_ipv4, port_ipv4 = self._get_dhcp_ipv4_tables_from_db()
@@ -99,6 +113,18 @@ class DhcpServCfgGenerator(object):
 
         return self._render_config(render_obj), used_ranges, enabled_dhcp_interfaces, used_options, subscribe_table
 
+    def _get_config_db_table(self, table_name):
+        """
+        Get table from config_db, table read is cached until next generation which table changed in
+        Args:
+            table_name: Name of table want to get.
+        Returns:
+            Table objects.
+        """
+        if table_name not in self.config_db_tables:
+            self.config_db_tables[table_name] = self.db_connector.get_config_db_table(table_name)
+        return self.config_db_tables[table_name]
+
     def _parse_dpu(self, dpus_table, mid_plane_table):
         """
         Parse dpu related tables
@@ -192,7 +218,7 @@ class DhcpServCfgGenerator(object):
         client_classes = []
         enabled_dhcp_interfaces = set()
         used_options = set()
-        customized_option_keys = customized_options.keys()
+        subnet_cache = {}
         # Different mode would subscribe different table, always subscribe DHCP_SERVER_IPV4
         subscribe_table = set(["DhcpServerTableCfgChangeEventChecker"])
         for dhcp_interface_name, dhcp_config in dhcp_server_ipv4.items():
@@ -205,59 +231,23 @@ class DhcpServCfgGenerator(object):
                     syslog.syslog(syslog.LOG_WARNING, "Cannot get DHCP port config for {}"
                                   .format(dhcp_interface_name))
                     continue
-                curr_options = {}
-                dhcp_server_id_option = {}
-                if "customized_options" in dhcp_config:
-                    for option in dhcp_config["customized_options"]:
-                        used_options.add(option)
-                        if option not in customized_option_keys:
-                            syslog.syslog(syslog.LOG_WARNING, "Customized option {} configured for {} is not defined"
-                                          .format(option, dhcp_interface_name))
-                            continue
-                        current_option = {
-                                "always_send": customized_options[option]["always_send"],
-                                "value": customized_options[option]["value"],
-                                "option_type": customized_options[option]["option_type"],
-                                "id": customized_options[option]["id"]
-                        }
-                        if customized_options[option]["id"] == OPTION_DHCP_SERVER_ID:
-                            dhcp_server_id_option = current_option
-                        else:
-                            curr_options[option] = current_option
-                for dhcp_interface_ip, port_config in port_ips[dhcp_interface_name].items():
-                    pools = []
-                    for port_name, ip_ranges in port_config.items():
-                        ip_range = None
-                        for ip_range in ip_ranges:
-                            client_class = "{}:{}".format(hostname, port_name)
-                            ip_range = {
-                                "range": "{} - {}".format(ip_range[0], ip_range[1]),
-                                "client_class": client_class
-                            }
-                            pools.append(ip_range)
-                        if ip_range is not None:
-                            class_len = len(client_class)
-                            client_classes.append({
-                                "name": client_class,
-                                "condition": "substring(relay4[1].hex, -{}, {}) == '{}'".format(class_len, class_len,
-                                                                                                client_class)
-                            })
-                    if not dhcp_server_id_option:
-                        dhcp_server_id_option = {
-                            "value": dhcp_interface_ip.split("/")[0],
-                            "always_send": "true"
-                        }
-                    subnet_obj = {
-                        "id": MID_PLANE_BRIDGE_SUBNET_ID if smart_switch else dhcp_interface_name.replace("Vlan", ""),
-                        "subnet": str(ipaddress.ip_network(dhcp_interface_ip, strict=False)),
-                        "pools": pools,
-                        "dhcp_server_id_option": dhcp_server_id_option,
-                        "lease_time": dhcp_config["lease_time"] if "lease_time" in dhcp_config else DEFAULT_LEASE_TIME,
-                        "customized_options": curr_options
-                    }
-                    if "gateway" in dhcp_config:
-                        subnet_obj["gateway"] = dhcp_config["gateway"]
-                    subnets.append(subnet_obj)
+                used_options |= set(dhcp_config.get("customized_options", []))
+                # Subnets are recomputed only if config of this DHCP interface changed
+                inputs = (dhcp_config, port_ips[dhcp_interface_name], hostname, smart_switch,
+                          {option: customized_options.get(option)
+                           for option in dhcp_config.get("customized_options", [])})
+                cached = self.subnet_cache.get(dhcp_interface_name)
+                if cached is not None and cached[0] == inputs:
+                    curr_subnets, curr_client_classes = cached[1], cached[2]
+                else:
+                    self.recomputed_subnet_count += 1
+                    curr_subnets, curr_client_classes = \
+                        self._construct_subnets(dhcp_interface_name, dhcp_config, port_ips[dhcp_interface_name],
+                                                hostname, customized_options, smart_switch)
+                subnet_cache[dhcp_interface_name] = (inputs, curr_subnets, curr_client_classes)
+                subnets += curr_subnets
+                client_classes += curr_client_classes
+        self.subnet_cache = subnet_cache
         render_obj = {
             "subnets": subnets,
             "client_classes": client_classes,
@@ -269,16 +259,93 @@ class DhcpServCfgGenerator(object):
         }
         return render_obj, enabled_dhcp_interfaces, used_options, subscribe_table
 
+    def _construct_subnets(self, dhcp_interface_name, dhcp_config, interface_port_ips, hostname, customized_options,
+                           smart_switch):
+        """
+        Construct subnets and client classes of one DHCP interface for template
+        Args:
+            dhcp_interface_name: Name of DHCP interface
+            dhcp_config: Config of DHCP interface in DHCP_SERVER_IPV4 table
+            interface_port_ips: Ip ranges of ports in this DHCP interface, sample:
+                {
+                    '192.168.0.1/24': {
+                        'etp2': [
+                            ['192.168.0.7', '192.168.0.7']
+                        ]
+                    }
+                }
+            hostname: Host name
+            customized_options: Dict of parsed customized options
+            smart_switch: Whether device is smart switch
+        Returns:
+            List of subnets, list of client classes
+        """
+        subnets = []
+        client_classes = []
+        curr_options = {}
+        dhcp_server_id_option = {}
+        if "customized_options" in dhcp_config:
+            for option in dhcp_config["customized_options"]:
+                if option not in customized_options:
+                    syslog.syslog(syslog.LOG_WARNING, "Customized option {} configured for {} is not defined"
+                                  .format(option, dhcp_interface_name))
+                    continue
+                current_option = {
+                        "always_send": customized_options[option]["always_send"],
+                        "value": customized_options[option]["value"],
+                        "option_type": customized_options[option]["option_type"],
+                        "id": customized_options[option]["id"]
+                }
+                if customized_options[option]["id"] == OPTION_DHCP_SERVER_ID:
+                    dhcp_server_id_option = current_option
+                else:
+                    curr_options[option] = current_option
+        for dhcp_interface_ip, port_config in interface_port_ips.items():
+            pools = []
+            for port_name, ip_ranges in port_config.items():
+                ip_range = None
+                for ip_range in ip_ranges:
+                    client_class = "{}:{}".format(hostname, port_name)
+                    ip_range = {
+                        "range": "{} - {}".format(ip_range[0], ip_range[1]),
+                        "client_class": client_class
+                    }
+                    pools.append(ip_range)
+                if ip_range is not None:
+                    class_len = len(client_class)
+                    client_classes.append({
+                        "name": client_class,
+                        "condition": "substring(relay4[1].hex, -{}, {}) == '{}'".format(class_len, class_len,
+                                                                                        client_class)
+                    })
+            if not dhcp_server_id_option:
+                dhcp_server_id_option = {
+                    "value": dhcp_interface_ip.split("/")[0],
+                    "always_send": "true"
+                }
+            subnet_obj = {
+                "id": MID_PLANE_BRIDGE_SUBNET_ID if smart_switch else dhcp_interface_name.replace("Vlan", ""),
+                "subnet": str(ipaddress.ip_network(dhcp_interface_ip, strict=False)),
+                "pools": pools,
+                "dhcp_server_id_option": dhcp_server_id_option,
+                "lease_time": dhcp_config["lease_time"] if "lease_time" in dhcp_config else DEFAULT_LEASE_TIME,
+                "customized_options": curr_options
+            }
+            if "gateway" in dhcp_config:
+                subnet_obj["gateway"] = dhcp_config["gateway"]
+            subnets.append(subnet_obj)
+        return subnets, client_classes
+
     def _get_dhcp_ipv4_tables_from_db(self):
         """
         Get DHCP Server IPv4 related table from config_db.
         Returns:
             Four table objects.
         """
-        dhcp_server_ipv4 = self.db_connector.get_config_db_table(DHCP_SERVER_IPV4)
-        customized_options_ipv4 = self.db_connector.get_config_db_table(DHCP_SERVER_IPV4_CUSTOMIZED_OPTIONS)
-        range_ipv4 = self.db_connector.get_config_db_table(DHCP_SERVER_IPV4_RANGE)
-        port_ipv4 = self.db_connector.get_config_db_table(DHCP_SERVER_IPV4_PORT)
+        dhcp_server_ipv4 = self._get_config_db_table(DHCP_SERVER_IPV4)
+        customized_options_ipv4 = self._get_config_db_table(DHCP_SERVER_IPV4_CUSTOMIZED_OPTIONS)
+        range_ipv4 = self._get_config_db_table(DHCP_SERVER_IPV4_RANGE)
+        port_ipv4 = self._get_config_db_table(DHCP_SERVER_IPV4_PORT)
         return dhcp_server_ipv4, customized_options_ipv4, range_ipv4, port_ipv4
 
     def _get_vlan_ipv4_interface(self, vlan_interface_keys):
@@ -410,10 +477,38 @@ class DhcpServCfgGenerator(object):
             Set of used ranges.
         """
         port_ips = {}
-        ip_ports = {}
         used_ranges = set()
+        port_cache = {}
+        # Group port config by DHCP interface, port config of DHCP interface is parsed again only if it changed
+        interface_port_configs = {}
         for port_key in list(port_ipv4.keys()):
-            port_config = port_ipv4.get(port_key, {})
+            interface_port_configs.setdefault(port_key.split("|")[0], {})[port_key] = port_ipv4.get(port_key, {})
+        for dhcp_interface_name, port_configs in interface_port_configs.items():
+            range_names = set()
+            for port_config in port_configs.values():
+                range_names |= set(port_config.get("ranges", []))
+            inputs = (port_configs, [port_key in dhcp_members for port_key in port_configs.keys()],
+                      dhcp_interfaces.get(dhcp_interface_name), {name: ranges.get(name) for name in range_names})
+            cached = self.port_cache.get(dhcp_interface_name)
+            if cached is not None and cached[0] == inputs:
+                interface_port_ips, interface_used_ranges = cached[1], cached[2]
+            else:
+                interface_port_ips, interface_used_ranges = \
+                    self._parse_interface_port(port_configs, dhcp_interfaces, dhcp_members, ranges)
+            port_cache[dhcp_interface_name] = (inputs, interface_port_ips, interface_used_ranges)
+            port_ips.update(interface_port_ips)
+            used_ranges |= interface_used_ranges
+        self.port_cache = port_cache
+        return port_ips, used_ranges
+
+    def _parse_interface_port(self, port_configs, dhcp_interfaces, dhcp_members, ranges):
+        """
+        Parse port config of one DHCP interface, arguments and return value are the same as _parse_port
+        """
+        port_ips = {}
+        ip_ports = {}
+        used_ranges = set()
+        for port_key, port_config in port_configs.items():
             # Cannot specify both 'ips' and 'ranges'
             if "ips" in port_config and len(port_config["ips"]) != 0 and "ranges" in port_config \
                and len(port_config["ranges"]) != 0:
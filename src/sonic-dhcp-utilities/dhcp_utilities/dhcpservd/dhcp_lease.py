@@ -1,11 +1,12 @@
+import os
 import signal
 import syslog
 import threading
 import time
 from abc import abstractmethod
-from collections import deque
 from datetime import datetime
 from dhcp_utilities.common.utils import is_smart_switch
+from swsscommon import swsscommon
 
 DHCP_SERVER_IPV4_LEASE = "DHCP_SERVER_IPV4_LEASE"
 KEA_LEASE_FILE_PATH = "/tmp/kea-lease.csv"
@@ -30,6 +31,8 @@ class LeaseHanlder(object):
         self.lease_update_interval = lease_update_interval
         self.last_update_time = None
         self.lock = threading.Lock()
+        # Lease entries written to STATE_DB, None before the lease table in STATE_DB is read
+        self.synced_lease = None
         device_metadata = self.db_connector.get_config_db_table("DEVICE_METADATA")
         self.is_smart_switch = is_smart_switch(device_metadata)
 
@@ -67,37 +70,61 @@ class LeaseHanlder(object):
                 return
         if not self.lock.acquire(False):
             return
-        new_lease = self._read()
-        # Store old lease key
-        old_lease_table = self.db_connector.get_state_db_table(DHCP_SERVER_IPV4_LEASE)
-        old_lease_key = set(old_lease_table.keys())
-
-        # 1.1 If start time equal to end time or lease expired, means lease has been released
-        #     1.1.1 If current lease table has this old lease, delete it
-        #     1.1.2 Else skip
-        # 1.2 Else, means lease valid, save it.
+        try:
+            new_lease = self._read()
+            if self.synced_lease is None:
+                # Content of old lease entries is unknown, they would be rewritten or deleted
+                old_lease_table = self.db_connector.get_state_db_table(DHCP_SERVER_IPV4_LEASE)
+                self.synced_lease = dict.fromkeys(old_lease_table.keys())
+            self._sync_lease(new_lease)
+            self.last_update_time = datetime.now()
+        finally:
+            self.lock.release()
+
+    def _sync_lease(self, new_lease):
+        """
+        Write changed lease entries to STATE_DB through one redis pipeline
+        Args:
+            new_lease: Newest lease information of each client, released and expired leases are removed from it
+        """
+        # 1. If start time equal to end time or lease expired, means lease has been released, it would be deleted
+        #    if current lease table has it
+        # 2. Else, means lease valid, save it if it changed
+        # 3. Delete old lease not in valid lease set
+        unix_time = datetime.now().timestamp()
+        valid_lease = {}
         for key, value in new_lease.items():
-            unix_time = datetime.now().timestamp()
-            if value["lease_start"] == value["lease_end"] or unix_time >= int(value["lease_end"]):
-                if key in old_lease_key:
-                    self.db_connector.state_db.delete("{}|{}".format(DHCP_SERVER_IPV4_LEASE, key))
-                continue
-            new_key = "{}|{}".format(DHCP_SERVER_IPV4_LEASE, key)
-            for k, v in new_lease[key].items():
-                self.db_connector.state_db.hset(new_key, k, v)
-        # Delete old lease not in new lease set
-        for key in old_lease_key:
-            if key not in new_lease.keys():
-                # Delete entry
-                self.db_connector.state_db.delete("{}|{}".format(DHCP_SERVER_IPV4_LEASE, key))
-        self.last_update_time = datetime.now()
-        self.lock.release()
+            if value["lease_start"] != value["lease_end"] and unix_time < int(value["lease_end"]):
+                valid_lease[key] = value
+        # A released or expired lease is only added back by a newer row of the same client
+        for key in new_lease.keys() - valid_lease.keys():
+            del new_lease[key]
+        pipe = swsscommon.RedisPipeline(self.db_connector.state_db)
+        for key, value in valid_lease.items():
+            if self.synced_lease.get(key) != value:
+                command = swsscommon.RedisCommand()
+                command.formatHSET("{}|{}".format(DHCP_SERVER_IPV4_LEASE, key), value)
+                pipe.push(command)
+        for key in self.synced_lease.keys() - valid_lease.keys():
+            command = swsscommon.RedisCommand()
+            command.formatDEL("{}|{}".format(DHCP_SERVER_IPV4_LEASE, key))
+            pipe.push(command)
+        # Mark STATE_DB content unknown until the flush succeeded
+        self.synced_lease = None
+        pipe.flush()
+        self.synced_lease = valid_lease
 
 
 class KeaDhcp4LeaseHandler(LeaseHanlder):
     def __init__(self, db_connector, lease_file=KEA_LEASE_FILE_PATH):
         LeaseHanlder.__init__(self, db_connector)
         self.lease_file = lease_file
+        # Newest lease information of each client parsed from lease file
+        self.lease = {}
+        # Lease file opened for read, kept open across rotation to read the rest of the rotated file
+        self.lease_fd = None
+        self.lease_inode = None
+        self.lease_columns = 0
 
     def register(self):
         """
@@ -112,37 +139,74 @@ class KeaDhcp4LeaseHandler(LeaseHanlder):
             return f"Vlan{subnet_id}|{mac_address}"
 
     def _read(self):
-        # Read lease file generated by kea-dhcp4
+        # Read rows appended to lease file generated by kea-dhcp4 since last read.
+        # kea-lfc rotates lease file: kea-dhcp4 renames it to <lease_file>.2 and continues with a new one,
+        # kea-lfc merges <lease_file>.1 and <lease_file>.2 into new <lease_file>.1
         try:
-            with open(self.lease_file, "r", encoding="utf-8") as fb:
-                dq = deque(fb)
+            lease_inode = os.stat(self.lease_file).st_ino
         except FileNotFoundError as err:
             syslog.syslog(syslog.LOG_ERR, "Cannot find lease file: {}".format(self.lease_file))
             raise err
 
-        new_lease = {}
-        # Get newest lease information of each client
-        while dq:
-            last_row = dq.pop()
-            splits = last_row.split(",")
+        if self.lease_fd is None:
+            # Leases before last rotation are only in files of kea-lfc
+            for rotated_file in [self.lease_file + ".1", self.lease_file + ".2"]:
+                try:
+                    with open(rotated_file, "rb") as fd:
+                        self._parse_rows(fd)
+                except FileNotFoundError:
+                    pass
+        elif lease_inode != self.lease_inode:
+            # Lease file rotated, read the rest of the rotated file
+            self._parse_rows(self.lease_fd)
+            self._close_lease_file()
+        elif os.fstat(self.lease_fd.fileno()).st_size < self.lease_fd.tell():
+            # Lease file truncated, read it from the beginning
+            self._close_lease_file()
+            self.lease.clear()
+
+        if self.lease_fd is None:
+            self.lease_fd = open(self.lease_file, "rb")
+            self.lease_inode = os.fstat(self.lease_fd.fileno()).st_ino
+        self._parse_rows(self.lease_fd)
+        return self.lease
+
+    def _close_lease_file(self):
+        self.lease_fd.close()
+        self.lease_fd = None
+        self.lease_inode = None
+
+    def _parse_rows(self, fd):
+        """
+        Parse rows from current position of lease file to the end, later rows override lease of the same client.
+        Position is kept at the start of the last row if it is not terminated, the row is parsed again on next read
+        Args:
+            fd: Lease file opened in binary mode
+        """
+        data = fd.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            fd.seek(end - len(data), os.SEEK_CUR)
+        for row in data.decode("utf-8", errors="replace").splitlines():
+            splits = row.split(",")
             # Skip header
             if splits[0] == "address":
-                break
+                self.lease_columns = len(splits)
+                continue
+            # Skip row being written
+            if len(splits) < max(self.lease_columns, 6):
+                continue
             ip_str = splits[0]
             mac_address = splits[1]
             valid_lifetime = splits[3]
             lease_end = splits[4]
             subnet_id = splits[5]
 
-            new_key = self._lease_key(subnet_id, mac_address)
-            if new_key in new_lease:
-                continue
-            new_lease[new_key] = {
+            self.lease[self._lease_key(subnet_id, mac_address)] = {
                 "lease_start": str(int(lease_end) - int(valid_lifetime)),
                 "lease_end": lease_end,
                 "ip": ip_str
             }
-        return new_lease
 
     def _update_lease(self, signum, frame):
         self.update_lease()
@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import hashlib
 import psutil
 import signal
 import time
@@ -33,6 +34,8 @@ class DhcpServd(object):
         self.kea_dhcp4_config_path = kea_dhcp4_config_path
         self.dhcp_servd_monitor = monitor
         self.enabled_checker = None
+        self.kea_dhcp4_config_hash = None
+        self.reload_count = 0
 
     def _notify_kea_dhcp4_proc(self):
         """
@@ -50,8 +53,10 @@ class DhcpServd(object):
         """
         Generate kea-dhcp4 config file and dump it to config folder
         """
+        # Tables of enabled checkers without update event are not read again by generator
+        unchanged_tables = self.dhcp_servd_monitor.get_unchanged_tables() if self.enabled_checker is not None else set()
         kea_dhcp4_config, used_ranges, enabled_dhcp_interfaces, used_options, enable_checker = \
-            self.dhcp_cfg_generator.generate()
+            self.dhcp_cfg_generator.generate(unchanged_tables)
         if self.enabled_checker is not None and self.enabled_checker != enable_checker:
             # Has subcribe table and no equal, need to resubscribe
             self.dhcp_servd_monitor.disable_checkers(self.enabled_checker - enable_checker)
@@ -60,10 +65,21 @@ class DhcpServd(object):
         self.used_range = used_ranges
         self.enabled_dhcp_interfaces = enabled_dhcp_interfaces
         self.used_options = used_options
+        kea_dhcp4_config_hash = hashlib.sha256(kea_dhcp4_config.encode()).hexdigest()
+        if kea_dhcp4_config_hash == self.kea_dhcp4_config_hash:
+            syslog.syslog(syslog.LOG_INFO, "kea-dhcp4 config not changed, skip reload. Generated {} times, reloaded {} "
+                          "times".format(self.dhcp_cfg_generator.generate_count, self.reload_count))
+            return
         with open(self.kea_dhcp4_config_path, "w") as write_file:
             write_file.write(kea_dhcp4_config)
+        self.kea_dhcp4_config_hash = kea_dhcp4_config_hash
         # After refresh kea-config, we need to SIGHUP kea-dhcp4 process to read new config
         self._notify_kea_dhcp4_proc()
+        self.reload_count += 1
+        syslog.syslog(syslog.LOG_INFO, "kea-dhcp4 config reloaded. Generated {} times, reloaded {} times, subnets "
+                      "of DHCP interface recomputed {} times"
+                      .format(self.dhcp_cfg_generator.generate_count, self.reload_count,
+                              self.dhcp_cfg_generator.recomputed_subnet_count))
 
     def _update_dhcp_server_ip(self):
         """
@@ -540,3 +540,34 @@ def test_parse_dpus(mock_swsscommon_dbconnector_init, mock_get_render_template,
     mid_plane, dpus = dhcp_cfg_generator._parse_dpu(dpus_table, mid_plane_table)
     assert mid_plane == {"bridge": "bridge-midplane", "ip_prefix": "169.254.200.254/24"}
     assert dpus == set(["dpu0"])
+
+
+def test_generate_incremental(mock_swsscommon_dbconnector_init, mock_parse_port_map_alias):
+    mock_config_db = MockConfigDb(config_db_path="tests/test_data/mock_config_db.json")
+    monitored_tables = set(["DHCP_SERVER_IPV4", "DHCP_SERVER_IPV4_CUSTOMIZED_OPTIONS", "DHCP_SERVER_IPV4_RANGE",
+                            "DHCP_SERVER_IPV4_PORT", "VLAN_INTERFACE", "VLAN_MEMBER", "DPUS", "MID_PLANE_BRIDGE"])
+    with patch.object(DhcpDbConnector, "get_config_db_table",
+                      side_effect=mock_config_db.get_config_db_table) as mock_get_config_db_table:
+        dhcp_db_connector = DhcpDbConnector()
+        dhcp_cfg_generator = DhcpServCfgGenerator(dhcp_db_connector, "/usr/local/lib/kea/hooks/libdhcp_run_script.so",
+                                                  kea_conf_template_path="tests/test_data/kea-dhcp4.conf.j2")
+        kea_dhcp4_config = dhcp_cfg_generator.generate()[0]
+        assert dhcp_cfg_generator.recomputed_subnet_count == 1
+        # Verify that only table without checker is read again and subnets are not recomputed if nothing changed
+        mock_get_config_db_table.reset_mock()
+        assert dhcp_cfg_generator.generate(monitored_tables)[0] == kea_dhcp4_config
+        mock_get_config_db_table.assert_called_once_with("DEVICE_METADATA")
+        assert dhcp_cfg_generator.recomputed_subnet_count == 1
+        # Verify that unused range change doesn't recompute subnets
+        mock_config_db.config_db["DHCP_SERVER_IPV4_RANGE"]["range4"] = {"range": ["192.168.0.20"]}
+        assert dhcp_cfg_generator.generate(monitored_tables - set(["DHCP_SERVER_IPV4_RANGE"]))[0] == kea_dhcp4_config
+        assert dhcp_cfg_generator.recomputed_subnet_count == 1
+        # Verify that subnets of DHCP interface are recomputed when its range changed
+        mock_config_db.config_db["DHCP_SERVER_IPV4_RANGE"]["range1"] = {"range": ["192.168.0.2", "192.168.0.4"]}
+        new_kea_dhcp4_config = dhcp_cfg_generator.generate(monitored_tables - set(["DHCP_SERVER_IPV4_RANGE"]))[0]
+        assert dhcp_cfg_generator.recomputed_subnet_count == 2
+        assert new_kea_dhcp4_config != kea_dhcp4_config
+        # Verify that config is the same as config generated from scratch
+        dhcp_cfg_generator = DhcpServCfgGenerator(dhcp_db_connector, "/usr/local/lib/kea/hooks/libdhcp_run_script.so",
+                                                  kea_conf_template_path="tests/test_data/kea-dhcp4.conf.j2")
+        assert dhcp_cfg_generator.generate()[0] == new_kea_dhcp4_config
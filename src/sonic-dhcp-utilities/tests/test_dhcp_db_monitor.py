@@ -397,3 +397,19 @@ def test_dpus_table_checker(mock_swsscommon_dbconnector_init, tested_data):
         expected_res = tested_data["exp_res"]
         check_res = db_event_checker.check_update_event({})
         assert expected_res == check_res
+
+
+def test_dhcp_servd_monitor_get_unchanged_tables(mock_swsscommon_dbconnector_init):
+    with patch.object(swsscommon, "SubscriberStateTable"):
+        db_connector = DhcpDbConnector()
+        checkers = [VlanIntfTableEventChecker(MagicMock(), None), VlanMemberTableEventChecker(MagicMock(), None),
+                    DhcpPortTableEventChecker(MagicMock(), None)]
+        db_monitor = DhcpServdDbMonitor(db_connector, None, checkers)
+        db_monitor.enable_checkers(set(["VlanIntfTableEventChecker", "VlanMemberTableEventChecker"]))
+        # Tables of newly enabled checkers may be changed
+        assert db_monitor.get_unchanged_tables() == set()
+        assert db_monitor.get_unchanged_tables() == set(["VLAN_INTERFACE", "VLAN_MEMBER"])
+        checkers[1].subscriber_state_table.hasData.side_effect = [True, False]
+        checkers[1].subscriber_state_table.pop.return_value = ("Vlan1000|Ethernet0", "SET", ())
+        checkers[1].clear_event()
+        assert db_monitor.get_unchanged_tables() == set(["VLAN_INTERFACE"])
@@ -1,3 +1,5 @@
+import os
+import time
 from dhcp_utilities.common.utils import DhcpDbConnector
 from dhcp_utilities.dhcpservd.dhcp_lease import KeaDhcp4LeaseHandler, LeaseHanlder
 from freezegun import freeze_time
@@ -56,7 +58,7 @@ def test_read_kea_lease(mock_swsscommon_dbconnector_init):
 # Cannot mock built-in/extension type function(datetime.datetime.timestamp), need to free time
 @freeze_time("2023-09-08")
 def test_update_kea_lease(mock_swsscommon_dbconnector_init, mock_swsscommon_table_init):
-    tested_lease = expected_lease
+    tested_lease = dict(expected_lease)
     mock_lease_table = {
         "Vlan1000|aa:bb:cc:dd:ee:ff": {},
         "Vlan1000|10:70:fd:b6:13:00": {},
@@ -64,30 +66,38 @@ def test_update_kea_lease(mock_swsscommon_dbconnector_init, mock_swsscommon_tabl
         "Vlan1000|10:70:fd:b6:13:18": {}
     }
     with patch.object(swsscommon.Table, "getKeys"), \
-         patch.object(swsscommon.DBConnector, "hset") as mock_hset, \
+         patch.object(swsscommon, "RedisPipeline") as mock_pipe, \
+         patch.object(swsscommon, "RedisCommand") as mock_cmd, \
          patch.object(KeaDhcp4LeaseHandler, "_read", MagicMock(return_value=tested_lease)), \
          patch.object(DhcpDbConnector, "get_state_db_table",
-                      return_value=mock_lease_table), \
-         patch.object(swsscommon.DBConnector, "delete") as mock_delete, \
+                      return_value=mock_lease_table) as mock_get_state_db_table, \
          patch("time.sleep", return_value=None) as mock_sleep:
         db_connector = DhcpDbConnector()
         kea_lease_handler = KeaDhcp4LeaseHandler(db_connector)
         kea_lease_handler.update_lease()
+        mock_command = mock_cmd.return_value
         # Verify that old key was deleted
-        mock_delete.assert_has_calls([
+        mock_command.formatDEL.assert_has_calls([
             call("DHCP_SERVER_IPV4_LEASE|Vlan1000|10:70:fd:b6:13:00"),
             call("DHCP_SERVER_IPV4_LEASE|Vlan1000|10:70:fd:b6:13:17"),
             call("DHCP_SERVER_IPV4_LEASE|Vlan1000|aa:bb:cc:dd:ee:ff")
-        ])
+        ], any_order=True)
         # Verify that lease has been updated, to be noted that lease for "192.168.0.2" didn't been updated because
         # lease_start equals to lease_end
-        mock_hset.assert_has_calls([
-            call("DHCP_SERVER_IPV4_LEASE|Vlan1000|10:70:fd:b6:13:18", "lease_start", "1697607205"),
-            call("DHCP_SERVER_IPV4_LEASE|Vlan1000|10:70:fd:b6:13:18", "lease_end", "1697610805"),
-            call("DHCP_SERVER_IPV4_LEASE|Vlan1000|10:70:fd:b6:13:18", "ip", "193.168.0.132")
-        ])
+        mock_command.formatHSET.assert_called_once_with("DHCP_SERVER_IPV4_LEASE|Vlan1000|10:70:fd:b6:13:18", {
+            "lease_start": "1697607205",
+            "lease_end": "1697610805",
+            "ip": "193.168.0.132"
+        })
+        mock_pipe.return_value.flush.assert_called_once()
         kea_lease_handler.update_lease()
         mock_sleep.assert_called_once_with(2)
+        # Verify that unchanged lease is not written again and lease table is read only once
+        mock_command.formatHSET.assert_called_once()
+        assert mock_command.formatDEL.call_count == 3
+        mock_get_state_db_table.assert_called_once()
+        # Verify that released and expired leases are dropped from parsed leases
+        assert list(tested_lease.keys()) == ["Vlan1000|10:70:fd:b6:13:18"]
 
 
 def test_no_implement(mock_swsscommon_dbconnector_init):
@@ -102,3 +112,77 @@ def test_no_implement(mock_swsscommon_dbconnector_init):
             lease_handler.register()
         except NotImplementedError:
             pass
+
+
+def test_read_kea_lease_incremental(mock_swsscommon_dbconnector_init, tmpdir):
+    lease_file = tmpdir.join("kea-lease.csv")
+    with open("tests/test_data/kea-lease.csv", "r") as f:
+        lines = f.read().splitlines(keepends=True)
+    lease_file.write("".join(lines[:3]))
+    with patch.object(DhcpDbConnector, "get_config_db_table", side_effect=mock_get_config_db_table):
+        db_connector = DhcpDbConnector()
+        kea_lease_handler = KeaDhcp4LeaseHandler(db_connector, lease_file=str(lease_file))
+        lease = kea_lease_handler._read()
+        assert lease["Vlan1000|10:70:fd:b6:13:17"]["lease_end"] == "1694000909"
+        # Verify that row being written is parsed after it is completed
+        lease_file.write("".join(lines[3:7]) + lines[7][:20], mode="a")
+        lease = kea_lease_handler._read()
+        assert "Vlan2000|10:70:fd:b6:13:15" not in lease
+        # Verify that rest of rotated file is read and new lease file is read from the beginning
+        lease_file.write(lines[7][20:], mode="a")
+        os.rename(str(lease_file), str(lease_file) + ".2")
+        lease_file.write(lines[0] + "".join(lines[8:]))
+        lease = kea_lease_handler._read()
+        assert lease == expected_lease
+        # Verify that truncated lease file is read from the beginning
+        lease_file.write(lines[0])
+        assert kea_lease_handler._read() == {}
+        lease_file.write(lines[1], mode="a")
+        lease = kea_lease_handler._read()
+        assert lease == {"Vlan1000|10:70:fd:b6:13:00": {
+            "lease_start": "1693997305",
+            "lease_end": "1694000905",
+            "ip": "192.168.0.2"
+        }}
+        # Verify that leases in files of kea-lfc are read on start
+        kea_lease_handler = KeaDhcp4LeaseHandler(db_connector, lease_file=str(lease_file))
+        lease = kea_lease_handler._read()
+        assert lease["Vlan2000|10:70:fd:b6:13:15"]["ip"] == "193.168.2.2"
+        assert lease["Vlan1000|10:70:fd:b6:13:00"]["lease_end"] == "1694000905"
+
+
+def test_update_kea_lease_churn(mock_swsscommon_dbconnector_init, tmpdir):
+    lease_count = 5000
+    churn_count = 2000
+    lease_file = tmpdir.join("kea-lease.csv")
+    curr_time = int(time.time())
+
+    def lease_row(index, valid_lifetime, expire):
+        return "10.0.{}.{},02:00:00:{:02x}:{:02x}:{:02x},,{},{},1000,0,0,,0,,0\n" \
+            .format(index >> 8 & 0xff, index & 0xff, index >> 16 & 0xff, index >> 8 & 0xff, index & 0xff,
+                    valid_lifetime, expire)
+
+    lease_file.write("address,hwaddr,client_id,valid_lifetime,expire,subnet_id,fqdn_fwd,fqdn_rev,hostname,state,"
+                     "user_context,pool_id\n" +
+                     "".join(lease_row(i, 3600, curr_time + 3600) for i in range(lease_count)))
+    with patch.object(DhcpDbConnector, "get_config_db_table", side_effect=mock_get_config_db_table), \
+         patch.object(DhcpDbConnector, "get_state_db_table", return_value={}), \
+         patch.object(swsscommon, "RedisPipeline") as mock_pipe, \
+         patch.object(swsscommon, "RedisCommand") as mock_cmd:
+        db_connector = DhcpDbConnector()
+        kea_lease_handler = KeaDhcp4LeaseHandler(db_connector, lease_file=str(lease_file))
+        kea_lease_handler.update_lease()
+        mock_command = mock_cmd.return_value
+        assert mock_command.formatHSET.call_count == lease_count
+
+        # Half of churned clients renew lease, the others release it
+        lease_file.write("".join(lease_row(i, 3600, curr_time + 7200) if i % 2 else lease_row(i, 0, curr_time)
+                                 for i in range(churn_count)), mode="a")
+        mock_cmd.reset_mock()
+        mock_pipe.reset_mock()
+        kea_lease_handler.last_update_time = None
+        kea_lease_handler.update_lease()
+        assert mock_command.formatHSET.call_count == churn_count // 2
+        assert mock_command.formatDEL.call_count == churn_count // 2
+        mock_pipe.return_value.flush.assert_called_once()
+        assert len(kea_lease_handler.lease) == lease_count - churn_count // 2
@@ -37,6 +37,7 @@ def test_dump_dhcp4_config(mock_swsscommon_dbconnector_init, enabled_checker):
                       new_callable=PropertyMock), \
          patch.object(DhcpServdDbMonitor, "disable_checkers") as mock_unsubscribe, \
          patch.object(DhcpServdDbMonitor, "enable_checkers") as mock_subscribe, \
+         patch.object(DhcpServdDbMonitor, "get_unchanged_tables", return_value=set(["VLAN"])), \
          patch.object(DhcpServd, "enabled_checker", return_value=enabled_checker, new_callable=PropertyMock), \
          patch.object(DhcpServCfgGenerator, "_parse_port_map_alias"):
         dhcp_db_connector = DhcpDbConnector()
@@ -45,8 +46,8 @@ def test_dump_dhcp4_config(mock_swsscommon_dbconnector_init, enabled_checker):
         dhcpservd = DhcpServd(dhcp_cfg_generator, dhcp_db_connector, None,
                               kea_dhcp4_config_path="/tmp/kea-dhcp4.conf")
         dhcpservd.dump_dhcp4_config()
-        # Verfiy whether generate() func of dhcp_cfggen is called
-        mock_generate.assert_called_once_with()
+        # Verfiy whether generate() func of dhcp_cfggen is called, cached tables are used after checkers enabled
+        mock_generate.assert_called_once_with(set() if enabled_checker is None else set(["VLAN"]))
         with open("tests/test_data/test_kea_config.conf", "r") as file, \
              open("/tmp/kea-dhcp4.conf", "r") as output:
             expected_content = file.read()
@@ -60,6 +61,10 @@ def test_dump_dhcp4_config(mock_swsscommon_dbconnector_init, enabled_checker):
         else:
             mock_unsubscribe.assert_called_once_with(enabled_checker - new_enabled_checker)
             mock_subscribe.assert_called_once_with(new_enabled_checker - enabled_checker)
+        # Verify that kea-dhcp4 is not reloaded when config not changed
+        dhcpservd.dump_dhcp4_config()
+        mock_notify_kea_dhcp4_proc.assert_called_once_with()
+        assert dhcpservd.reload_count == 1
 
 
 @pytest.mark.parametrize("process_list", [["proc1", "proc2", "kea-dhcp4"], ["proc1", "proc2"]])
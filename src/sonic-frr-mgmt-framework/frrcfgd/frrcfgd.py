@@ -1497,9 +1497,12 @@ def hdl_admin_status_shutdown_msg(daemon, cmd_str, op, st_idx, args, data):
     return cmd_list
 
 class ExtConfigDBConnector(ConfigDBConnector):
+    # max number of keyspace notifications drained from pubsub in one burst
+    MAX_BURST_SIZE = 1000
     def __init__(self, ns_attrs = None):
         super(ExtConfigDBConnector, self).__init__()
         self.nosort_attrs = ns_attrs if ns_attrs is not None else {}
+        self.batch_handlers = {}
         self.__listen_thread_running = False
     def raw_to_typed(self, raw_data, table = ''):
         if len(raw_data) == 0:
@@ -1511,17 +1514,61 @@ class ExtConfigDBConnector(ConfigDBConnector):
             if type(val) is list and key not in self.nosort_attrs.get(table, set()):
                 val.sort()
         return data
+    def subscribe_batch(self, table, handler):
+        """Register a handler receiving all changed rows of a table in one burst as list of (row, data).
+        It is used instead of the per-row handler registered by subscribe().
+        """
+        self.batch_handlers[table] = handler
     def sub_msg_handler(self, msg_item):
-        if msg_item['type'] == 'pmessage':
+        self.sub_msg_burst_handler([msg_item])
+
+    @staticmethod
+    def __hgetall_list(client, key_list):
+        if hasattr(client, 'pipeline'):
+            pipe = client.pipeline(transaction = False)
+            for key in key_list:
+                pipe.hgetall(key)
+            return pipe.execute()
+        return [client.hgetall(key) for key in key_list]
+
+    def sub_msg_burst_handler(self, msg_list):
+        # keys changed multiple times in the burst are read and handled only once
+        key_list = []
+        key_set = set()
+        for msg_item in msg_list:
+            if msg_item['type'] != 'pmessage':
+                continue
             key = msg_item['channel'].split(':', 1)[1]
             try:
                 (table, row) = key.split(self.TABLE_NAME_SEPARATOR, 1)
-                if table in self.handlers:
-                    client = self.get_redis_client(self.db_name)
-                    data = self.raw_to_typed(client.hgetall(key), table)
-                    super(ExtConfigDBConnector, self)._ConfigDBConnector__fire(table, row, data)
             except ValueError:
-                pass    #Ignore non table-formated redis entries
+                continue    #Ignore non table-formated redis entries
+            if table in self.handlers and key not in key_set:
+                key_set.add(key)
+                key_list.append((key, table, row))
+        if len(key_list) == 0:
+            return
+        try:
+            client = self.get_redis_client(self.db_name)
+            raw_data_list = self.__hgetall_list(client, [key for key, _, _ in key_list])
+        except Exception as e:
+            syslog.syslog(syslog.LOG_ERR, '[bgp cfgd] Failed reading config DB update with exception:' + str(e))
+            logging.exception(e)
+            return
+        # consecutive rows of the same table are dispatched together, order of tables is kept
+        group_list = []
+        for (_, table, row), raw_data in zip(key_list, raw_data_list):
+            if len(group_list) == 0 or group_list[-1][0] != table:
+                group_list.append((table, []))
+            group_list[-1][1].append((row, raw_data))
+        for table, row_list in group_list:
+            try:
+                row_list = [(row, self.raw_to_typed(raw_data, table)) for row, raw_data in row_list]
+                if table in self.batch_handlers:
+                    self.batch_handlers[table](table, row_list)
+                else:
+                    for row, data in row_list:
+                        super(ExtConfigDBConnector, self)._ConfigDBConnector__fire(table, row, data)
             except Exception as e:
                 syslog.syslog(syslog.LOG_ERR, '[bgp cfgd] Failed handling config DB update with exception:' + str(e))
                 logging.exception(e)
@@ -1533,7 +1580,14 @@ class ExtConfigDBConnector(ConfigDBConnector):
         while self.__listen_thread_running:
             msg = self.pubsub.get_message(timeout, True)
             if msg:
-                self.sub_msg_handler(msg)
+                # drain the notifications which are already pending to handle them as one burst
+                msg_list = [msg]
+                while len(msg_list) < self.MAX_BURST_SIZE:
+                    msg = self.pubsub.get_message(0, True)
+                    if not msg:
+                        break
+                    msg_list.append(msg)
+                self.sub_msg_burst_handler(msg_list)
 
         self.pubsub.punsubscribe(sub_key_space)
 
@@ -2329,7 +2383,9 @@ class BGPConfigDaemon:
             ('SRV6_MY_SOURCE', self.bgp_table_handler_common),
             ('SRV6_MY_SIDS', self.bgp_table_handler_common),
         ]
+        self.table_handler_map = dict(self.table_handler_list)
         self.bgp_message = queue.Queue(0)
+        self.defer_bgp_update = False
         self.table_data_cache = self.config_db.get_table_data([tbl for tbl, _ in self.table_handler_list])
         syslog.syslog(syslog.LOG_DEBUG, 'Init Cached DB data')
         for key, entry in self.table_data_cache.items():
@@ -2352,6 +2408,7 @@ class BGPConfigDaemon:
     def subscribe_all(self):
         for table, hdlr in self.table_handler_list:
             self.config_db.subscribe(table, hdlr)
+            self.config_db.subscribe_batch(table, self.bgp_batch_handler)
 
     @staticmethod
     def __run_command(table, command, daemons = None):
@@ -3893,12 +3950,31 @@ class BGPConfigDaemon:
         table_key = ExtConfigDBConnector.get_table_key(table, key)
         self.__add_op_to_data(table_key, data, comb_attr_list)
         self.bgp_message.put((key, del_table, table, data))
+        if not self.defer_bgp_update:
+            self.__flush_bgp_message()
+
+    def __flush_bgp_message(self):
         upd_data_list = []
         self.__update_bgp(upd_data_list)
         for table, key, data in upd_data_list:
             table_key = ExtConfigDBConnector.get_table_key(table, key)
             self.__update_cache_data(table_key, data)
 
+    def bgp_batch_handler(self, table, row_list):
+        # queue updates of all rows and apply them to FRR in one __update_bgp pass
+        hdlr = self.table_handler_map[table]
+        self.defer_bgp_update = True
+        try:
+            for key, data in row_list:
+                try:
+                    hdlr(table, key, data)
+                except Exception as e:
+                    syslog.syslog(syslog.LOG_ERR, '[bgp cfgd] Failed handling config DB update with exception:' + str(e))
+                    logging.exception(e)
+        finally:
+            self.defer_bgp_update = False
+        self.__flush_bgp_message()
+
     def bgp_global_handler(self, table, key, data):
         self.bgp_table_handler_common(table, key, data, [{'keepalive', 'holdtime'}])
 
@@ -13,6 +13,7 @@ def test_contructor():
     daemon.start()
     for table, hdlr in daemon.table_handler_list:
         daemon.config_db.subscribe.assert_any_call(table, hdlr)
+        assert(daemon.config_db.batch_handlers[table] == daemon.bgp_batch_handler)
     daemon.config_db.pubsub.psubscribe.assert_called_once()
     assert(daemon.config_db.sub_thread.is_alive() == True)
     daemon.stop()
@@ -266,3 +267,54 @@ def test_bgp_neighbor_shutdown():
     # The neighbor shutdown msg test cases explicitly verify delete behavior, so skip the delete
     # verification data_set_del_test (else it would try the del of 'no ' commands as well and fail)
     data_set_del_test(neighbor_shutdown_data, skip_del=True)
+
+@patch.dict('sys.modules', **mockmapping)
+def test_sub_msg_burst_handler():
+    from frrcfgd.frrcfgd import BGPConfigDaemon
+    daemon = BGPConfigDaemon()
+    config_db = daemon.config_db
+    config_db.TABLE_NAME_SEPARATOR = '|'
+    config_db.handlers = {'BGP_NEIGHBOR_AF': MagicMock(), 'ROUTE_MAP': MagicMock()}
+    batch_hdlr = MagicMock()
+    config_db.subscribe_batch('BGP_NEIGHBOR_AF', batch_hdlr)
+    client = MagicMock()
+    client.pipeline.return_value.execute.return_value = [{'admin_status': 'true'}, {}, {'route_operation': 'permit'}]
+    config_db.get_redis_client.return_value = client
+    config_db.raw_to_typed = lambda raw_data, table: raw_data if len(raw_data) > 0 else None
+    channel = '__keyspace@4__:%s'
+    msg_list = [
+        {'type': 'psubscribe', 'channel': '__keyspace@4__:*'},
+        {'type': 'pmessage', 'channel': channel % 'BGP_NEIGHBOR_AF|default|10.0.0.1|ipv4_unicast'},
+        {'type': 'pmessage', 'channel': channel % 'BGP_NEIGHBOR_AF|default|10.0.0.2|ipv4_unicast'},
+        {'type': 'pmessage', 'channel': channel % 'BGP_NEIGHBOR_AF|default|10.0.0.1|ipv4_unicast'},
+        {'type': 'pmessage', 'channel': channel % 'PORT|Ethernet0'},
+        {'type': 'pmessage', 'channel': channel % 'no_table_key'},
+        {'type': 'pmessage', 'channel': channel % 'ROUTE_MAP|map1|10'},
+    ]
+    with patch.object(swsscommon_module_mock.ConfigDBConnector, '_ConfigDBConnector__fire', create = True) as fire:
+        config_db.sub_msg_burst_handler(msg_list)
+    pipe = client.pipeline.return_value
+    assert([c[0][0] for c in pipe.hgetall.call_args_list] == ['BGP_NEIGHBOR_AF|default|10.0.0.1|ipv4_unicast',
+                                                             'BGP_NEIGHBOR_AF|default|10.0.0.2|ipv4_unicast',
+                                                             'ROUTE_MAP|map1|10'])
+    pipe.execute.assert_called_once()
+    client.hgetall.assert_not_called()
+    batch_hdlr.assert_called_once_with('BGP_NEIGHBOR_AF', [('default|10.0.0.1|ipv4_unicast', {'admin_status': 'true'}),
+                                                           ('default|10.0.0.2|ipv4_unicast', None)])
+    fire.assert_called_once_with('ROUTE_MAP', 'map1|10', {'route_operation': 'permit'})
+
+@patch.dict('sys.modules', **mockmapping)
+@patch('frrcfgd.frrcfgd.g_run_command')
+def test_bgp_batch_handler(run_cmd):
+    from frrcfgd.frrcfgd import BGPConfigDaemon
+    daemon = BGPConfigDaemon()
+    daemon.bgp_batch_handler('BGP_GLOBALS', [('default', {'local_asn': '100'})])
+    run_cmd.reset_mock()
+    with patch.object(daemon, '_BGPConfigDaemon__update_bgp', wraps = daemon._BGPConfigDaemon__update_bgp) as update_bgp:
+        daemon.bgp_batch_handler('BGP_NEIGHBOR', [('default|10.1.1.1', {'admin_status': 'up'}),
+                                                  ('default|10.1.1.2', {'admin_status': 'down'})])
+    update_bgp.assert_called_once()
+    run_cmd.assert_any_call('BGP_NEIGHBOR', CmdMapTestInfo.compose_vtysh_cmd(conf_bgp_cmd('default', 100) +
+                                                                            ['no neighbor 10.1.1.1 shutdown']), True, None, False)
+    run_cmd.assert_any_call('BGP_NEIGHBOR', CmdMapTestInfo.compose_vtysh_cmd(conf_bgp_cmd('default', 100) +
+                                                                            ['neighbor 10.1.1.2 shutdown']), True, None, False)
@@ -1,10 +1,14 @@
+import ctypes
 import glob
 import hashlib
 import json
 import os
 import random
 import re
+import socket
+import struct
 import subprocess
+import threading
 import yaml
 from natsort import natsorted
 from sonic_py_common.general import getstatusoutput_noshell_pipe
@@ -52,16 +56,153 @@ CHASSIS_INFO_REV_FIELD = 'revision'
 # DPU constants
 DPU_NAME_PREFIX = "dpu"
 
+# System MAC discovery
+SYSFS_NET_PATH = "/sys/class/net"
+SYSEEPROM_MAC_CACHE_FILE = "/var/cache/sonic/decode-syseeprom/base_mac"
+
 # Cacheable Objects
 sonic_ver_info = {}
 hw_info_dict = {}
+device_context = None
+
+
+class DeviceContext(object):
+    """
+    Process-wide cache of the device identity data.
+
+    Parsed content of machine.conf, sonic_version.yml, asic.conf and
+    platform_env.conf is kept until the file mtime or size changes.
+    A single connected ConfigDBConnector is reused for DEVICE_METADATA reads.
+    The counters show how many file reads and DB connections were saved.
+    """
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._files = {}
+        self._config_db = None
+        self.counters = {}
+        self.refresh()
+
+    def refresh(self):
+        """
+        Drop all cached data, the next calls re-read the files and reconnect to ConfigDB
+        """
+        with self._lock:
+            self._files = {}
+            self._config_db = None
+            self.counters = {
+                'file_reads': 0,
+                'file_reads_saved': 0,
+                'db_connections': 0,
+                'db_connections_saved': 0
+            }
+
+    def read_file(self, path, parser):
+        """
+        Retrieve parsed content of a file
+
+        Args:
+            path: path to the file
+            parser: a function which receives the opened file and returns the parsed content
+
+        Returns:
+            The parsed content of the file, None if the file doesn't exist
+        """
+        with self._lock:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                self._files.pop(path, None)
+                return None
+
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._files.get(path)
+            if cached is not None and cached[0] == signature:
+                self.counters['file_reads_saved'] += 1
+                return cached[1]
+
+            with open(path) as f:
+                data = parser(f)
+            self.counters['file_reads'] += 1
+            self._files[path] = (signature, data)
+            return data
+
+    def get_config_db(self):
+        """
+        Retrieve a connected ConfigDBConnector shared by the callers of the context
+        """
+        with self._lock:
+            if self._config_db is None:
+                config_db = ConfigDBConnector()
+                config_db.connect()
+                self._config_db = config_db
+                self.counters['db_connections'] += 1
+            else:
+                self.counters['db_connections_saved'] += 1
+            return self._config_db
+
+    def get_counters(self):
+        with self._lock:
+            return dict(self.counters)
+
+
+def enable_device_context():
+    """
+    Enable the process-wide DeviceContext cache, used by the functions of this module
+
+    Returns:
+        The DeviceContext object
+    """
+    global device_context
+    if device_context is None:
+        device_context = DeviceContext()
+    return device_context
+
+
+def disable_device_context():
+    global device_context
+    device_context = None
+
+
+def get_device_context():
+    """
+    Returns:
+        The DeviceContext object if it is enabled, None otherwise
+    """
+    return device_context
+
+
+def _parse_conf_file(conf_file):
+    """
+    Parse 'key=value' lines of a configuration file
+
+    Returns:
+        A list of (key, value) tuples in the file order
+    """
+    conf_vars = []
+    for line in conf_file:
+        tokens = line.split('=')
+        if len(tokens) < 2:
+            continue
+        conf_vars.append((tokens[0], tokens[1].strip()))
+    return conf_vars
+
+
+def _read_conf_file(path):
+    if device_context is not None:
+        return device_context.read_file(path, _parse_conf_file)
+    with open(path) as conf_file:
+        return _parse_conf_file(conf_file)
+
 
 def get_localhost_info(field, config_db=None):
     try:
         # TODO: enforce caller to provide config_db explicitly and remove its default value
         if not config_db:
-            config_db = ConfigDBConnector()
-            config_db.connect()
+            if device_context is not None:
+                config_db = device_context.get_config_db()
+            else:
+                config_db = ConfigDBConnector()
+                config_db.connect()
 
         metadata = config_db.get_table('DEVICE_METADATA')
 
@@ -88,15 +229,7 @@ def get_machine_info():
     if not os.path.isfile(MACHINE_CONF_PATH):
         return None
 
-    machine_vars = {}
-    with open(MACHINE_CONF_PATH) as machine_conf_file:
-        for line in machine_conf_file:
-            tokens = line.split('=')
-            if len(tokens) < 2:
-                continue
-            machine_vars[tokens[0]] = tokens[1].strip()
-
-    return machine_vars
+    return dict(_read_conf_file(MACHINE_CONF_PATH))
 
 def get_platform(**kwargs):
     """
@@ -504,19 +637,25 @@ def get_path_to_port_config_file(hwsku=None, asic=None):
 
     return None
 
+def _load_sonic_version_yaml(stream):
+    if yaml.__version__ >= "5.1":
+        return yaml.full_load(stream)
+    return yaml.safe_load(stream)
+
+
 def get_sonic_version_info():
     if not os.path.isfile(SONIC_VERSION_YAML_PATH):
         return None
 
+    if device_context is not None:
+        return device_context.read_file(SONIC_VERSION_YAML_PATH, _load_sonic_version_yaml)
+
     global sonic_ver_info
     if sonic_ver_info:
         return sonic_ver_info
 
     with open(SONIC_VERSION_YAML_PATH) as stream:
-        if yaml.__version__ >= "5.1":
-            sonic_ver_info = yaml.full_load(stream)
-        else:
-            sonic_ver_info = yaml.safe_load(stream)
+        sonic_ver_info = _load_sonic_version_yaml(stream)
 
     return sonic_ver_info
 
@@ -599,14 +738,10 @@ def get_num_npus():
     asic_conf_file_path = get_asic_conf_file_path()
     if asic_conf_file_path is None:
         return 1
-    with open(asic_conf_file_path) as asic_conf_file:
-        for line in asic_conf_file:
-            tokens = line.split('=')
-            if len(tokens) < 2:
-               continue
-            if tokens[0].lower() == 'num_asic':
-                num_npus = tokens[1].strip()
-        return int(num_npus)
+    for key, val in _read_conf_file(asic_conf_file_path):
+        if key.lower() == 'num_asic':
+            num_npus = val
+    return int(num_npus)
 
 
 def is_multi_npu():
@@ -638,16 +773,10 @@ def is_disaggregated_chassis():
     platform_env_conf_file_path = get_platform_env_conf_file_path()
     if platform_env_conf_file_path is None:
         return False
-    with open(platform_env_conf_file_path) as platform_env_conf_file:
-        for line in platform_env_conf_file:
-            tokens = line.split('=')
-            if len(tokens) < 2:
-               continue
-            if tokens[0] == 'disaggregated_chassis':
-                val = tokens[1].strip()
-                if val == '1':
-                    return True
-        return False
+    for key, val in _read_conf_file(platform_env_conf_file_path):
+        if key == 'disaggregated_chassis' and val == '1':
+            return True
+    return False
 
 
 def is_virtual_chassis():
@@ -695,16 +824,10 @@ def is_supervisor():
     platform_env_conf_file_path = get_platform_env_conf_file_path()
     if platform_env_conf_file_path is None:
         return False
-    with open(platform_env_conf_file_path) as platform_env_conf_file:
-        for line in platform_env_conf_file:
-            tokens = line.split('=')
-            if len(tokens) < 2:
-               continue
-            if tokens[0].lower() == 'supervisor':
-                val = tokens[1].strip()
-                if val == '1':
-                    return True
-        return False
+    for key, val in _read_conf_file(platform_env_conf_file_path):
+        if key.lower() == 'supervisor' and val == '1':
+            return True
+    return False
 
 # Check if this platform has macsec capability.
 def is_macsec_supported():
@@ -716,14 +839,10 @@ def is_macsec_supported():
         return supported
 
     # Else open the file check for keyword - macsec_enabled -
-    with open(platform_env_conf_file_path) as platform_env_conf_file:
-        for line in platform_env_conf_file:
-            tokens = line.split('=')
-            if len(tokens) < 2:
-               continue
-            if tokens[0].lower() == 'macsec_enabled':
-                supported = tokens[1].strip()
-                break
+    for key, val in _read_conf_file(platform_env_conf_file_path):
+        if key.lower() == 'macsec_enabled':
+            supported = val
+            break
     return int(supported)
 
 
@@ -831,12 +950,157 @@ def generate_mac_for_vs(hostname, namespace):
 
     return _modify_mac_for_asic(mac, namespace)
 
+def _get_link_mac(ifname):
+    """
+    Read the MAC address of a network interface from sysfs
+
+    Returns:
+        A tuple (mac, err) in the format of run_command()
+    """
+    try:
+        with open(os.path.join(SYSFS_NET_PATH, ifname, "address")) as address_file:
+            return (address_file.read(), None)
+    except (IOError, OSError) as e:
+        return ("", str(e))
+
+
+# rtnetlink definitions used by _get_netns_link_mac()
+_CLONE_NEWNET = 0x40000000
+_NETLINK_ROUTE = 0
+_NLMSG_ERROR = 2
+_NLMSG_HDR = struct.Struct("=IHHII")         # length, type, flags, sequence, pid
+_IFINFOMSG = struct.Struct("=BxHiII")        # family, type, index, flags, change
+_RTATTR = struct.Struct("=HH")               # length, type
+_RTM_NEWLINK = 16
+_RTM_GETLINK = 18
+_NLM_F_REQUEST = 1
+_IFLA_ADDRESS = 1
+_IFLA_IFNAME = 3
+
+
+def _open_netns_netlink_socket(namespace):
+    """
+    Open a rtnetlink socket in the network namespace 'namespace'.
+    A socket stays in the namespace where it was created, so the calling thread
+    switches to the namespace only to create the socket. A separate thread is used
+    to keep the namespace of the caller untouched.
+    """
+    result = {}
+
+    def worker():
+        libc = ctypes.CDLL(None, use_errno=True)
+        try:
+            own_ns = os.open("/proc/self/task/{}/ns/net".format(threading.get_native_id()), os.O_RDONLY)
+            target_ns = os.open(os.path.join("/run/netns", namespace), os.O_RDONLY)
+        except OSError as e:
+            result['err'] = str(e)
+            return
+        try:
+            if libc.setns(target_ns, _CLONE_NEWNET) != 0:
+                result['err'] = os.strerror(ctypes.get_errno())
+                return
+            try:
+                result['sock'] = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, _NETLINK_ROUTE)
+            finally:
+                libc.setns(own_ns, _CLONE_NEWNET)
+        finally:
+            os.close(own_ns)
+            os.close(target_ns)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    return result.get('sock'), result.get('err')
+
+
+def _get_netns_link_mac(namespace, ifname):
+    """
+    Read the MAC address of a network interface in a network namespace with a RTM_GETLINK request
+
+    Returns:
+        A tuple (mac, err) in the format of run_command()
+    """
+    sock, err = _open_netns_netlink_socket(namespace)
+    if sock is None:
+        return ("", err)
+
+    with sock:
+        name = ifname.encode() + b"\0"
+        attr_len = _RTATTR.size + len(name)
+        attr = _RTATTR.pack(attr_len, _IFLA_IFNAME) + name + b"\0" * ((4 - attr_len % 4) % 4)
+        body = _IFINFOMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0) + attr
+        sock.sendto(_NLMSG_HDR.pack(_NLMSG_HDR.size + len(body), _RTM_GETLINK, _NLM_F_REQUEST, 1, 0) + body, (0, 0))
+        reply = sock.recv(65536)
+
+    msg_len, msg_type, _, _, _ = _NLMSG_HDR.unpack_from(reply)
+    if msg_type == _NLMSG_ERROR:
+        errno = -struct.unpack_from("=i", reply, _NLMSG_HDR.size)[0]
+        return ("", "RTM_GETLINK {} failed: {}".format(ifname, os.strerror(errno)))
+    if msg_type != _RTM_NEWLINK:
+        return ("", "RTM_GETLINK {}: unexpected reply type {}".format(ifname, msg_type))
+
+    offset = _NLMSG_HDR.size + _IFINFOMSG.size
+    while offset + _RTATTR.size <= msg_len:
+        rta_len, rta_type = _RTATTR.unpack_from(reply, offset)
+        if rta_len < _RTATTR.size:
+            break
+        if rta_type == _IFLA_ADDRESS:
+            value = reply[offset + _RTATTR.size:offset + rta_len]
+            return (':'.join('{:02x}'.format(byte) for byte in value), None)
+        offset += (rta_len + 3) & ~3
+
+    return ("", "RTM_GETLINK {}: no link address".format(ifname))
+
+
+def _get_profile_value(profile_file, key):
+    """
+    Retrieve the value of the first line of profile.ini containing 'key'
+
+    Returns:
+        A tuple (value, err) in the format of run_command()
+    """
+    try:
+        with open(profile_file) as profile:
+            for line in profile:
+                if key in line:
+                    tokens = line.split('=')
+                    return (tokens[1] if len(tokens) > 1 else line, None)
+    except (IOError, OSError) as e:
+        return ("", str(e))
+    return ("", "{} not found in {}".format(key, profile_file))
+
+
+def _get_syseeprom_mac():
+    """
+    Retrieve the base MAC address from syseeprom.
+    decode-syseeprom is executed only once, its result is kept in SYSEEPROM_MAC_CACHE_FILE
+
+    Returns:
+        A tuple (mac, err) in the format of run_command()
+    """
+    try:
+        with open(SYSEEPROM_MAC_CACHE_FILE) as cache_file:
+            mac = cache_file.read().strip()
+        if _valid_mac_address(mac):
+            return (mac, None)
+    except (IOError, OSError):
+        pass
+
+    (mac, err) = run_command(["sudo", "decode-syseeprom", "-m"])
+    if not err and _valid_mac_address(mac.strip()):
+        try:
+            os.makedirs(os.path.dirname(SYSEEPROM_MAC_CACHE_FILE), exist_ok=True)
+            tmp_file = SYSEEPROM_MAC_CACHE_FILE + ".tmp"
+            with open(tmp_file, "w") as cache_file:
+                cache_file.write(mac.strip())
+            os.rename(tmp_file, SYSEEPROM_MAC_CACHE_FILE)
+        except (IOError, OSError):
+            pass
+    return (mac, err)
+
+
 def get_system_mac(namespace=None, hostname=None):
     hw_mac_entry_outputs = []
-    syseeprom_cmd = ["sudo", "decode-syseeprom", "-m"]
-    iplink_cmd0 = ["ip", 'link', 'show', 'eth0']
-    iplink_cmd1 = ['grep', 'ether']
-    iplink_cmd2 = ['awk', '{print $2}']
     version_info = get_sonic_version_info()
     platform = get_platform()
 
@@ -857,41 +1121,29 @@ def get_system_mac(namespace=None, hostname=None):
             if _valid_mac_address(mac):
                 return mac
 
-        (mac, err) = run_command(syseeprom_cmd)
+        (mac, err) = _get_syseeprom_mac()
         hw_mac_entry_outputs.append((mac, err))
     elif (version_info['asic_type'] == 'marvell-prestera'):
         # Try valid mac in eeprom, else fetch it from eth0
         machine_key = "onie_machine"
         machine_vars = get_machine_info()
-        (mac, err) = run_command(syseeprom_cmd)
+        (mac, err) = _get_syseeprom_mac()
         hw_mac_entry_outputs.append((mac, err))
         if machine_vars is not None and machine_key in machine_vars:
             hwsku = machine_vars[machine_key]
             profile_file = HOST_DEVICE_PATH + '/' + platform + '/' + hwsku + '/profile.ini'
             if os.path.exists(profile_file):
-                profile_cmd0 = ['cat', profile_file]
-                profile_cmd1 = ['grep', 'switchMacAddress']
-                profile_cmd2 = ['cut', '-f2', '-d', '=']
-                (mac, err) = run_command_pipe(profile_cmd0, profile_cmd1, profile_cmd2)
+                (mac, err) = _get_profile_value(profile_file, 'switchMacAddress')
                 hw_mac_entry_outputs.append((mac, err))
-        else:
-            profile_cmd = ["false"]
-            (mac, err) = run_command(profile_cmd)
-            hw_mac_entry_outputs.append((mac, err))
-        (mac, err) = run_command_pipe(iplink_cmd0, iplink_cmd1, iplink_cmd2)
+        (mac, err) = _get_link_mac('eth0')
         hw_mac_entry_outputs.append((mac, err))
     elif (version_info['asic_type'] == 'cisco-8000'):
         # Try to get valid MAC from profile.ini first, else fetch it from syseeprom or eth0
         if namespace is not None:
-            profile_cmd0 = ['cat', HOST_DEVICE_PATH + '/' + platform + '/profile.ini']
-            profile_cmd1 = ['grep', str(namespace)+'switchMacAddress']
-            profile_cmd2 = ['cut', '-f2', '-d', '=']
-            (mac, err) = run_command_pipe(profile_cmd0, profile_cmd1, profile_cmd2)
-        else:
-            profile_cmd = ["false"]
-            (mac, err) = run_command(profile_cmd)
-        hw_mac_entry_outputs.append((mac, err))
-        (mac, err) = run_command_pipe(iplink_cmd0, iplink_cmd1, iplink_cmd2)
+            profile_file = HOST_DEVICE_PATH + '/' + platform + '/profile.ini'
+            (mac, err) = _get_profile_value(profile_file, str(namespace) + 'switchMacAddress')
+            hw_mac_entry_outputs.append((mac, err))
+        (mac, err) = _get_link_mac('eth0')
         hw_mac_entry_outputs.append((mac, err))
         mac_found = False
         for (mac, err) in hw_mac_entry_outputs:
@@ -904,17 +1156,20 @@ def get_system_mac(namespace=None, hostname=None):
         # If mac not found, fetch from syseeprom
         if not mac_found:
             hw_mac_entry_outputs = []
-            (mac, err) = run_command(syseeprom_cmd)
+            (mac, err) = _get_syseeprom_mac()
             hw_mac_entry_outputs.append((mac, err))
     elif (version_info['asic_type'] == 'pensando'):
-        iplink_cmd0 = ["ip", 'link', 'show', 'eth0-midplane']
-        (mac, err) = run_command_pipe(iplink_cmd0, iplink_cmd1, iplink_cmd2)
+        (mac, err) = _get_link_mac('eth0-midplane')
         hw_mac_entry_outputs.append((mac, err))
     else:
-        mac_address_cmd = ["cat", "/sys/class/net/eth0/address"]
         if namespace is not None:
-            mac_address_cmd = ['sudo', 'ip', 'netns', 'exec', str(namespace)] + mac_address_cmd
-        (mac, err) = run_command(mac_address_cmd)
+            (mac, err) = _get_netns_link_mac(namespace, 'eth0')
+            if err:
+                # Entering the namespace requires CAP_SYS_ADMIN, fall back to sudo
+                mac_address_cmd = ['sudo', 'ip', 'netns', 'exec', str(namespace), 'cat', SYSFS_NET_PATH + '/eth0/address']
+                (mac, err) = run_command(mac_address_cmd)
+        else:
+            (mac, err) = _get_link_mac('eth0')
         hw_mac_entry_outputs.append((mac, err))
 
     for (mac, err) in hw_mac_entry_outputs:
@@ -1,6 +1,8 @@
 import glob
 import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from natsort import natsorted
 from swsscommon import swsscommon
@@ -51,6 +53,102 @@ def connect_config_db_for_ns(namespace=DEFAULT_NAMESPACE):
     return config_db
 
 
+# Locks serializing the use of the cached config_db handles, see get_config_db_for_ns()
+config_db_handle_lock = {}
+config_db_handle_mutex = threading.Lock()
+
+
+def _get_cached_config_db(namespace):
+    with config_db_handle_mutex:
+        if namespace not in config_db_handle:
+            config_db_handle[namespace] = connect_config_db_for_ns(namespace)
+        if namespace not in config_db_handle_lock:
+            config_db_handle_lock[namespace] = threading.Lock()
+        return config_db_handle[namespace], config_db_handle_lock[namespace]
+
+
+def _drop_cached_config_db(namespace, config_db):
+    with config_db_handle_mutex:
+        if config_db_handle.get(namespace) is config_db:
+            del config_db_handle[namespace]
+
+
+def get_config_db_for_ns(namespace=DEFAULT_NAMESPACE):
+    """
+    The function returns a cached handle to the config DB for a given namespace.
+    The handle is connected on the first use and reused by the following calls,
+    unlike connect_config_db_for_ns() which opens a new connection on every call.
+    The handle of a namespace must not be used by several threads at the same time,
+    run_for_all_ns() guarantees it. The handle is not reconnected if the database
+    is restarted, run_for_all_ns() drops it on a connection error, other callers
+    should call clear_config_db_handles().
+    get_table_for_asic() and get_table_entry_for_asic() keep opening a new
+    connection on every call.
+
+    Returns:
+      handle to the config_db for a namespace
+    """
+    return _get_cached_config_db(namespace)[0]
+
+
+def clear_config_db_handles():
+    """
+    Drop all the cached config_db handles, e.g. after the databases were restarted
+    """
+    with config_db_handle_mutex:
+        config_db_handle.clear()
+        config_db_handle_lock.clear()
+
+
+def run_for_all_ns(func, namespace=None):
+    """
+    Runs func(config_db, namespace) for every namespace in get_namespace_list(namespace).
+    On multi ASIC platforms the namespaces are processed concurrently,
+    each one with its cached config_db handle. If the handle fails with a
+    connection error, e.g. after a database restart, it is dropped and func
+    is run once again with a new connection.
+
+    Returns:
+        a list of the func results in the order of the namespaces
+    """
+    ns_list = get_namespace_list(namespace)
+
+    def run(ns):
+        config_db, lock = _get_cached_config_db(ns)
+        with lock:
+            try:
+                return func(config_db, ns)
+            except (RuntimeError, ConnectionError):
+                _drop_cached_config_db(ns, config_db)
+        config_db, lock = _get_cached_config_db(ns)
+        with lock:
+            return func(config_db, ns)
+
+    if len(ns_list) == 1:
+        return [run(ns_list[0])]
+
+    with ThreadPoolExecutor(max_workers=len(ns_list)) as executor:
+        return list(executor.map(run, ns_list))
+
+
+def get_tables_all_ns(tables, namespace=None):
+    """
+    Retrieves the given tables from all the namespaces in one concurrent round
+
+    Returns:
+        a dict of table name to the table merged across namespaces
+    """
+    def read_tables(config_db, ns):
+        return [config_db.get_table(table) for table in tables]
+
+    merged_tables = {table: {} for table in tables}
+    for ns_tables in run_for_all_ns(read_tables, namespace):
+        for table, ns_table in zip(tables, ns_tables):
+            merged_tables[table].update(ns_table)
+
+    return merged_tables
+
+
 def connect_to_all_dbs_for_ns(namespace=DEFAULT_NAMESPACE):
     """
     The function connects to the DBs for a given namespace and
@@ -218,9 +316,7 @@ def get_all_namespaces():
     if is_multi_asic():
         for asic in range(num_asics):
             namespace = "{}{}".format(ASIC_NAME_PREFIX, asic)
-            if namespace not in config_db_handle:
-                config_db_handle[namespace] =  connect_config_db_for_ns(namespace)
-            config_db = config_db_handle[namespace]
+            config_db = get_config_db_for_ns(namespace)
 
             metadata = config_db.get_table('DEVICE_METADATA')
             if metadata['localhost']['sub_role'] == FRONTEND_ASIC_SUB_ROLE:
@@ -283,14 +379,7 @@ def get_table(table, namespace=None):
     Returns:
         a dict of all entries of table across namespaces
     """
-    merged_table = {}
-    ns_list = get_namespace_list(namespace)
-
-    for ns in ns_list:
-        ns_table = get_table_for_asic(table, ns)
-        merged_table.update(ns_table)
-
-    return merged_table
+    return get_tables_all_ns([table], namespace)[table]
 
 
 def get_port_entry_for_asic(port, namespace):
@@ -388,12 +477,10 @@ def is_port_channel_internal(port_channel, namespace=None):
     if not is_multi_asic():
         return False
 
-    ns_list = get_namespace_list(namespace)
-
-    for ns in ns_list:
-        config_db = connect_config_db_for_ns(ns)
-        port_channel_members = config_db.get_keys(PORT_CHANNEL_MEMBER_CFG_DB_TABLE)
+    ns_members = run_for_all_ns(
+        lambda config_db, ns: config_db.get_keys(PORT_CHANNEL_MEMBER_CFG_DB_TABLE), namespace)
 
+    for port_channel_members in ns_members:
         for port_channel_member in port_channel_members:
             if port_channel_member[0] != port_channel:
                 continue
@@ -408,16 +495,19 @@ def get_back_end_interface_set(namespace=None):
     if not is_multi_asic():
         return None
 
-    port_table = get_port_table(namespace)
+    # PORT and PORTCHANNEL_MEMBER tables of all namespaces are read in one round
+    ns_tables = run_for_all_ns(lambda config_db, ns: (config_db.get_table(PORT_CFG_DB_TABLE),
+                                                      config_db.get_keys(PORT_CHANNEL_MEMBER_CFG_DB_TABLE)),
+                               namespace)
+    port_table = {}
+    for ns_port_table, _ in ns_tables:
+        port_table.update(ns_port_table)
     for port, info in port_table.items():
         if PORT_ROLE in info and info[PORT_ROLE] == INTERNAL_PORT:
             bk_end_intf_list.append(port)
 
     if len(bk_end_intf_list):
-        ns_list = get_namespace_list(namespace)
-        for ns in ns_list:
-            config_db = connect_config_db_for_ns(ns)
-            port_channel_members = config_db.get_keys(PORT_CHANNEL_MEMBER_CFG_DB_TABLE)
+        for _, port_channel_members in ns_tables:
             # a back-end LAG must be configured with all of its member from back-end interfaces.
             # mixing back-end and front-end interfaces is miss configuration and not allowed.
             # To determine if a LAG is back-end LAG, just need to check its first member is back-end or not
@@ -434,11 +524,7 @@ def is_bgp_session_internal(bgp_neigh_ip, namespace=None):
     if not is_multi_asic() and not is_chassis():
         return False
 
-    ns_list = get_namespace_list(namespace)
-
-    for ns in ns_list:
-
-        config_db = connect_config_db_for_ns(ns)
+    def is_internal_for_ns(config_db, ns):
         bgp_sessions = config_db.get_entry(
             BGP_INTERNAL_NEIGH_CFG_DB_TABLE, bgp_neigh_ip
         )
@@ -451,7 +537,9 @@ def is_bgp_session_internal(bgp_neigh_ip, namespace=None):
         if bgp_sessions:
             return True
 
-    return False
+        return False
+
+    return any(run_for_all_ns(is_internal_for_ns, namespace))
 
 def get_front_end_namespaces():
     """
@@ -367,6 +367,84 @@ class TestDeviceInfo(object):
         mock_get_platform_json_data.return_value = {"DPUS": {"dpu0": {}, "dpu1": {}}}
         assert device_info.get_dpu_list() == ["dpu0", "dpu1"]
 
+    def test_device_context_files(self, tmp_path):
+        machine_conf = tmp_path / "machine.conf"
+        machine_conf.write_text(MACHINE_CONF_CONTENTS)
+        asic_conf = tmp_path / "asic.conf"
+        asic_conf.write_text("NUM_ASIC=3\nDEV_ID_ASIC_0=03:00.0\n")
+        context = device_info.enable_device_context()
+        try:
+            with mock.patch("sonic_py_common.device_info.MACHINE_CONF_PATH", str(machine_conf)), \
+                 mock.patch("sonic_py_common.device_info.get_asic_conf_file_path", return_value=str(asic_conf)):
+                for _ in range(0, 5):
+                    assert device_info.get_machine_info() == EXPECTED_GET_MACHINE_INFO_RESULT
+                    assert device_info.get_platform() == "x86_64-mlnx_msn2700-r0"
+                    assert device_info.get_num_npus() == 3
+                assert context.get_counters()['file_reads'] == 2
+                assert context.get_counters()['file_reads_saved'] == 13
+
+                # The file is re-read when it is changed
+                asic_conf.write_text("NUM_ASIC=10\n")
+                assert device_info.get_num_npus() == 10
+                assert context.get_counters()['file_reads'] == 3
+
+                # The counters and the cache are reset by refresh()
+                context.refresh()
+                assert device_info.get_num_npus() == 10
+                assert context.get_counters() == {'file_reads': 1, 'file_reads_saved': 0,
+                                                  'db_connections': 0, 'db_connections_saved': 0}
+        finally:
+            device_info.disable_device_context()
+        assert device_info.get_device_context() is None
+
+    def test_device_context_config_db(self):
+        context = device_info.enable_device_context()
+        try:
+            with mock.patch("sonic_py_common.device_info.ConfigDBConnector") as mock_cfg_db:
+                mock_cfg_db.return_value.get_table.return_value = {'localhost': {'hwsku': 'ACS-MSN2700'}}
+                for _ in range(0, 5):
+                    assert device_info.get_hwsku() == 'ACS-MSN2700'
+                mock_cfg_db.assert_called_once()
+                mock_cfg_db.return_value.connect.assert_called_once()
+                assert context.get_counters()['db_connections'] == 1
+                assert context.get_counters()['db_connections_saved'] == 4
+        finally:
+            device_info.disable_device_context()
+
+    @mock.patch("sonic_py_common.device_info.get_platform", return_value="x86_64-test-r0")
+    @mock.patch("sonic_py_common.device_info.get_sonic_version_info", return_value={"asic_type": "broadcom"})
+    def test_get_system_mac_sysfs(self, mock_version_info, mock_get_platform, tmp_path):
+        (tmp_path / "eth0").mkdir()
+        (tmp_path / "eth0" / "address").write_text("b8:6a:97:12:34:56\n")
+        with mock.patch("sonic_py_common.device_info.SYSFS_NET_PATH", str(tmp_path)), \
+             mock.patch("sonic_py_common.device_info.run_command") as mock_run_command:
+            assert device_info.get_system_mac() == "b8:6a:97:12:34:56"
+            mock_run_command.assert_not_called()
+
+    @mock.patch("sonic_py_common.device_info.get_machine_info", return_value={})
+    @mock.patch("sonic_py_common.device_info.get_platform", return_value="x86_64-test-r0")
+    @mock.patch("sonic_py_common.device_info.get_sonic_version_info", return_value={"asic_type": "mellanox"})
+    def test_get_system_mac_syseeprom_cache(self, mock_version_info, mock_get_platform, mock_machine_info, tmp_path):
+        cache_file = tmp_path / "decode-syseeprom" / "base_mac"
+        with mock.patch("sonic_py_common.device_info.SYSEEPROM_MAC_CACHE_FILE", str(cache_file)), \
+             mock.patch("sonic_py_common.device_info.run_command", return_value=("b8:6a:97:12:34:56\n", "")) as mock_run_command:
+            for _ in range(0, 3):
+                assert device_info.get_system_mac() == "b8:6a:97:12:34:56"
+            mock_run_command.assert_called_once_with(["sudo", "decode-syseeprom", "-m"])
+        assert cache_file.read_text() == "b8:6a:97:12:34:56"
+
+    @mock.patch("sonic_py_common.device_info.get_platform", return_value="x86_64-8201_sys-r0")
+    @mock.patch("sonic_py_common.device_info.get_sonic_version_info", return_value={"asic_type": "cisco-8000"})
+    def test_get_system_mac_profile(self, mock_version_info, mock_get_platform, tmp_path):
+        platform_dir = tmp_path / "x86_64-8201_sys-r0"
+        platform_dir.mkdir()
+        (platform_dir / "profile.ini").write_text("asic0switchMacAddress=b8:6a:97:00:00:01\n"
+                                                  "asic1switchMacAddress=b8:6a:97:00:00:02\n")
+        with mock.patch("sonic_py_common.device_info.HOST_DEVICE_PATH", str(tmp_path)), \
+             mock.patch("sonic_py_common.device_info.run_command") as mock_run_command:
+            assert device_info.get_system_mac(namespace="asic1") == "b8:6a:97:00:00:02"
+            mock_run_command.assert_not_called()
+
     @classmethod
     def teardown_class(cls):
         print("TEARDOWN")
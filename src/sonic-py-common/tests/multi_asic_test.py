@@ -1,6 +1,81 @@
+from unittest import mock
+
 from sonic_py_common import multi_asic
 
 
+class MockConfigDb(object):
+    def __init__(self, namespace):
+        asic_id = namespace[-1]
+        self.tables = {
+            'PORT': {'Ethernet{}'.format(asic_id): {},
+                     'Ethernet-BP{}'.format(asic_id): {'role': 'Int'}},
+            'PORTCHANNEL_MEMBER': {('PortChannel{}'.format(asic_id), 'Ethernet-BP{}'.format(asic_id)): {}},
+            'BGP_INTERNAL_NEIGHBOR': {'10.0.0.{}'.format(asic_id): {'asn': '65100'}} if asic_id == '1' else {},
+        }
+
+    def get_table(self, table):
+        return dict(self.tables.get(table, {}))
+
+    def get_keys(self, table):
+        return list(self.tables.get(table, {}).keys())
+
+    def get_entry(self, table, key):
+        return self.tables.get(table, {}).get(key, {})
+
+
 class TestMultiAsic:
+    def setup_method(self):
+        multi_asic.clear_config_db_handles()
+
+    def teardown_method(self):
+        multi_asic.clear_config_db_handles()
+
     def test_get_container_name_from_asic_id(self):
         assert multi_asic.get_container_name_from_asic_id('database', 0) == 'database0'
+
+    @mock.patch('sonic_py_common.multi_asic.get_namespace_list', return_value=['asic0', 'asic1', 'asic2'])
+    @mock.patch('sonic_py_common.multi_asic.connect_config_db_for_ns', side_effect=MockConfigDb)
+    def test_get_tables_all_ns(self, mock_connect, mock_ns_list):
+        for _ in range(0, 3):
+            tables = multi_asic.get_tables_all_ns(['PORT', 'PORTCHANNEL_MEMBER'])
+            assert set(tables['PORT'].keys()) == {'Ethernet0', 'Ethernet1', 'Ethernet2',
+                                                  'Ethernet-BP0', 'Ethernet-BP1', 'Ethernet-BP2'}
+            assert len(tables['PORTCHANNEL_MEMBER']) == 3
+            assert multi_asic.get_port_table() == tables['PORT']
+        # One connection per namespace is opened and reused by the following calls
+        assert sorted(call.args[0] for call in mock_connect.call_args_list) == ['asic0', 'asic1', 'asic2']
+
+    @mock.patch('sonic_py_common.multi_asic.is_multi_asic', return_value=True)
+    @mock.patch('sonic_py_common.multi_asic.get_namespace_list', return_value=['asic0', 'asic1'])
+    @mock.patch('sonic_py_common.multi_asic.connect_config_db_for_ns', side_effect=MockConfigDb)
+    def test_get_back_end_interface_set(self, mock_connect, mock_ns_list, mock_is_multi_asic):
+        assert multi_asic.get_back_end_interface_set() == {'Ethernet-BP0', 'Ethernet-BP1',
+                                                           'PortChannel0', 'PortChannel1'}
+
+    @mock.patch('sonic_py_common.multi_asic.is_multi_asic', return_value=True)
+    @mock.patch('sonic_py_common.multi_asic.get_namespace_list', return_value=['asic0', 'asic1'])
+    @mock.patch('sonic_py_common.multi_asic.connect_config_db_for_ns', side_effect=MockConfigDb)
+    def test_is_bgp_session_internal(self, mock_connect, mock_ns_list, mock_is_multi_asic):
+        assert multi_asic.is_bgp_session_internal('10.0.0.1')
+        assert not multi_asic.is_bgp_session_internal('10.0.0.0')
+
+    @mock.patch('sonic_py_common.multi_asic.get_namespace_list', return_value=['asic0', 'asic1'])
+    @mock.patch('sonic_py_common.multi_asic.connect_config_db_for_ns', side_effect=MockConfigDb)
+    def test_run_for_all_ns_reconnect(self, mock_connect, mock_ns_list):
+        multi_asic.get_tables_all_ns(['PORT'])
+        broken_db = multi_asic.get_config_db_for_ns('asic1')
+        broken_db.get_table = mock.MagicMock(side_effect=RuntimeError('Unable to connect to redis'))
+
+        # The broken handle is dropped and the namespace is read again with a new connection
+        tables = multi_asic.get_tables_all_ns(['PORT'])
+        assert 'Ethernet1' in tables['PORT']
+        assert multi_asic.get_config_db_for_ns('asic1') is not broken_db
+        assert mock_connect.call_count == 3
+
+    @mock.patch('sonic_py_common.multi_asic.connect_config_db_for_ns', side_effect=MockConfigDb)
+    def test_get_table_for_asic(self, mock_connect):
+        # The per ASIC helpers open a new connection on every call
+        assert multi_asic.get_port_entry_for_asic('Ethernet0', 'asic0') == {}
+        assert 'Ethernet1' in multi_asic.get_port_table_for_asic('asic1')
+        assert mock_connect.call_count == 2
+        assert multi_asic.config_db_handle == {}
@@ -79,6 +79,33 @@ class StdinMockWrapper:
         return getattr(self._real_stdin, name)
 
 
+class MockSubscriberStateTable:
+    def __init__(self, conn, table_name):
+        self.table_name = table_name
+        self.updates = []
+
+    def pop(self):
+        if self.updates:
+            return self.updates.pop(0)
+        return ("", "", ())
+
+
+class MockSelect:
+    OBJECT = 0
+    TIMEOUT = 1
+
+    def __init__(self):
+        self.subscribers = {}
+
+    def addSelectable(self, subscriber):
+        self.subscribers[subscriber.table_name] = subscriber
+
+    def select(self, timeout=-1):
+        if any(subscriber.updates for subscriber in self.subscribers.values()):
+            return (self.OBJECT, None)
+        return (self.TIMEOUT, None)
+
+
 @contextmanager
 def mock_stdin_context():
     r, w = os.pipe()
@@ -92,6 +119,8 @@ def mock_stdin_context():
 
 
 @mock.patch('supervisor_proc_exit_listener.swsscommon.ConfigDBConnector', ConfigDBConnector)
+@mock.patch('supervisor_proc_exit_listener.swsscommon.SubscriberStateTable', MockSubscriberStateTable)
+@mock.patch('supervisor_proc_exit_listener.swsscommon.Select', MockSelect)
 @mock.patch('supervisor_proc_exit_listener.os.kill')
 @mock.patch.dict(os.environ, {"NAMESPACE_PREFIX": "asic", "NAMESPACE_ID": "0"})
 @mock.patch('supervisor_proc_exit_listener.time.time')
@@ -108,6 +137,8 @@ def test_main_swss_no_container(mock_time, mock_os_kill):
 
 
 @mock.patch('supervisor_proc_exit_listener.swsscommon.ConfigDBConnector', ConfigDBConnector)
+@mock.patch('supervisor_proc_exit_listener.swsscommon.SubscriberStateTable', MockSubscriberStateTable)
+@mock.patch('supervisor_proc_exit_listener.swsscommon.Select', MockSelect)
 @mock.patch('supervisor_proc_exit_listener.os.kill')
 @mock.patch.dict(os.environ, {"NAMESPACE_PREFIX": "asic"})
 @mock.patch('supervisor_proc_exit_listener.time.time')
@@ -123,6 +154,8 @@ def test_main_swss_success(mock_time, mock_os_kill):
 
 
 @mock.patch('supervisor_proc_exit_listener.swsscommon.ConfigDBConnector', ConfigDBConnector)
+@mock.patch('supervisor_proc_exit_listener.swsscommon.SubscriberStateTable', MockSubscriberStateTable)
+@mock.patch('supervisor_proc_exit_listener.swsscommon.Select', MockSelect)
 @mock.patch('supervisor_proc_exit_listener.os.kill')
 @mock.patch.dict(os.environ, {"NAMESPACE_PREFIX": "asic", "NAMESPACE_ID": "1"})
 @mock.patch('supervisor_proc_exit_listener.time.time')
@@ -135,3 +168,49 @@ def test_main_snmp(mock_time, mock_os_kill):
             with pytest.raises(StopTestLoop):
                 main(["--container-name", "snmp"])
     mock_os_kill.assert_not_called()
+
+
+@mock.patch('supervisor_proc_exit_listener.swsscommon.ConfigDBConnector', ConfigDBConnector)
+@mock.patch('supervisor_proc_exit_listener.swsscommon.SubscriberStateTable', MockSubscriberStateTable)
+@mock.patch('supervisor_proc_exit_listener.swsscommon.Select', MockSelect)
+def test_config_cache():
+    config_cache = ConfigCache(False)
+    assert get_autorestart_state("swss", config_cache) == "enabled"
+    assert get_autorestart_state("snmp", config_cache) == "disabled"
+    assert get_heartbeat_alert_interval("orchagent", config_cache) == 60
+    assert get_heartbeat_alert_interval("snmpd", config_cache) == ALERTING_INTERVAL_SECS
+
+    # Config changes are applied from the subscription
+    config_db = config_cache.config_db
+    feature_subscriber = config_cache.subscribers[FEATURE_TABLE_NAME]
+    feature_subscriber.updates.append(("swss", swsscommon.SET_COMMAND, (("auto_restart", "disabled"), ("state", "enabled"))))
+    feature_subscriber.updates.append(("snmp", swsscommon.DEL_COMMAND, ()))
+    assert get_autorestart_state("swss", config_cache) == "disabled"
+    assert get_autorestart_state("snmp", config_cache) == ""
+
+    heartbeat_subscriber = config_cache.subscribers[HEARTBEAT_TABLE_NAME]
+    heartbeat_subscriber.updates.append(("snmpd", swsscommon.SET_COMMAND, (("alert_interval", "30000"),)))
+    config_cache.update()
+    assert get_heartbeat_alert_interval("snmpd", config_cache) == 30
+    assert config_cache.config_db is config_db
+
+
+@mock.patch('supervisor_proc_exit_listener.swsscommon.SubscriberStateTable', MockSubscriberStateTable)
+@mock.patch('supervisor_proc_exit_listener.swsscommon.Select', MockSelect)
+@mock.patch('supervisor_proc_exit_listener.os.kill')
+@mock.patch.dict(os.environ, {"NAMESPACE_PREFIX": "asic", "NAMESPACE_ID": "1"})
+@mock.patch('supervisor_proc_exit_listener.time.time')
+@mock.patch("builtins.open", mock_open)
+@mock.patch("os.path.exists", mock_exists)
+def test_main_config_db_connections(mock_time, mock_os_kill):
+    # Every time() call moves the clock forward by an hour, the listener must
+    # stay on the connection it opened first for all that time
+    mock_time.side_effect = TimeMocker()
+    with mock.patch('supervisor_proc_exit_listener.swsscommon.ConfigDBConnector', side_effect=ConfigDBConnector) as mock_config_db:
+        with mock_stdin_context() as stdin_mock:
+            with mock.patch('sys.stdin', stdin_mock):
+                with pytest.raises(StopTestLoop):
+                    main(["--container-name", "snmp"])
+    assert mock_time.call_count > 1
+    assert mock_config_db.call_count == 1
+    mock_os_kill.assert_not_called()
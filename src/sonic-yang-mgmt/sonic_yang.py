@@ -3,9 +3,12 @@ import syslog
 
 from json import dump
 from glob import glob
-from sonic_yang_ext import SonicYangExtMixin, SonicYangException
+from sonic_yang_ext import SonicYangExtMixin, SonicYangException, SCHEMA_CACHE_DIR
 from sonic_yang_path import SonicYangPathMixin
 
+# Depth of the table entry in a data xpath, /module:container/TABLE/TABLE_LIST[key]
+LEAFREF_INDEX_DEPTH = 3
+
 """
 Yang schema and data tree python APIs based on libyang python
 Here, sonic_yang_ext_mixin extends funtionality of sonic_yang,
@@ -13,8 +16,11 @@ i.e. it is mixin not parent class.
 """
 class SonicYang(SonicYangExtMixin, SonicYangPathMixin):
 
-    def __init__(self, yang_dir, debug=False, print_log_enabled=True, sonic_yang_options=0):
+    def __init__(self, yang_dir, debug=False, print_log_enabled=True, sonic_yang_options=0,
+                 schema_cache_dir=SCHEMA_CACHE_DIR):
         self.yang_dir = yang_dir
+        # directory of the serialized JSON schema cache, None disables the cache
+        self.schema_cache_dir = schema_cache_dir
         self.ctx = None
         self.module = None
         self.root = None
@@ -50,6 +56,10 @@ class SonicYang(SonicYangExtMixin, SonicYangPathMixin):
         self.mustCache = dict()
         # Lazy caching for configdb to xpath
         self.configPathCache = dict()
+        # Compiled translation plans of yang lists/containers, see _getXlatePlan()
+        self.xlatePlans = dict()
+        # Reverse index of the leafrefs in the data tree, see _build_leafref_index()
+        self.leafrefIndex = None
         # element path for CONFIG DB. An example for this list could be:
         # ['PORT', 'Ethernet0', 'speed']
         self.elementPath = []
@@ -150,6 +160,7 @@ class SonicYang(SonicYangExtMixin, SonicYangPathMixin):
            self.fail(e)
        else:
            self.root = data_node
+           self.leafrefIndex = None
 
     """
     get module name from xpath
@@ -411,6 +422,8 @@ class SonicYang(SonicYangExtMixin, SonicYangPathMixin):
     def _add_data_node(self, data_xpath, value):
         try:
             self._new_data_node(data_xpath, value)
+            # parents and keys may be created along with the node
+            self.leafrefIndex = None
             #check if the node added to the data tree
             self._find_data_node(data_xpath)
         except Exception as e:
@@ -435,6 +448,7 @@ class SonicYang(SonicYangExtMixin, SonicYangPathMixin):
 
             #merge
             self.root.merge(source_node, 0)
+            self.leafrefIndex = None
         except Exception as e:
             self.fail(e)
 
@@ -448,7 +462,9 @@ class SonicYang(SonicYangExtMixin, SonicYangPathMixin):
             node = self._find_data_node(xpath)
 
         if (node):
+            node_path = node.path()
             node.unlink()
+            self._unindex_leafrefs(node_path)
             dnode = self._find_data_node(xpath)
             if (dnode is None):
                 #deleted node not found
@@ -489,6 +505,7 @@ class SonicYang(SonicYangExtMixin, SonicYangPathMixin):
     def _set_data_node_value(self, data_xpath, value):
         try:
             self.root.new_path(self.ctx, data_xpath, str(value), ly.LYD_ANYDATA_STRING, ly.LYD_PATH_OPT_UPDATE)
+            self.leafrefIndex = None
         except Exception as e:
             self.sysLog(msg="set data node value failed for xpath: " + str(data_xpath), debug=syslog.LOG_ERR, doPrint=True)
             self.fail(e)
@@ -729,20 +746,171 @@ class SonicYang(SonicYangExtMixin, SonicYangPathMixin):
 
         # For all found data nodes, emit the path to the data node.  If we need to
         # restrict to a value, do so.
+        if self.leafrefIndex is None:
+            self._build_leafref_index()
+
+        if required_value is not None:
+            ref_list.extend(self.leafrefIndex['targets'].get((search_xpath, required_value), ()))
+            return ref_list
+
         for lref in lreflist:
-            try:
-                data_set = self.root.find_path(lref).data()
-                for dnode in data_set:
-                    if required_value is None or (
-                        dnode.subtype() is not None and dnode.subtype().value_str() == required_value
-                    ):
-                        ref_list.append(dnode.path())
-            except Exception as e:
-                # Possible no data paths matched, ignore
-                pass
+            ref_list.extend(self.leafrefIndex['refs'].get(lref, ()))
 
         return ref_list
 
+    """
+    build_leafref_index(): build the reverse index of the leafrefs in the data
+    tree, so find_data_dependencies() is a dictionary lookup instead of a walk
+    of the data tree per leafref. The data nodes of each leafref schema node
+    are fetched once here, the index is then kept up to date on deletes and
+    delta loads, other changes of the data tree drop it.
+    Layout of self.leafrefIndex:
+        'schema':  {leafref schema xpath: [target schema xpath, ...]}
+        'refs':    {leafref schema xpath: {leafref data xpath: None}}
+        'targets': {(target schema xpath, value): {leafref data xpath: None}}
+        'nodes':   {entry xpath: {leafref data xpath: (leafref schema xpath, value)}}
+    The leafref data nodes are grouped by the xpath of their table entry, the
+    first LEAFREF_INDEX_DEPTH nodes of the xpath, so removing an entry does
+    not walk the whole index.
+    """
+    def _build_leafref_index(self):
+        schema_map = dict()
+        for module in self.ctx.get_module_iter():
+            if module.data() is None:
+                continue
+
+            for elem in module.data().tree_dfs():
+                target = elem.path()
+                for lref in self.__find_schema_dependencies_only(elem):
+                    targets = schema_map.setdefault(lref, list())
+                    if target not in targets:
+                        targets.append(target)
+
+        self.leafrefIndex = {'schema': schema_map, 'refs': dict(), 'targets': dict(), 'nodes': dict()}
+        if self.root is None:
+            return
+
+        for lref in schema_map:
+            self.__index_leafref_nodes(lref)
+
+        return
+
+    """
+    index_leafrefs(): add the leafrefs of a data subtree to the leafref index
+    input:    data_node - root of the subtree, added to the data tree
+    """
+    def _index_leafrefs(self, data_node):
+        if self.leafrefIndex is None:
+            return
+
+        schema_prefix = data_node.schema().path()
+        data_prefix = data_node.path()
+        for lref in self.leafrefIndex['schema']:
+            if lref == schema_prefix:
+                self.__index_leafref_node(lref, data_node)
+            elif lref.startswith(schema_prefix + "/"):
+                self.__index_leafref_nodes(lref, data_prefix)
+
+        return
+
+    """
+    unindex_leafrefs(): remove the leafrefs of a data subtree from the leafref
+    index
+    input:    data_xpath - xpath of the root of the subtree
+    """
+    def _unindex_leafrefs(self, data_xpath):
+        index = self.leafrefIndex
+        if index is None:
+            return
+
+        entry_xpath = self.__leafref_index_entry(data_xpath)
+        if entry_xpath is None:
+            # a table or a module, drop all of its entries
+            entries = [entry for entry in index['nodes'] \
+                        if entry == data_xpath or entry.startswith(data_xpath + "/")]
+        else:
+            entries = [entry_xpath] if entry_xpath in index['nodes'] else []
+
+        for entry in entries:
+            nodes = index['nodes'][entry]
+            if entry_xpath is None or entry_xpath == data_xpath:
+                paths = list(nodes)
+            else:
+                paths = [path for path in nodes \
+                            if path == data_xpath or path.startswith(data_xpath + "/")]
+            for path in paths:
+                lref, value = nodes.pop(path)
+                self.__unindex_leafref_node(path, lref, value)
+            if not nodes:
+                del index['nodes'][entry]
+
+        return
+
+    def __unindex_leafref_node(self, path, lref, value):
+        index = self.leafrefIndex
+        index['refs'][lref].pop(path, None)
+        for target in index['schema'][lref]:
+            refs = index['targets'].get((target, value))
+            if refs is not None:
+                refs.pop(path, None)
+
+        return
+
+    """
+    leafref_index_entry(): xpath of the table entry of a data node, i.e. the
+    first LEAFREF_INDEX_DEPTH nodes of the xpath. Key values in the predicates
+    may contain '/', the quoted parts of the xpath are skipped.
+    input:    xpath - data node xpath
+    returns:  the entry xpath or None if xpath is not that deep
+    """
+    def __leafref_index_entry(self, xpath):
+        depth = 0
+        quote = None
+        for i, c in enumerate(xpath):
+            if quote is not None:
+                if c == quote:
+                    quote = None
+            elif c in "'\"":
+                quote = c
+            elif c == '/':
+                if depth == LEAFREF_INDEX_DEPTH:
+                    return xpath[:i]
+                depth += 1
+
+        return xpath if depth == LEAFREF_INDEX_DEPTH else None
+
+    def __index_leafref_nodes(self, lref, data_prefix=None):
+        try:
+            data_set = self.root.find_path(lref).data()
+        except Exception as e:
+            # Possible no data paths matched, ignore
+            return
+
+        for dnode in data_set:
+            if data_prefix is not None and not dnode.path().startswith(data_prefix + "/"):
+                continue
+            self.__index_leafref_node(lref, dnode)
+
+        return
+
+    def __index_leafref_node(self, lref, dnode):
+        index = self.leafrefIndex
+        path = dnode.path()
+        value = None
+        if dnode.subtype() is not None:
+            value = dnode.subtype().value_str()
+
+        entry = self.__leafref_index_entry(path) or path
+        index['nodes'].setdefault(entry, dict())[path] = (lref, value)
+        index['refs'].setdefault(lref, dict())[path] = None
+        if value is None:
+            return
+
+        for target in index['schema'][lref]:
+            index['targets'].setdefault((target, value), dict())[path] = None
+
+        return
+
     """
     get_module_prefix:   get the prefix of a Yang module
     input:    name of the Yang module
@@ -4,12 +4,20 @@
 from __future__ import print_function
 import yang as ly
 import syslog
-from json import dump, dumps, loads
+import hashlib
+import os
+import xmltodict
+from json import dump, dumps, load, loads
 from xmltodict import parse
 from glob import glob
 import copy
 from sonic_yang_path import SonicYangPathMixin
 
+# Directory of the serialized JSON schema cache, see SonicYangExtMixin._loadSchemaCache()
+SCHEMA_CACHE_DIR = '/var/cache/sonic/sonic-yang'
+# Bump on any change of the JSON schema derived from the yang models
+SCHEMA_CACHE_VERSION = '1'
+
 Type_1_list_maps_model = [
     'DSCP_TO_TC_MAP_LIST',
     'DOT1P_TO_TC_MAP_LIST',
@@ -55,6 +63,8 @@ class SonicYangExtMixin(SonicYangPathMixin):
     def loadYangModel(self):
 
         try:
+            # translation plans are compiled from the models loaded here
+            self.xlatePlans = dict()
             # get all files
             self.yangFiles = glob(self.yang_dir +"/*.yang")
             # load yang modules
@@ -65,18 +75,26 @@ class SonicYangExtMixin(SonicYangPathMixin):
                 else:
                     raise(Exception("Could not load module {}".format(file)))
 
+            schemaCacheFile = self._getSchemaCacheFile(self.yangFiles)
+
             # keep only modules name in self.yangFiles
             self.yangFiles = [f.split('/')[-1] for f in self.yangFiles]
             self.yangFiles = [f.split('.')[0] for f in self.yangFiles]
             self.sysLog(syslog.LOG_DEBUG,'Loaded below Yang Models')
             self.sysLog(syslog.LOG_DEBUG,str(self.yangFiles))
 
-            # load json for each yang model
-            self._loadJsonYangModel()
-            # create a map from config DB table to yang container
-            self._createDBTableToModuleMap()
-            # compile uses clause (embed into schema)
-            self._compileUsesClause()
+            if self._loadSchemaCache(schemaCacheFile):
+                # create a map from config DB table to yang container,
+                # groupings are already preprocessed in the cache
+                self._createDBTableToModuleMap(preProcess=False)
+            else:
+                # load json for each yang model
+                self._loadJsonYangModel()
+                # create a map from config DB table to yang container
+                self._createDBTableToModuleMap()
+                # compile uses clause (embed into schema)
+                self._compileUsesClause()
+                self._saveSchemaCache(schemaCacheFile)
         except Exception as e:
             self.sysLog(msg="Yang Models Load failed:{}".format(str(e)), \
                 debug=syslog.LOG_ERR, doPrint=True)
@@ -84,6 +102,96 @@ class SonicYangExtMixin(SonicYangPathMixin):
 
         return True
 
+    def _getSchemaCacheFile(self, yangFiles):
+        '''
+            Get path of the JSON schema cache file. The file name contains a hash
+            of the yang models content, so any change of the models uses a new file.
+
+            Parameters:
+                yangFiles (list): paths of the yang model files.
+
+            Returns:
+                (str): path of the cache file or None if the cache is disabled
+        '''
+        if self.schema_cache_dir is None:
+            return None
+        try:
+            h = hashlib.sha256()
+            h.update("{}:{}".format(SCHEMA_CACHE_VERSION, xmltodict.__version__).encode())
+            for file in sorted(yangFiles):
+                h.update(os.path.basename(file).encode() + b'\0')
+                with open(file, 'rb') as f:
+                    h.update(f.read())
+        except Exception as e:
+            self.sysLog(msg="Yang schema cache disabled:{}".format(str(e)), \
+                debug=syslog.LOG_WARNING)
+            return None
+        return os.path.join(self.schema_cache_dir, "schema-{}.json".format(h.hexdigest()))
+
+    def _loadSchemaCache(self, schemaCacheFile):
+        '''
+            Load JSON schema of yang models and preprocessed groupings from cache.
+
+            Parameters:
+                schemaCacheFile (str): path of the cache file.
+
+            Returns:
+                (bool): True if the schema was loaded from the cache
+        '''
+        if schemaCacheFile is None or not os.path.isfile(schemaCacheFile):
+            return False
+        try:
+            with open(schemaCacheFile) as f:
+                cache = load(f)
+            if cache.get('version') != SCHEMA_CACHE_VERSION or \
+                cache.get('modules') != sorted(self.yangFiles):
+                return False
+            self.yJson = cache['yJson']
+            self.preProcessedYang = cache['preProcessedYang']
+        except Exception as e:
+            self.sysLog(msg="Yang schema cache load failed:{}".format(str(e)), \
+                debug=syslog.LOG_WARNING)
+            self.yJson = list()
+            self.preProcessedYang = dict()
+            return False
+        self.sysLog(msg="Loaded yang schema from {}".format(schemaCacheFile))
+        return True
+
+    def _saveSchemaCache(self, schemaCacheFile):
+        '''
+            Save JSON schema of yang models and preprocessed groupings to cache.
+            Cache files of other yang models content are removed.
+
+            Parameters:
+                schemaCacheFile (str): path of the cache file.
+
+            Returns:
+                void
+        '''
+        if schemaCacheFile is None:
+            return
+        cache = {
+            'version': SCHEMA_CACHE_VERSION,
+            'modules': sorted(self.yangFiles),
+            'yJson': self.yJson,
+            'preProcessedYang': self.preProcessedYang
+        }
+        tmpFile = "{}.{}.tmp".format(schemaCacheFile, os.getpid())
+        try:
+            os.makedirs(self.schema_cache_dir, exist_ok=True)
+            with open(tmpFile, 'w') as f:
+                dump(cache, f)
+            os.rename(tmpFile, schemaCacheFile)
+            for oldFile in glob(os.path.join(self.schema_cache_dir, "schema-*.json")):
+                if oldFile != schemaCacheFile:
+                    os.remove(oldFile)
+        except Exception as e:
+            self.sysLog(msg="Yang schema cache save failed:{}".format(str(e)), \
+                debug=syslog.LOG_WARNING)
+            if os.path.exists(tmpFile):
+                os.remove(tmpFile)
+        return
+
     """
     load JSON schema format from yang models
     """
@@ -269,18 +377,20 @@ class SonicYangExtMixin(SonicYangPathMixin):
             traceback.print_exc()
             raise e
 
-    def _createDBTableToModuleMap(self):
+    def _createDBTableToModuleMap(self, preProcess=True):
         """
         Create a map from config DB tables to container in yang model
         This module name and topLevelContainer are fetched considering YANG models are
         written using below Guidelines:
         https://github.com/Azure/SONiC/blob/master/doc/mgmt/SONiC_YANG_Model_Guidelines.md.
+        preProcess is False when preprocessed yang objects are loaded from the schema cache.
         """
         for j in self.yJson:
             # get module name
             moduleName = j['module']['@name']
             # preProcesss Generic Yang Objects
-            self._preProcessYang(moduleName, j['module'])
+            if preProcess:
+                self._preProcessYang(moduleName, j['module'])
             # get top level container
             topLevelContainer = j['module'].get('container')
             # if top level container is none, this is common yang files, which may
@@ -368,12 +478,13 @@ class SonicYangExtMixin(SonicYangPathMixin):
     """
     def _extractKey(self, tableKey, keys):
 
-        keyList = keys.split()
+        # keys may be passed already split, see _getXlatePlan()
+        keyList = keys.split() if isinstance(keys, str) else keys
         # get the value groups
         value = tableKey.split("|")
         # match lens
         if len(keyList) != len(value):
-                raise Exception("Value not found for {} in {}".format(keys, tableKey))
+                raise Exception("Value not found for {} in {}".format(" ".join(keyList), tableKey))
         # create the keyDict
         keyDict = dict()
         for i in range(len(keyList)):
@@ -479,39 +590,101 @@ class SonicYangExtMixin(SonicYangPathMixin):
     """
     def _findYangTypedValue(self, key, value, leafDict):
 
+        separator = LEAF_LIST_WITH_STRING_VALUE_DICT.get((self.elementPath[0], self.elementPath[-1]))
+        xlate, _ = self._compileLeafConverters(leafDict[key], separator)
+
+        return xlate(value)
+
+    def _compileLeafConverters(self, leaf, separator=None):
+        '''
+            Compile the converters of values of a yang leaf between config DB
+            and yang.
+
+            Parameters:
+                leaf (dict): json format of yang leaf or leaf-list, see _fillLeafDict().
+                separator (str): separator of a leaf-list stored as a string in
+                    config DB, see LEAF_LIST_WITH_STRING_VALUE_DICT.
+
+            Returns:
+                 (tuple): (config DB to yang converter, yang to config DB converter)
+        '''
+        type = leaf['type']['@name']
+
         # convert config DB string to yang Type
-        def _yangConvert(val):
-            # Convert everything to string
-            val = str(val)
-            # find type of this key from yang leaf
-            type = leafDict[key]['type']['@name']
-
-            if 'uint' in type:
-                vValue = int(val, 10)
-            # TODO: find type of leafref from schema node
-            elif 'leafref' in type:
-                vValue = val
-            #TODO: find type in sonic-head, as of now, all are enumeration
-            elif 'stypes:' in type:
-                vValue = val
-            else:
-                vValue = val
-            return vValue
+        # TODO: find type of leafref from schema node
+        # TODO: find type in sonic-head, as of now, all are enumeration
+        if 'uint' in type:
+            yangConvert = lambda val: int(str(val), 10)
+        else:
+            yangConvert = str
+
+        # convert yang Type to config DB string
+        # config DB has only strings, thank god for that :), wait not yet!!!
+        revYangConvert = str
+
+        if not leaf['__isleafList']:
+            if type == 'boolean':
+                return yangConvert, lambda val: 'true' if val else 'false'
+            return yangConvert, revYangConvert
 
         # if it is a leaf-list do it for each element
-        if leafDict[key]['__isleafList']:
-            vValue = list()
-            if isinstance(value, str) and (self.elementPath[0], self.elementPath[-1]) in LEAF_LIST_WITH_STRING_VALUE_DICT:
-                # For field defined as leaf-list but has string value in CONFIG DB, need do special handling here. For exampe:
-                # port.adv_speeds in CONFIG DB has value "100,1000,10000", it shall be transferred to [100,1000,10000] as YANG value here to
-                # make it align with its YANG definition.
-                value = (x.strip() for x in value.split(LEAF_LIST_WITH_STRING_VALUE_DICT[(self.elementPath[0], self.elementPath[-1])]))
-            for v in value:
-                vValue.append(_yangConvert(v))
-        else:
-            vValue = _yangConvert(value)
+        if separator is None:
+            return lambda value: [yangConvert(v) for v in value], \
+                lambda value: [revYangConvert(v) for v in value]
+
+        # For field defined as leaf-list but has string value in CONFIG DB, need do special handling here. For exampe:
+        # port.adv_speeds in CONFIG DB has value "100,1000,10000", it shall be transferred to [100,1000,10000] as YANG value
+        # and back to "100,1000,10000" for CONFIG DB.
+        def _xlateLeafList(value):
+            if isinstance(value, str):
+                value = (x.strip() for x in value.split(separator))
+            return [yangConvert(v) for v in value]
+
+        def _revXlateLeafList(value):
+            if isinstance(value, list):
+                return separator.join(revYangConvert(v) for v in value)
+            return [revYangConvert(v) for v in value]
+
+        return _xlateLeafList, _revXlateLeafList
+
+    def _getXlatePlan(self, model, table):
+        '''
+            Get the translation plan of a yang list or container for a config DB
+            table. The plan is compiled from the yang model on first use and
+            cached in self.xlatePlans, so translating an entry is only lookups
+            of the precomputed keys and value converters.
 
-        return vValue
+            Parameters:
+                model (dict): json format of yang list or container.
+                table (str): config DB table, this table is being translated.
+
+            Returns:
+                 plan (dict): {
+                    'leafDict': leaf(s) of the model, see _createLeafDict(),
+                    'keys': list of keys of the yang list, None for a container,
+                    'xlate': {leaf: config DB to yang value converter},
+                    'revXlate': {leaf: yang to config DB value converter}
+                 }
+        '''
+        planKey = (id(model), table)
+        plan = self.xlatePlans.get(planKey)
+        if plan is not None:
+            return plan
+
+        leafDict = self._createLeafDict(model, table)
+        keys = None
+        if model.get('key') is not None:
+            keys = model['key']['@value'].split()
+        # model is kept in the plan, so its id is not reused while cached
+        plan = {'model': model, 'leafDict': leafDict, 'keys': keys, \
+            'xlate': dict(), 'revXlate': dict()}
+        for name, leaf in leafDict.items():
+            separator = LEAF_LIST_WITH_STRING_VALUE_DICT.get((table, name))
+            plan['xlate'][name], plan['revXlate'][name] = \
+                self._compileLeafConverters(leaf, separator)
+        self.xlatePlans[planKey] = plan
+
+        return plan
 
     """
     Xlate a Type 1 map list
@@ -574,20 +747,21 @@ class SonicYangExtMixin(SonicYangPathMixin):
         inner_clist = model.get('list')
         if inner_clist:
             inner_listKey = inner_clist['key']['@value']
-            inner_leafDict = self._createLeafDict(inner_clist, table)
+            inner_leafDict = self._getXlatePlan(inner_clist, table)['leafDict']
             for lkey in inner_leafDict:
                 if inner_listKey != lkey:
                     inner_listVal = lkey
 
         # get keys from YANG model list itself
-        listKeys = model['key']['@value']
+        listKeys = self._getXlatePlan(model, table)['keys']
         self.sysLog(msg="xlateList keyList:{}".format(listKeys))
         primaryKeys = list(config.keys())
         for pkey in primaryKeys:
             try:
                 vKey = None
-                self.sysLog(syslog.LOG_DEBUG, "xlateList Extract pkey:{}".\
-                    format(pkey))
+                if self.DEBUG:
+                    self.sysLog(syslog.LOG_DEBUG, "xlateList Extract pkey:{}".\
+                        format(pkey))
                 # Find and extracts key from each dict in config
                 keyDict = self._extractKey(pkey, listKeys)
 
@@ -595,8 +769,9 @@ class SonicYangExtMixin(SonicYangPathMixin):
                    inner_yang_list = list()
                    for vKey in config[pkey]:
                       inner_keyDict = dict()
-                      self.sysLog(syslog.LOG_DEBUG, "xlateList Key {} vkey {} Val {} vval {}".\
-                          format(inner_listKey, str(vKey), inner_listVal, str(config[pkey][vKey])))
+                      if self.DEBUG:
+                          self.sysLog(syslog.LOG_DEBUG, "xlateList Key {} vkey {} Val {} vval {}".\
+                              format(inner_listKey, str(vKey), inner_listVal, str(config[pkey][vKey])))
                       inner_keyDict[inner_listKey] = str(vKey)
                       inner_keyDict[inner_listVal] = str(config[pkey][vKey])
                       inner_yang_list.append(inner_keyDict)
@@ -663,24 +838,27 @@ class SonicYangExtMixin(SonicYangPathMixin):
         #This is done to improve performance of mapping from values of TABLEs in
         #config DB to leaf in YANG LIST.
 
-        leafDict = self._createLeafDict(model, table)
+        plan = self._getXlatePlan(model, table)
+        xlate = plan['xlate']
         # get keys from YANG model list itself
-        listKeys = model['key']['@value']
+        listKeys = plan['keys']
         self.sysLog(msg="xlateList keyList:{}".format(listKeys))
         primaryKeys = list(config.keys())
         for pkey in primaryKeys:
             try:
                 self.elementPath.append(pkey)
                 vKey = None
-                self.sysLog(syslog.LOG_DEBUG, "xlateList Extract pkey:{}".\
-                    format(pkey))
+                if self.DEBUG:
+                    self.sysLog(syslog.LOG_DEBUG, "xlateList Extract pkey:{}".\
+                        format(pkey))
                 # Find and extracts key from each dict in config
                 keyDict = self._extractKey(pkey, listKeys)
                 # fill rest of the values in keyDict
                 for vKey in config[pkey]:
                     if ccontainer and vKey == ccontainer.get('@name'):
-                        self.sysLog(syslog.LOG_DEBUG, "xlateList Handle container {} in list {}".\
-                            format(vKey, table))
+                        if self.DEBUG:
+                            self.sysLog(syslog.LOG_DEBUG, "xlateList Handle container {} in list {}".\
+                                format(vKey, table))
                         yangContainer = dict()
                         if isinstance(ccontainer, dict) and bool(config):
                             self._xlateContainerInList(ccontainer, yangContainer, config[pkey], table)
@@ -691,13 +869,9 @@ class SonicYangExtMixin(SonicYangPathMixin):
                         if len(yangContainer):
                             keyDict[vKey] = yangContainer
                         continue
-                    self.elementPath.append(vKey)
-                    self.sysLog(syslog.LOG_DEBUG, "xlateList vkey {}".format(vKey))
-                    try:
-                        keyDict[vKey] = self._findYangTypedValue(vKey, \
-                                            config[pkey][vKey], leafDict)
-                    finally:
-                        self.elementPath.pop()
+                    if self.DEBUG:
+                        self.sysLog(syslog.LOG_DEBUG, "xlateList vkey {}".format(vKey))
+                    keyDict[vKey] = xlate[vKey](config[pkey][vKey])
                 yang.append(keyDict)
                 # delete pkey from config, done to match one key with one list
                 del config[pkey]
@@ -794,15 +968,14 @@ class SonicYangExtMixin(SonicYangPathMixin):
                 self._xlateContainerInContainer(modelContainer, yang, configC, table)
 
         ## Handle other leaves in container,
-        leafDict = self._createLeafDict(model, table)
+        xlate = self._getXlatePlan(model, table)['xlate']
         vKeys = list(configC.keys())
         for vKey in vKeys:
             #vkey must be a leaf\leaf-list\choice in container
-            if leafDict.get(vKey):
-                self.elementPath.append(vKey)
-                self.sysLog(syslog.LOG_DEBUG, "xlateContainer vkey {}".format(vKey))
-                yang[vKey] = self._findYangTypedValue(vKey, configC[vKey], leafDict)
-                self.elementPath.pop()
+            if vKey in xlate:
+                if self.DEBUG:
+                    self.sysLog(syslog.LOG_DEBUG, "xlateContainer vkey {}".format(vKey))
+                yang[vKey] = xlate[vKey](configC[vKey])
                 # delete entry from copy of config
                 del configC[vKey]
 
@@ -861,7 +1034,8 @@ class SonicYangExtMixin(SonicYangPathMixin):
     def _createKey(self, entry, keys):
 
         keyDict = dict()
-        keyList = keys.split()
+        # keys may be passed already split, see _getXlatePlan()
+        keyList = keys.split() if isinstance(keys, str) else keys
         keyV = ""
 
         for key in keyList:
@@ -885,27 +1059,10 @@ class SonicYangExtMixin(SonicYangPathMixin):
     """
     def _revFindYangTypedValue(self, key, value, leafDict):
 
-        # convert yang Type to config DB string
-        def _revYangConvert(val):
-            # config DB has only strings, thank god for that :), wait not yet!!!
-            return str(val)
-
-        # if it is a leaf-list do it for each element
-        if leafDict[key]['__isleafList']:
-            if isinstance(value, list) and (self.elementPath[0], self.elementPath[-1]) in LEAF_LIST_WITH_STRING_VALUE_DICT:
-                # For field defined as leaf-list but has string value in CONFIG DB, we need do special handling here:
-                # e.g. port.adv_speeds is [10,100,1000] in YANG, need to convert it into a string for CONFIG DB: "10,100,1000"
-                vValue = LEAF_LIST_WITH_STRING_VALUE_DICT[(self.elementPath[0], self.elementPath[-1])].join((_revYangConvert(x) for x in value))
-            else:
-                vValue = list()
-                for v in value:
-                    vValue.append(_revYangConvert(v))
-        elif leafDict[key]['type']['@name'] == 'boolean':
-            vValue = 'true' if value else 'false'
-        else:
-            vValue = _revYangConvert(value)
+        separator = LEAF_LIST_WITH_STRING_VALUE_DICT.get((self.elementPath[0], self.elementPath[-1]))
+        _, revXlate = self._compileLeafConverters(leafDict[key], separator)
 
-        return vValue
+        return revXlate(value)
 
     """
     Rev xlate from <TABLE>_LIST to table in config DB
@@ -955,7 +1112,7 @@ class SonicYangExtMixin(SonicYangPathMixin):
 
     def _revXlateType1MapList(self, model, yang, config, table):
         # get keys from YANG model list itself
-        listKeys = model['key']['@value']
+        listKeys = self._getXlatePlan(model, table)['keys']
         # create a dict to map each key under primary key with a dict yang model.
         # This is done to improve performance of mapping from values of TABLEs in
         # config DB to leaf in YANG LIST.
@@ -964,7 +1121,7 @@ class SonicYangExtMixin(SonicYangPathMixin):
         inner_clist = model.get('list')
         if inner_clist:
             inner_listKey = inner_clist['key']['@value']
-            inner_leafDict = self._createLeafDict(inner_clist, table)
+            inner_leafDict = self._getXlatePlan(inner_clist, table)['leafDict']
             for lkey in inner_leafDict:
                 if inner_listKey != lkey:
                     inner_listVal = lkey
@@ -974,14 +1131,16 @@ class SonicYangExtMixin(SonicYangPathMixin):
             for entry in yang:
                 # create key of config DB table
                 pkey, pkeydict = self._createKey(entry, listKeys)
-                self.sysLog(syslog.LOG_DEBUG, "revXlateList pkey:{}".format(pkey))
+                if self.DEBUG:
+                    self.sysLog(syslog.LOG_DEBUG, "revXlateList pkey:{}".format(pkey))
                 config[pkey]= dict()
                 # fill rest of the entries
                 inner_list = entry[inner_clist['@name']]
                 for index in range(len(inner_list)):
-                    self.sysLog(syslog.LOG_DEBUG, "revXlateList fkey:{} fval {}".\
-                         format(str(inner_list[index][inner_listKey]),\
-                             str(inner_list[index][inner_listVal])))
+                    if self.DEBUG:
+                        self.sysLog(syslog.LOG_DEBUG, "revXlateList fkey:{} fval {}".\
+                             format(str(inner_list[index][inner_listKey]),\
+                                 str(inner_list[index][inner_listVal])))
                     config[pkey][str(inner_list[index][inner_listKey])] = str(inner_list[index][inner_listVal])
         return
 
@@ -998,26 +1157,26 @@ class SonicYangExtMixin(SonicYangPathMixin):
         # For handling of container(s) in list
         ccontainer = model.get('container')
 
-        # get keys from YANG model list itself
-        listKeys = model['key']['@value']
-        # create a dict to map each key under primary key with a dict yang model.
-        # This is done to improve performance of mapping from values of TABLEs in
-        # config DB to leaf in YANG LIST.
-        leafDict = self._createLeafDict(model, table)
+        # get keys and value converters from the translation plan of the list
+        plan = self._getXlatePlan(model, table)
+        listKeys = plan['keys']
+        revXlate = plan['revXlate']
 
         # list with name <NAME>_LIST should be removed,
         if "_LIST" in model['@name']:
             for entry in yang:
                 # create key of config DB table
                 pkey, pkeydict = self._createKey(entry, listKeys)
-                self.sysLog(syslog.LOG_DEBUG, "revXlateList pkey:{}".format(pkey))
+                if self.DEBUG:
+                    self.sysLog(syslog.LOG_DEBUG, "revXlateList pkey:{}".format(pkey))
                 self.elementPath.append(pkey)
                 config[pkey]= dict()
                 # fill rest of the entries
                 for key in entry:
                     if key not in pkeydict:
                         if ccontainer and key == ccontainer['@name']:
-                            self.sysLog(syslog.LOG_DEBUG, "revXlateList handle container {} in list {}".format(pkey, table))
+                            if self.DEBUG:
+                                self.sysLog(syslog.LOG_DEBUG, "revXlateList handle container {} in list {}".format(pkey, table))
                             # IF container has only one inner container
                             if isinstance(ccontainer, dict):
                                 self._revXlateContainerInContainer(ccontainer, entry, config[pkey], table)
@@ -1027,10 +1186,7 @@ class SonicYangExtMixin(SonicYangPathMixin):
                                     self._revXlateContainerInContainer(modelContainer, entry, config[pkey], table)
                             continue
 
-                        self.elementPath.append(key)
-                        config[pkey][key] = self._revFindYangTypedValue(key, \
-                            entry[key], leafDict)
-                        self.elementPath.pop()
+                        config[pkey][key] = revXlate[key](entry[key])
                 self.elementPath.pop()
 
         return
@@ -1085,14 +1241,13 @@ class SonicYangExtMixin(SonicYangPathMixin):
                 self._revXlateContainerInContainer(modelContainer, yang, config, table)
 
         ## Handle other leaves in container,
-        leafDict = self._createLeafDict(model, table)
+        revXlate = self._getXlatePlan(model, table)['revXlate']
         for vKey in yang:
             #vkey must be a leaf\leaf-list\choice in container
-            if leafDict.get(vKey):
-                self.sysLog(syslog.LOG_DEBUG, "revXlateContainer vkey {}".format(vKey))
-                self.elementPath.append(vKey)
-                config[vKey] = self._revFindYangTypedValue(vKey, yang[vKey], leafDict)
-                self.elementPath.pop()
+            if vKey in revXlate:
+                if self.DEBUG:
+                    self.sysLog(syslog.LOG_DEBUG, "revXlateContainer vkey {}".format(vKey))
+                config[vKey] = revXlate[vKey](yang[vKey])
 
         return
 
@@ -1249,6 +1404,7 @@ class SonicYangExtMixin(SonicYangPathMixin):
           self.sysLog(msg="Try to load Data in the tree")
           self.root = self.ctx.parse_data_mem(dumps(self.xlateJson), \
                         ly.LYD_JSON, ly.LYD_OPT_CONFIG|ly.LYD_OPT_STRICT)
+          self.leafrefIndex = None
 
        except Exception as e:
            self.root = None
@@ -1258,6 +1414,147 @@ class SonicYangExtMixin(SonicYangPathMixin):
 
        return True
 
+    """
+    Apply a config DB diff on the data tree loaded by loadData(). (Public)
+    Only the tables touched by the diff are translated again and replaced
+    in the live libyang data tree, the whole data tree is then validated.
+    This keeps the cost of translation and parsing proportional to the size
+    of the diff instead of the size of the whole config.
+
+    input:    configdbDiff - config DB style diff, will NOT be modified:
+              {
+                  "TABLE": {
+                      "key": {field: value, ...},    # add or replace entry
+                      "key": None                    # delete entry
+                  },
+                  "TABLE": None                      # delete table
+              }
+    returns:  True - success
+              Exception if failed. The data tree is restored to the config
+              prior to the diff in that case.
+    """
+    def loadDataDelta(self, configdbDiff, debug=False):
+
+        # nothing loaded yet, a delta is equal to a full load
+        if self.root is None:
+            jIn = dict()
+            self._applyConfigDbDiff(jIn, configdbDiff)
+            return self.loadData(jIn, debug=debug)
+
+        prevJIn = self.jIn
+        prevTablesWithOutYang = self.tablesWithOutYang
+        try:
+            # build the new config, sharing the tables not touched by the diff
+            self.jIn = dict(prevJIn)
+            self.tablesWithOutYang = dict(prevTablesWithOutYang)
+            # tables without yang model are kept out of self.jIn, apply the
+            # diff on their current content
+            for table in configdbDiff:
+                if table not in self.confDbYangMap and table in self.tablesWithOutYang:
+                    self.jIn[table] = self.tablesWithOutYang[table]
+            tables = self._applyConfigDbDiff(self.jIn, configdbDiff)
+
+            yangTables = list()
+            for table in tables:
+                if table not in self.confDbYangMap:
+                    self.tablesWithOutYang.pop(table, None)
+                    if table in self.jIn:
+                        self.tablesWithOutYang[table] = self.jIn.pop(table)
+                    continue
+                yangTables.append(table)
+
+            for table in yangTables:
+                self._replaceTableDataNode(table)
+
+            self.sysLog(msg="Try to validate Data delta for tables {}".\
+                format(yangTables))
+            self._validate_data(self.root, self.ctx)
+
+            if debug:
+                with open("xlateConfig.json", 'w') as f:
+                    dump(self.xlateJson, f, indent=4)
+
+        except Exception as e:
+            self.sysLog(msg="Data Delta Loading Failed:{}".format(str(e)), \
+                debug=syslog.LOG_ERR, doPrint=True)
+            # rebuild the data tree from the config prior to the diff
+            try:
+                self.loadData(prevJIn)
+            finally:
+                self.tablesWithOutYang = prevTablesWithOutYang
+            raise SonicYangException("Data Delta Loading Failed\n{}".\
+                format(str(e)))
+
+        return True
+
+    """
+    Apply config DB diff on jIn, tables in jIn modified by the diff are
+    copied first so references held by the caller are not clobbered.
+    input:    jIn - config DB json, configdbDiff - see loadDataDelta()
+    returns:  list of the modified tables
+    """
+    def _applyConfigDbDiff(self, jIn, configdbDiff):
+
+        tables = list()
+        for table, entries in configdbDiff.items():
+            tables.append(table)
+            if entries is None:
+                jIn.pop(table, None)
+                continue
+            jTable = dict(jIn.get(table, dict()))
+            for key, entry in entries.items():
+                if entry is None:
+                    jTable.pop(key, None)
+                else:
+                    jTable[key] = copy.deepcopy(entry)
+            if len(jTable):
+                jIn[table] = jTable
+            else:
+                jIn.pop(table, None)
+
+        return tables
+
+    """
+    Translate a single table from self.jIn and replace its container in the
+    data tree and in self.xlateJson. Validation is left to the caller.
+    input:    table - config DB table with a yang model
+    """
+    def _replaceTableDataNode(self, table):
+
+        cmap = self.confDbYangMap[table]
+        key = cmap['module']+":"+cmap['topLevelContainer']
+        subkey = cmap['topLevelContainer']+":"+cmap['container']['@name']
+
+        # drop the old table container
+        xpath = "/{}/{}".format(key, cmap['container']['@name'])
+        node = self._find_data_node(xpath)
+        if node is not None and self._deleteNode(xpath=xpath, node=node) == False:
+            raise Exception('_deleteNode failed for {}'.format(xpath))
+        if self.xlateJson.get(key) is not None:
+            self.xlateJson[key].pop(subkey, None)
+            if not len(self.xlateJson[key]):
+                del self.xlateJson[key]
+
+        if table not in self.jIn:
+            return
+
+        # translate the new table content and merge it in the data tree,
+        # parse is trusted since leafrefs may point to other modules, the
+        # whole tree is validated after the merge.
+        yangJ = dict()
+        self._xlateConfigDBtoYang({table: self.jIn[table]}, yangJ)
+        node = self.ctx.parse_data_mem(dumps(yangJ), ly.LYD_JSON, \
+            ly.LYD_OPT_CONFIG|ly.LYD_OPT_STRICT|ly.LYD_OPT_TRUSTED)
+        if node is not None:
+            self.root.merge(node, 0)
+            node = self._find_data_node(xpath)
+            if node is not None:
+                self._index_leafrefs(node)
+
+        self.xlateJson.setdefault(key, dict())[subkey] = yangJ[key][subkey]
+
+        return
+
     """
     Get data from Data tree, data tree will be assigned in self.xlateJson. (Public)
     """
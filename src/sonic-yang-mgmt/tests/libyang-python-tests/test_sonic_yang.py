@@ -3,8 +3,10 @@ import os
 import pytest
 import sonic_yang as sy
 import json
+import copy
 import glob
 import logging
+import time
 from ijson import items as ijson_itmes
 
 test_path = os.path.dirname(os.path.abspath(__file__))
@@ -447,5 +449,192 @@ class Test_SonicYang(object):
 
         return
 
+    def test_schema_cache(self, sonic_yang_data, tmp_path):
+        # Benchmark of loading the yang models without (cold) and with (warm)
+        # the serialized schema cache. Both loads must produce the same schema.
+        yang_dir = sonic_yang_data['yang_dir']
+        test_file = sonic_yang_data['test_file']
+
+        start = time.time()
+        cold = sy.SonicYang(yang_dir, schema_cache_dir=str(tmp_path))
+        cold.loadYangModel()
+        cold_time = time.time() - start
+        assert len(glob.glob(str(tmp_path / "schema-*.json"))) == 1
+
+        start = time.time()
+        warm = sy.SonicYang(yang_dir, schema_cache_dir=str(tmp_path))
+        warm.loadYangModel()
+        warm_time = time.time() - start
+        print("Yang models load time: cold {:.3f}s warm {:.3f}s".format(cold_time, warm_time))
+
+        assert warm.yangFiles == cold.yangFiles
+        assert json.dumps(warm.yJson) == json.dumps(cold.yJson)
+        assert json.dumps(warm.preProcessedYang) == json.dumps(cold.preProcessedYang)
+        assert json.dumps(warm.confDbYangMap, sort_keys=True) == json.dumps(cold.confDbYangMap, sort_keys=True)
+
+        # schema loaded from the cache translates config the same way
+        jIn = json.loads(self.readIjsonInput(test_file, 'SAMPLE_CONFIG_DB_JSON'))
+        warm.loadData(jIn)
+        warm.getData()
+        assert warm.jIn == warm.revXlateJson
+
+        return
+
+    def test_load_data_delta(self, sonic_yang_data):
+        # Delta applied on the live data tree must give the same data as a
+        # full load of the resulting config.
+        test_file = sonic_yang_data['test_file']
+        syc = sonic_yang_data['syc']
+
+        jIn = json.loads(self.readIjsonInput(test_file, 'SAMPLE_CONFIG_DB_JSON'))
+        syc.loadData(jIn)
+
+        diff = {
+            "VLAN": {
+                "Vlan999": {"vlanid": "999"}
+            },
+            "VLAN_MEMBER": {
+                "Vlan999|Ethernet11": {"tagging_mode": "tagged"},
+                "Vlan111|Ethernet0": None
+            }
+        }
+        syc.loadDataDelta(diff)
+        syc.getData()
+
+        expected = copy.deepcopy(jIn)
+        expected["VLAN"]["Vlan999"] = {"vlanid": "999"}
+        expected["VLAN_MEMBER"]["Vlan999|Ethernet11"] = {"tagging_mode": "tagged"}
+        del expected["VLAN_MEMBER"]["Vlan111|Ethernet0"]
+        assert syc.jIn == expected
+        assert syc.revXlateJson == expected
+        # the config passed to loadData is not modified
+        assert "Vlan999" not in jIn["VLAN"]
+
+        # deleting a VLAN with members fails on the leafref and the data tree
+        # is restored
+        with pytest.raises(sy.SonicYangException):
+            syc.loadDataDelta({"VLAN": {"Vlan999": None}})
+        syc.getData()
+        assert syc.revXlateJson == expected
+
+        # delete of a whole table
+        syc.loadDataDelta({"VLAN_MEMBER": {"Vlan999|Ethernet11": None}})
+        syc.loadDataDelta({"VLAN_MEMBER": None})
+        syc.getData()
+        assert "VLAN_MEMBER" not in syc.revXlateJson
+
+        return
+
+    def test_load_data_delta_table_without_yang(self, sonic_yang_data):
+        # Diff of a table without yang model is applied on its content
+        test_file = sonic_yang_data['test_file']
+        syc = sonic_yang_data['syc']
+
+        jIn = json.loads(self.readIjsonInput(test_file, 'SAMPLE_CONFIG_DB_JSON'))
+        jIn["NO_YANG_TABLE"] = {"key1": {"f": "1"}, "key2": {"f": "2"}, "key3": {"f": "3"}}
+        syc.loadData(jIn)
+
+        syc.loadDataDelta({"NO_YANG_TABLE": {"key1": None, "key4": {"f": "4"}}})
+        assert syc.tablesWithOutYang["NO_YANG_TABLE"] == \
+            {"key2": {"f": "2"}, "key3": {"f": "3"}, "key4": {"f": "4"}}
+        assert "NO_YANG_TABLE" not in syc.jIn
+        # the config passed to loadData is not modified
+        assert list(jIn["NO_YANG_TABLE"]) == ["key1", "key2", "key3"]
+
+        syc.loadDataDelta({"NO_YANG_TABLE": None})
+        assert "NO_YANG_TABLE" not in syc.tablesWithOutYang
+
+        return
+
+    def test_data_dependencies_index(self, sonic_yang_data):
+        # Micro-benchmark of find_data_dependencies() with the leafref index
+        # on a synthetic config of 256 ports and 4k VLAN members, compared to
+        # a walk of the data tree per leafref.
+        syc = sonic_yang_data['syc']
+
+        ports = ["Ethernet{}".format(i) for i in range(256)]
+        vlans = ["Vlan{}".format(i) for i in range(2, 18)]
+        jIn = {
+            "PORT": {port: {"lanes": str(i), "speed": "100000"} for i, port in enumerate(ports)},
+            "VLAN": {vlan: {"vlanid": vlan[len("Vlan"):]} for vlan in vlans},
+            "VLAN_MEMBER": {"{}|{}".format(vlan, port): {"tagging_mode": "tagged"} \
+                for vlan in vlans for port in ports}
+        }
+        syc.loadData(jIn)
+
+        def walk_dependencies(xpath):
+            value = syc._find_data_node_value(xpath)
+            schema_xpath = syc._find_data_node_schema_xpath(xpath)
+            refs = []
+            for lref in syc.find_schema_dependencies(schema_xpath):
+                for dnode in syc.root.find_path(lref).data():
+                    if dnode.subtype() is not None and dnode.subtype().value_str() == value:
+                        refs.append(dnode.path())
+            return refs
+
+        xpaths = ["/sonic-port:sonic-port/PORT/PORT_LIST[name='{}']/name".format(port) \
+            for port in ports[:32]]
+
+        start = time.time()
+        expected = [walk_dependencies(xpath) for xpath in xpaths]
+        walk_time = time.time() - start
+
+        start = time.time()
+        syc._build_leafref_index()
+        build_time = time.time() - start
+
+        start = time.time()
+        result = [syc.find_data_dependencies(xpath) for xpath in xpaths]
+        index_time = time.time() - start
+        print("Data dependencies of {} ports: walk {:.3f}s index build {:.3f}s lookup {:.3f}s".\
+            format(len(xpaths), walk_time, build_time, index_time))
+
+        for refs, expected_refs in zip(result, expected):
+            assert len(refs) == len(vlans)
+            assert set(refs) == set(expected_refs)
+
+        # index follows deletes and delta loads
+        xpath = "/sonic-vlan:sonic-vlan/VLAN_MEMBER/VLAN_MEMBER_LIST[name='Vlan2'][port='Ethernet0']"
+        syc.deleteNode(xpath)
+        assert len(syc.find_data_dependencies(xpaths[0])) == len(vlans) - 1
+        syc.loadDataDelta({"VLAN_MEMBER": {"Vlan2|Ethernet0": {"tagging_mode": "tagged"}}})
+        assert set(syc.find_data_dependencies(xpaths[0])) == set(expected[0])
+
+        return
+
+    def test_xlate_throughput(self, sonic_yang_data):
+        # Benchmark of forward and reverse translation of a large config with
+        # the compiled translation plans, in entries per second.
+        syc = sonic_yang_data['syc']
+
+        ports = ["Ethernet{}".format(i) for i in range(1024)]
+        vlans = ["Vlan{}".format(i) for i in range(2, 34)]
+        jIn = {
+            "PORT": {port: {"lanes": str(i), "speed": "100000", "mtu": "9100", \
+                "adv_speeds": "10000,25000,100000", "admin_status": "up"} \
+                for i, port in enumerate(ports)},
+            "VLAN": {vlan: {"vlanid": vlan[len("Vlan"):]} for vlan in vlans},
+            "VLAN_MEMBER": {"{}|{}".format(vlan, port): {"tagging_mode": "tagged"} \
+                for vlan in vlans for port in ports}
+        }
+        entries = sum(len(table) for table in jIn.values())
+
+        syc.jIn = jIn
+        syc.xlateJson = dict()
+        start = time.time()
+        syc._xlateConfigDB()
+        xlate_time = time.time() - start
+
+        syc.revXlateJson = dict()
+        start = time.time()
+        syc._revXlateConfigDB()
+        rev_xlate_time = time.time() - start
+        print("Translation of {} entries: xlate {:.0f} entries/s rev xlate {:.0f} entries/s".\
+            format(entries, entries / xlate_time, entries / rev_xlate_time))
+
+        assert syc.revXlateJson == jIn
+
+        return
+
     def teardown_class(self):
         pass
@@ -1,3 +1,7 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
 from .config import Config
 from .health_checker import HealthChecker
 from .service_checker import ServiceChecker
@@ -10,9 +14,24 @@ class HealthCheckerManager(object):
     """
     Manage all system health checkers and system health configuration.
     """
+
+    # Max number of checkers running at the same time
+    MAX_CHECKER_WORKERS = 8
+
+    # Checker statistic fields
+    STAT_FIELD_DURATION = 'duration'
+    STAT_FIELD_TIMEOUT_COUNT = 'timeout_count'
+    STAT_FIELD_LAST_RUN = 'last_run'
+
     def __init__(self):
         self._checkers = []
         self.config = Config()
+        self._executor = ThreadPoolExecutor(max_workers=HealthCheckerManager.MAX_CHECKER_WORKERS)
+        # Checkers which have not finished before their timeout, key is checker name
+        self._running = {}
+        # Statistic of each checker, key is checker name
+        self._checker_stats = {}
+        self._stats_lock = threading.Lock()
         self.initialize()
 
     def initialize(self):
@@ -25,7 +44,9 @@ class HealthCheckerManager(object):
 
     def check(self, chassis):
         """
-        Load new configuration if any and perform the system health check for all existing checkers.
+        Load new configuration if any and perform the system health check for all existing checkers. Checkers run
+        concurrently, a checker which doesn't finish in time is reported as not OK and is not started again until
+        it finishes.
         :param chassis: A chassis object.
         :return: A dictionary that contains the status for all objects that was checked.
         """
@@ -33,26 +54,86 @@ class HealthCheckerManager(object):
         stats = {}
         self.config.load_config()
 
-        for checker in self._checkers:
-            self._do_check(checker, stats)
-
+        checkers = list(self._checkers)
         if self.config.user_defined_checkers:
             for udc in self.config.user_defined_checkers:
-                checker = UserDefinedChecker(udc)
-                self._do_check(checker, stats)
+                checkers.append(UserDefinedChecker(udc))
+
+        futures = []
+        for checker in checkers:
+            if str(checker) in self._running:
+                futures.append((checker, None))
+            else:
+                futures.append((checker, self._executor.submit(self._run_checker, checker)))
+
+        # Checkers share the deadline as they start at the same time unless all workers are busy
+        deadline = time.time() + self.config.checker_timeout
+        for checker, future in futures:
+            if future is None:
+                self._do_timeout(checker, stats, 'still running since previous check')
+                continue
+            done, _ = wait([future], timeout=max(deadline - time.time(), 0))
+            if not done:
+                self._running[str(checker)] = future
+                future.add_done_callback(lambda _, name=str(checker): self._running.pop(name, None))
+                self._do_timeout(checker, stats, 'timed out after {} seconds'.format(self.config.checker_timeout))
+            else:
+                self._do_check(checker, future, stats)
 
         self._set_system_led(chassis)
         return stats
 
-    def _do_check(self, checker, stats):
+    def get_checker_stats(self):
+        """
+        Get statistic of all checkers that ever ran.
+        :return: A dictionary of checker name to its duration of last run in seconds, number of timeouts and the
+                 start time of last run.
+        """
+        with self._stats_lock:
+            return {name: dict(stat) for name, stat in self._checker_stats.items()}
+
+    def shutdown(self):
+        """
+        Stop starting new checks, checkers that are running are not waited.
+        :return:
+        """
+        self._executor.shutdown(wait=False)
+
+    def _get_checker_stat(self, checker):
+        name = str(checker)
+        if name not in self._checker_stats:
+            self._checker_stats[name] = {
+                HealthCheckerManager.STAT_FIELD_DURATION: 0,
+                HealthCheckerManager.STAT_FIELD_TIMEOUT_COUNT: 0,
+                HealthCheckerManager.STAT_FIELD_LAST_RUN: 0
+            }
+        return self._checker_stats[name]
+
+    def _run_checker(self, checker):
         """
-        Do check for a particular checker and collect the check statistic.
+        Run a checker and record its duration. Called in a worker thread.
         :param checker: A checker object.
-        :param stats: Check statistic.
         :return:
         """
+        begin = time.time()
         try:
             checker.check(self.config)
+        finally:
+            with self._stats_lock:
+                stat = self._get_checker_stat(checker)
+                stat[HealthCheckerManager.STAT_FIELD_LAST_RUN] = begin
+                stat[HealthCheckerManager.STAT_FIELD_DURATION] = time.time() - begin
+
+    def _do_check(self, checker, future, stats):
+        """
+        Collect the check statistic of a particular checker that finished its check.
+        :param checker: A checker object.
+        :param future: Future of the check.
+        :param stats: Check statistic.
+        :return:
+        """
+        try:
+            future.result()
             category = checker.get_category()
             info = checker.get_info()
             if category not in stats:
@@ -60,17 +141,32 @@ class HealthCheckerManager(object):
             else:
                 stats[category].update(info)
         except Exception as e:
-            HealthChecker.summary = HealthChecker.STATUS_NOT_OK
-            error_msg = 'Failed to perform health check for {} due to exception - {}'.format(checker, repr(e))
-            entry = {str(checker): {
-                HealthChecker.INFO_FIELD_OBJECT_STATUS: HealthChecker.STATUS_NOT_OK,
-                HealthChecker.INFO_FIELD_OBJECT_MSG: error_msg,
-                HealthChecker.INFO_FIELD_OBJECT_TYPE: "Internal"
-            }}
-            if 'Internal' not in stats:
-                stats['Internal'] = entry
-            else:
-                stats['Internal'].update(entry)
+            self._add_internal_error(checker, stats, 'Failed to perform health check for {} due to exception - {}'
+                                     .format(checker, repr(e)))
+
+    def _do_timeout(self, checker, stats, reason):
+        """
+        Report a checker that didn't finish in time.
+        :param checker: A checker object.
+        :param stats: Check statistic.
+        :param reason: Why the result of the checker is not available.
+        :return:
+        """
+        with self._stats_lock:
+            self._get_checker_stat(checker)[HealthCheckerManager.STAT_FIELD_TIMEOUT_COUNT] += 1
+        self._add_internal_error(checker, stats, 'Failed to perform health check for {}, {}'.format(checker, reason))
+
+    def _add_internal_error(self, checker, stats, error_msg):
+        HealthChecker.summary = HealthChecker.STATUS_NOT_OK
+        entry = {str(checker): {
+            HealthChecker.INFO_FIELD_OBJECT_STATUS: HealthChecker.STATUS_NOT_OK,
+            HealthChecker.INFO_FIELD_OBJECT_MSG: error_msg,
+            HealthChecker.INFO_FIELD_OBJECT_TYPE: "Internal"
+        }}
+        if 'Internal' not in stats:
+            stats['Internal'] = entry
+        else:
+            stats['Internal'].update(entry)
 
     def _set_system_led(self, chassis):
         try:
@@ -7,6 +7,7 @@ from swsscommon import swsscommon
 from sonic_py_common import multi_asic, device_info
 from sonic_py_common.logger import Logger
 from .health_checker import HealthChecker
+from .supervisor_collector import SupervisorStatusCollector
 from . import utils
 
 SYSLOG_IDENTIFIER = 'service_checker'
@@ -64,6 +65,20 @@ class ServiceChecker(HealthChecker):
 
         self.config_db = None
 
+        self.docker_client = None
+
+        # Start marker (container id, start time) of running containers, a changed marker
+        # means the container was restarted and its critical process list is reloaded
+        self.container_start_markers = {}
+
+        # MergedDir of running containers as reported by docker
+        self.container_folders = {}
+
+        self.supervisor_collector = SupervisorStatusCollector()
+
+        # Process status of running containers collected in the current check
+        self.container_process_status = {}
+
         self.load_critical_process_cache()
 
     def get_expected_running_containers(self, feature_table):
@@ -140,14 +155,23 @@ class ServiceChecker(HealthChecker):
         Returns:
             running_containers: A set of running container names
         """
-        DOCKER_CLIENT = docker.DockerClient(base_url='unix://var/run/docker.sock')
+        if not self.docker_client:
+            self.docker_client = docker.DockerClient(base_url='unix://var/run/docker.sock')
         running_containers = set()
-        ctrs = DOCKER_CLIENT.containers
+        ctrs = self.docker_client.containers
         try:
             lst = ctrs.list(filters={"status": "running"})
 
+            self.container_folders = {}
             for ctr in lst:
                 running_containers.add(ctr.name)
+                self.container_folders[ctr.name] = ctr.attrs.get('GraphDriver', {}).get('Data', {}).get('MergedDir')
+                start_marker = (ctr.id, ctr.attrs.get('State', {}).get('StartedAt'))
+                if self.container_start_markers.get(ctr.name, start_marker) != start_marker:
+                    logger.log_info('Container {} was restarted, reload its critical processes'.format(ctr.name))
+                    self.container_critical_processes.pop(ctr.name, None)
+                    self.bad_containers.discard(ctr.name)
+                self.container_start_markers[ctr.name] = start_marker
                 if ctr.name not in self.container_critical_processes:
                     self.fill_critical_process_by_container(ctr.name)
         except docker.errors.APIError as err:
@@ -217,6 +241,10 @@ class ServiceChecker(HealthChecker):
         self.need_save_cache = True
 
     def _get_container_folder(self, container):
+        container_folder = self.container_folders.get(container)
+        if container_folder:
+            return container_folder
+
         container_folder = utils.run_command(ServiceChecker.GET_CONTAINER_FOLDER_CMD.format(container))
         if container_folder is None:
             return container_folder
@@ -318,6 +346,7 @@ class ServiceChecker(HealthChecker):
             self.set_object_not_ok('Service', 'system', 'no critical process found')
             return
 
+        self.collect_process_status(current_running_containers, feature_table)
         for container, critical_process_list in self.container_critical_processes.items():
             self.check_process_existence(container, critical_process_list, config, feature_table)
 
@@ -334,25 +363,6 @@ class ServiceChecker(HealthChecker):
         self.check_by_monit(config)
         self.check_services(config)
 
-    def _parse_supervisorctl_status(self, process_status):
-        """Expected input:
-            arp_update                       RUNNING   pid 67, uptime 1:03:56
-            buffermgrd                       RUNNING   pid 81, uptime 1:03:56
-
-        Args:
-            process_status (list): List of process status
-        """
-        data = {}
-        for line in process_status:
-            line = line.strip()
-            if not line:
-                continue
-            items = line.split()
-            if len(items) < 2:
-                continue
-            data[items[0].strip()] = items[1].strip()
-        return data
-
     def publish_events(self, container_name, critical_process_list):
         params = swsscommon.FieldValueMap()
         params["ctr_name"] = container_name
@@ -362,6 +372,25 @@ class ServiceChecker(HealthChecker):
             swsscommon.event_publish(events_handle, EVENTS_PUBLISHER_TAG, params)
         swsscommon.events_deinit_publisher(events_handle)
 
+    def _is_feature_enabled(self, container_name, feature_table):
+        feature_name = self.container_feature_dict.get(container_name)
+        return (feature_name in feature_table
+                and "state" in feature_table[feature_name]
+                and feature_table[feature_name]["state"] not in ["disabled", "always_disabled"])
+
+    def collect_process_status(self, running_containers, feature_table):
+        """Collect supervisord process status of running containers which have critical processes, in parallel.
+
+        Args:
+            running_containers (set): Current running containers
+            feature_table (object): Feature table
+        """
+        containers = {}
+        for container_name in self.container_critical_processes:
+            if container_name in running_containers and self._is_feature_enabled(container_name, feature_table):
+                containers[container_name] = SupervisorStatusCollector.get_socket_path(self._get_container_folder(container_name))
+        self.container_process_status = self.supervisor_collector.collect(containers)
+
     def check_process_existence(self, container_name, critical_process_list, config, feature_table):
         """Check whether the process in the specified container is running or not.
 
@@ -371,33 +400,30 @@ class ServiceChecker(HealthChecker):
             config (object): Health checker configuration.
             feature_table (object): Feature table
         """
-        feature_name = self.container_feature_dict[container_name]
-        if feature_name in feature_table:
-            # We look into the 'FEATURE' table to verify whether the container is disabled or not.
-            # If the container is diabled, we exit.
-            if ("state" in feature_table[feature_name]
-                    and feature_table[feature_name]["state"] not in ["disabled", "always_disabled"]):
-
-                # We are using supervisorctl status to check the critical process status. We cannot leverage psutil here because
-                # it not always possible to get process cmdline in supervisor.conf. E.g, cmdline of orchagent is "/usr/bin/orchagent",
-                # however, in supervisor.conf it is "/usr/bin/orchagent.sh"
-                cmd = 'docker exec {} bash -c "supervisorctl status"'.format(container_name)
-                process_status = utils.run_command(cmd)
-                if process_status is None:
-                    for process_name in critical_process_list:
-                        self.set_object_not_ok('Process', '{}:{}'.format(container_name, process_name), "Process '{}' in container '{}' is not running".format(process_name, container_name))
-                    self.publish_events(container_name, critical_process_list)
-                    return
-
-                process_status = self._parse_supervisorctl_status(process_status.strip().splitlines())
-                for process_name in critical_process_list:
-                    if config and config.ignore_services and process_name in config.ignore_services:
-                        continue
-
-                    # Sometimes process_name is in critical_processes file, but it is not in supervisor.conf, such process will not run in container.
-                    # and it is safe to ignore such process. E.g, radv. So here we only check those processes which are in process_status.
-                    if process_name in process_status:
-                        if process_status[process_name] != 'RUNNING':
-                            self.set_object_not_ok('Process', '{}:{}'.format(container_name, process_name), "Process '{}' in container '{}' is not running".format(process_name, container_name))
-                        else:
-                            self.set_object_ok('Process', '{}:{}'.format(container_name, process_name))
+        # We look into the 'FEATURE' table to verify whether the container is disabled or not.
+        # If the container is diabled, we exit.
+        if not self._is_feature_enabled(container_name, feature_table):
+            return
+
+        # We are using supervisord process status to check the critical process status. We cannot leverage psutil here because
+        # it not always possible to get process cmdline in supervisor.conf. E.g, cmdline of orchagent is "/usr/bin/orchagent",
+        # however, in supervisor.conf it is "/usr/bin/orchagent.sh"
+        # The status is collected by collect_process_status, containers which are not running have no process status.
+        process_status = self.container_process_status.get(container_name, {})
+        if process_status is None:
+            for process_name in critical_process_list:
+                self.set_object_not_ok('Process', '{}:{}'.format(container_name, process_name), "Process '{}' in container '{}' is not running".format(process_name, container_name))
+            self.publish_events(container_name, critical_process_list)
+            return
+
+        for process_name in critical_process_list:
+            if config and config.ignore_services and process_name in config.ignore_services:
+                continue
+
+            # Sometimes process_name is in critical_processes file, but it is not in supervisor.conf, such process will not run in container.
+            # and it is safe to ignore such process. E.g, radv. So here we only check those processes which are in process_status.
+            if process_name in process_status:
+                if process_status[process_name] != 'RUNNING':
+                    self.set_object_not_ok('Process', '{}:{}'.format(container_name, process_name), "Process '{}' in container '{}' is not running".format(process_name, container_name))
+                else:
+                    self.set_object_ok('Process', '{}:{}'.format(container_name, process_name))
@@ -0,0 +1,144 @@
+import http.client
+import os
+import socket
+import xmlrpc.client
+from concurrent.futures import ThreadPoolExecutor
+
+from sonic_py_common.logger import Logger
+from . import utils
+
+SYSLOG_IDENTIFIER = 'supervisor_collector'
+logger = Logger(log_identifier=SYSLOG_IDENTIFIER)
+
+
+class UnixStreamHTTPConnection(http.client.HTTPConnection):
+    """
+    HTTP connection over a unix stream socket, used to reach supervisord's unix_http_server.
+    """
+    def __init__(self, socket_path, timeout):
+        http.client.HTTPConnection.__init__(self, 'localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class UnixStreamTransport(xmlrpc.client.Transport):
+    def __init__(self, socket_path, timeout):
+        xmlrpc.client.Transport.__init__(self)
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def make_connection(self, host):
+        return UnixStreamHTTPConnection(self.socket_path, self.timeout)
+
+
+def parse_supervisorctl_status(process_status):
+    """Expected input:
+        arp_update                       RUNNING   pid 67, uptime 1:03:56
+        buffermgrd                       RUNNING   pid 81, uptime 1:03:56
+
+    Args:
+        process_status (list): List of process status
+
+    Returns:
+        A dictionary {<process_name>:<state>}
+    """
+    data = {}
+    for line in process_status:
+        line = line.strip()
+        if not line:
+            continue
+        items = line.split()
+        if len(items) < 2:
+            continue
+        data[items[0].strip()] = items[1].strip()
+    return data
+
+
+class SupervisorStatusCollector(object):
+    """
+    Collect supervisord process status of several containers in parallel. The status is read
+    from the supervisord XML-RPC interface through the container's unix socket, "docker exec
+    supervisorctl status" is only used when the socket is not reachable.
+    """
+
+    # Location of the supervisord socket relative to the container root
+    SUPERVISOR_SOCKET_PATH = 'var/run/supervisor.sock'
+
+    # Fallback command to get process status of a container
+    EXEC_STATUS_CMD = 'docker exec {} bash -c "supervisorctl status"'
+
+    MAX_WORKERS = 8
+
+    # Timeout in seconds of a single XML-RPC request
+    RPC_TIMEOUT = 10
+
+    def __init__(self, max_workers=MAX_WORKERS):
+        self.max_workers = max_workers
+        self.executor = None
+        self.rpc_count = 0
+        self.exec_count = 0
+
+    @staticmethod
+    def get_socket_path(container_folder):
+        if not container_folder:
+            return None
+        return os.path.join(container_folder, SupervisorStatusCollector.SUPERVISOR_SOCKET_PATH)
+
+    def collect(self, containers):
+        """Collect process status of the given containers
+
+        Args:
+            containers (dict): {<container_name>:<supervisord socket path or None>}
+
+        Returns:
+            A dictionary {<container_name>:<{<process_name>:<state>} or None if status is not available>}
+        """
+        if not containers:
+            return {}
+        if len(containers) == 1:
+            container, socket_path = next(iter(containers.items()))
+            return {container: self.get_process_status(container, socket_path)}
+
+        if not self.executor:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='supervisor_collector')
+        futures = {container: self.executor.submit(self.get_process_status, container, socket_path)
+                   for container, socket_path in containers.items()}
+        return {container: future.result() for container, future in futures.items()}
+
+    def get_process_status(self, container, socket_path):
+        if socket_path and os.path.exists(socket_path):
+            try:
+                process_status = self._get_process_status_by_rpc(socket_path)
+                self.rpc_count += 1
+                return process_status
+            except (OSError, http.client.HTTPException, xmlrpc.client.Error) as e:
+                logger.log_debug('Failed to get process status of {} from {}, fall back to docker exec. Error: {}'.format(container, socket_path, e))
+        self.exec_count += 1
+        return self._get_process_status_by_exec(container)
+
+    def _get_process_status_by_rpc(self, socket_path):
+        server = xmlrpc.client.ServerProxy('http://localhost', transport=UnixStreamTransport(socket_path, self.RPC_TIMEOUT))
+        data = {}
+        for info in server.supervisor.getAllProcessInfo():
+            # Use the same process name format as "supervisorctl status"
+            if info['group'] == info['name']:
+                name = info['name']
+            else:
+                name = '{}:{}'.format(info['group'], info['name'])
+            data[name] = info['statename']
+        return data
+
+    def _get_process_status_by_exec(self, container):
+        process_status = utils.run_command(self.EXEC_STATUS_CMD.format(container))
+        if process_status is None:
+            return None
+        return parse_supervisorctl_status(process_status.strip().splitlines())
+
+    def shutdown(self):
+        if self.executor:
+            self.executor.shutdown(wait=False)
+            self.executor = None
@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 
 import os
+import re
 import sys
 import time
 import glob
@@ -25,6 +26,112 @@ TASK_STOP_TIMEOUT = 10
 logger = Logger(log_identifier=SYSLOG_IDENTIFIER)
 exclude_srv_list = ['ztp.service']
 
+SYSTEMD_BUS_NAME = 'org.freedesktop.systemd1'
+SYSTEMD_OBJECT_PATH = '/org/freedesktop/systemd1'
+SYSTEMD_UNIT_PATH_PREFIX = SYSTEMD_OBJECT_PATH + '/unit/'
+SYSTEMD_MANAGER_INTERFACE = 'org.freedesktop.systemd1.Manager'
+SYSTEMD_UNIT_INTERFACE = 'org.freedesktop.systemd1.Unit'
+DBUS_PROPERTIES_INTERFACE = 'org.freedesktop.DBus.Properties'
+#Unit properties used to evaluate the service status, same as the "systemctl show" properties
+UNIT_PROPERTIES = ['Id', 'LoadState', 'UnitFileState', 'Type', 'ActiveState', 'SubState', 'Result']
+#Unit types which are monitored and their type specific D-Bus interface
+UNIT_TYPE_INTERFACES = {
+    'service': 'org.freedesktop.systemd1.Service',
+    'timer': 'org.freedesktop.systemd1.Timer'
+}
+
+
+def get_timestamp():
+    return "{}".format(datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"))
+
+
+def unit_name_from_path(path):
+    """Get unit name from a systemd unit object path, e.g. /org/freedesktop/systemd1/unit/radv_2eservice -> radv.service"""
+    if not path or not path.startswith(SYSTEMD_UNIT_PATH_PREFIX):
+        return None
+    return re.sub(r'_([0-9a-f]{2})', lambda m: chr(int(m.group(1), 16)), path[len(SYSTEMD_UNIT_PATH_PREFIX):])
+
+
+def is_monitored_unit(unit):
+    return unit is not None and unit.rsplit('.', 1)[-1] in UNIT_TYPE_INTERFACES
+
+
+#Cache of systemd unit properties. It is loaded by a single ListUnits call, properties
+#not reported by ListUnits are read over D-Bus on first use. The cache is then kept up
+#to date by the PropertiesChanged signals forwarded by MonitorSystemBusTask
+class SystemdUnitCache(object):
+
+    def __init__(self):
+        self.bus = None
+        self.manager = None
+        self.units = {}
+        self.unit_paths = {}
+
+    def load(self, bus=None):
+        import dbus
+
+        self.bus = bus if bus is not None else dbus.SystemBus()
+        systemd = self.bus.get_object(SYSTEMD_BUS_NAME, SYSTEMD_OBJECT_PATH)
+        self.manager = dbus.Interface(systemd, SYSTEMD_MANAGER_INTERFACE)
+        self.units = {}
+        self.unit_paths = {}
+        for unit in self.manager.ListUnits():
+            # (name, description, load state, active state, sub state, followed unit, object path, ...)
+            name = str(unit[0])
+            if not is_monitored_unit(name):
+                continue
+            self.units[name] = {'Id': name, 'LoadState': str(unit[2]), 'ActiveState': str(unit[3]), 'SubState': str(unit[4])}
+            self.unit_paths[name] = str(unit[6])
+        logger.log_info("Loaded {} units from systemd".format(len(self.units)))
+
+    def is_loaded(self):
+        return self.manager is not None
+
+    def get(self, unit):
+        """Get the properties of a unit, missing properties are read over D-Bus and cached"""
+        props = self.units.get(unit)
+        if props is None or 'UnitFileState' not in props:
+            props = self._read_unit_properties(unit)
+            self.units[unit] = props
+        return props
+
+    def update(self, unit, changed, invalidated=None):
+        """Apply a PropertiesChanged signal, the unit is read again on next use if any property was invalidated"""
+        props = self.units.get(unit)
+        if props is None:
+            # Not cached yet, the unit is read completely on first use
+            return
+        props.update(changed)
+        if invalidated:
+            # UnitFileState marks a completely read unit, drop it to read the unit again
+            props.pop('UnitFileState', None)
+
+    def invalidate_unit_files(self):
+        """UnitFileState is not signaled by systemd, drop it when unit files change"""
+        for props in self.units.values():
+            props.pop('UnitFileState', None)
+
+    def _read_unit_properties(self, unit):
+        import dbus
+
+        path = self.unit_paths.get(unit)
+        if path is None:
+            # LoadUnit reports LoadState "not-found" for an unknown unit like "systemctl show" does
+            path = str(self.manager.LoadUnit(unit))
+            self.unit_paths[unit] = path
+        properties = dbus.Interface(self.bus.get_object(SYSTEMD_BUS_NAME, path), DBUS_PROPERTIES_INTERFACE)
+        unit_props = properties.GetAll(SYSTEMD_UNIT_INTERFACE)
+        props = {prop: str(unit_props[prop]) for prop in UNIT_PROPERTIES if prop in unit_props}
+        interface = UNIT_TYPE_INTERFACES.get(unit.rsplit('.', 1)[-1])
+        if interface:
+            for prop in ['Type', 'Result']:
+                try:
+                    props[prop] = str(properties.Get(interface, prop))
+                except dbus.exceptions.DBusException:
+                    pass
+        return props
+
+
 #Subprocess which subscribes to STATE_DB FEATURE table for any update
 #and push service events to main process via queue
 class MonitorStateDbTask(ProcessTaskBase):
@@ -48,8 +155,7 @@ class MonitorStateDbTask(ProcessTaskBase):
                 continue
             (key, op, cfvs) = cst.pop()
             key_ext = key + ".service"
-            timestamp = "{}".format(datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"))
-            msg={"unit": key_ext, "evt_src":"feature", "time":timestamp}
+            msg={"unit": key_ext, "evt_src":"feature", "time":get_timestamp()}
             self.task_notify(msg)
 
 
@@ -77,11 +183,25 @@ class MonitorSystemBusTask(ProcessTaskBase):
 
     def on_job_removed(self, id, job, unit, result):
         if result == "done" or result == "failed":
-            timestamp = "{}".format(datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"))
-            msg = {"unit": unit, "evt_src":"sysbus", "time":timestamp}
+            msg = {"unit": unit, "evt_src":"sysbus", "time":get_timestamp()}
             self.task_notify(msg)
             return
 
+    #Forward property changes of monitored units to the unit cache of the main process
+    def on_properties_changed(self, interface, changed, invalidated, path=None):
+        unit = unit_name_from_path(path)
+        if not is_monitored_unit(unit):
+            return
+        changed = {str(prop): str(value) for prop, value in changed.items() if prop in UNIT_PROPERTIES}
+        invalidated = [str(prop) for prop in invalidated if prop in UNIT_PROPERTIES]
+        if changed or invalidated:
+            msg = {"unit": unit, "evt_src":"props", "time":get_timestamp(), "changed":changed, "invalidated":invalidated}
+            self.task_notify(msg)
+
+    def on_unit_files_changed(self):
+        msg = {"unit": None, "evt_src":"unitfiles", "time":get_timestamp()}
+        self.task_notify(msg)
+
     #Function for listening the systemd event on dbus
     def subscribe_sysbus(self):
         import dbus
@@ -90,10 +210,14 @@ class MonitorSystemBusTask(ProcessTaskBase):
 
         DBusGMainLoop(set_as_default=True)
         bus = dbus.SystemBus()
-        systemd = bus.get_object('org.freedesktop.systemd1', '/org/freedesktop/systemd1')
-        manager = dbus.Interface(systemd, 'org.freedesktop.systemd1.Manager')
+        systemd = bus.get_object(SYSTEMD_BUS_NAME, SYSTEMD_OBJECT_PATH)
+        manager = dbus.Interface(systemd, SYSTEMD_MANAGER_INTERFACE)
         manager.Subscribe()
         manager.connect_to_signal('JobRemoved', self.on_job_removed)
+        manager.connect_to_signal('UnitFilesChanged', self.on_unit_files_changed)
+        bus.add_signal_receiver(self.on_properties_changed, signal_name='PropertiesChanged',
+                                dbus_interface=DBUS_PROPERTIES_INTERFACE, bus_name=SYSTEMD_BUS_NAME,
+                                path_keyword='path')
 
         loop = GLib.MainLoop()
         loop.run()
@@ -127,6 +251,10 @@ class Sysmonitor(ProcessTaskBase):
         self.config = Config()
         self.mpmgr = multiprocessing.Manager()
         self.myQ = self.mpmgr.Queue()
+        self.unit_cache = SystemdUnitCache()
+        #Services from the systemd targets and the FEATURE table, refreshed on FEATURE table events
+        self.feature_srv_list = None
+        self.feature_table = None
 
     #Sets system ready status to state db
     def post_system_status(self, state):
@@ -141,6 +269,11 @@ class Sysmonitor(ProcessTaskBase):
         except Exception as e:
             logger.log_error("Unable to post system ready status: {}".format(str(e)))
 
+    #Drops the cached FEATURE table and the service list formed from it
+    def invalidate_feature_cache(self):
+        self.feature_srv_list = None
+        self.feature_table = None
+
     #Forms the service list to be monitored
     def get_all_service_list(self):
 
@@ -148,14 +281,21 @@ class Sysmonitor(ProcessTaskBase):
             self.config_db = swsscommon.ConfigDBConnector(use_unix_socket_path=True)
             self.config_db.connect()
 
-        dir_list = []
-        #add the services from the below targets
-        targets= ["/etc/systemd/system/multi-user.target.wants", "/etc/systemd/system/sonic.target.wants"]
-        for path in targets:
-            dir_list += [os.path.basename(i) for i in glob.glob('{}/*.service'.format(path))]
+        if self.feature_srv_list is None:
+            feature_srv_list = []
+            #add the services from the below targets
+            targets= ["/etc/systemd/system/multi-user.target.wants", "/etc/systemd/system/sonic.target.wants"]
+            for path in targets:
+                feature_srv_list += [os.path.basename(i) for i in glob.glob('{}/*.service'.format(path))]
+
+            #add the enabled docker services from config db feature table
+            #a FEATURE table which is not fully ready is read again next time
+            if self.get_service_from_feature_table(feature_srv_list):
+                self.feature_srv_list = feature_srv_list
+        else:
+            feature_srv_list = self.feature_srv_list
 
-        #add the enabled docker services from config db feature table
-        self.get_service_from_feature_table(dir_list)
+        dir_list = list(feature_srv_list)
 
         self.config.load_config()
         if self.config and self.config.ignore_services:
@@ -202,6 +342,9 @@ class Sysmonitor(ProcessTaskBase):
 
         Args:
             dir_list (list): service list
+
+        Returns:
+            True if the FEATURE table was read successfully
         """
         max_retry = 3
         retry_delay = 1
@@ -233,6 +376,7 @@ class Sysmonitor(ProcessTaskBase):
                 break
         if not success:
             logger.log_error("FEATURE table is not fully ready: {}, max retry reached".format(feature_table))
+        return success
 
     #Checks FEATURE table from config db for the service' check_up_status flag
     #if marked to true, then read the service up_status from FEATURE table of state db.
@@ -248,7 +392,12 @@ class Sysmonitor(ProcessTaskBase):
         fail_reason = ""
         check_app_up_status = ""
         up_status_flag = ""
-        configdb_feature_table = self.config_db.get_table('FEATURE')
+        configdb_feature_table = self.feature_table
+        if configdb_feature_table is None:
+            configdb_feature_table = self.config_db.get_table('FEATURE')
+            #only cache a fully filled FEATURE table, see get_service_from_feature_table
+            if all('state' in fields for fields in configdb_feature_table.values()):
+                self.feature_table = configdb_feature_table
         update_time = "-"
 
         if service not in configdb_feature_table.keys():
@@ -287,6 +436,15 @@ class Sysmonitor(ProcessTaskBase):
 
         return prop_dict
 
+    #Gets the service properties from the unit cache, "systemctl show" is used when systemd D-Bus is not available
+    def get_unit_properties(self, service):
+        if self.unit_cache.is_loaded():
+            try:
+                return self.unit_cache.get(service)
+            except Exception as e:
+                logger.log_warning("Failed to get unit {} properties from systemd: {}".format(service, str(e)))
+        return self.run_systemctl_show(service)
+
     #Sets the service status to state db
     def post_unit_status(self, srv_name, srv_status, app_status, fail_reason, update_time):
         if not self.state_db:
@@ -313,7 +471,7 @@ class Sysmonitor(ProcessTaskBase):
             service_up_status = "Down"
             service_name,last_name = event.split('.')
 
-            sysctl_show = self.run_systemctl_show(event)
+            sysctl_show = self.get_unit_properties(event)
 
             load_state = sysctl_show.get('LoadState')
             if load_state == "loaded":
@@ -481,6 +639,10 @@ class Sysmonitor(ProcessTaskBase):
             logger.log_error("SubProcess-{}".format(str(e)))
             sys.exit(1)
 
+        try:
+            self.unit_cache.load()
+        except Exception as e:
+            logger.log_warning("Unable to load units from systemd, fall back to systemctl: {}".format(str(e)))
 
         self.update_system_status()
 
@@ -495,6 +657,16 @@ class Sysmonitor(ProcessTaskBase):
                 event_src = msg["evt_src"]
                 event_time = msg["time"]
                 logger.log_debug("Main process- received event:{} from source:{} time:{}".format(event,event_src,event_time))
+                if event_src == "props":
+                    self.unit_cache.update(event, msg["changed"], msg["invalidated"])
+                    continue
+                if event_src == "unitfiles":
+                    self.unit_cache.invalidate_unit_files()
+                    # services enabled or disabled by systemctl change the target wants dirs
+                    self.feature_srv_list = None
+                    continue
+                if event_src == "feature":
+                    self.invalidate_feature_cache()
                 logger.log_info("check_unit_status for [ "+event+" ] ")
                 self.check_unit_status(event)
             except (Empty, EOFError):
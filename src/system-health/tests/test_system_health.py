@@ -11,12 +11,21 @@
 """
 import copy
 import os
+import shutil
+import socketserver
+import subprocess
 import sys
+import tempfile
+import threading
+import time
 import docker
 import importlib.util
 import importlib.machinery
+from concurrent.futures import ThreadPoolExecutor
 from swsscommon import swsscommon
+from xmlrpc.server import SimpleXMLRPCDispatcher, SimpleXMLRPCRequestHandler
 
+import pytest
 from mock import Mock, MagicMock, patch
 from sonic_py_common import device_info
 
@@ -37,10 +46,13 @@ from health_checker.hardware_checker import HardwareChecker
 from health_checker.health_checker import HealthChecker
 from health_checker.manager import HealthCheckerManager
 from health_checker.service_checker import ServiceChecker
+from health_checker.supervisor_collector import SupervisorStatusCollector
 from health_checker.user_defined_checker import UserDefinedChecker
 from health_checker.sysmonitor import Sysmonitor
 from health_checker.sysmonitor import MonitorStateDbTask
 from health_checker.sysmonitor import MonitorSystemBusTask
+from health_checker.sysmonitor import SystemdUnitCache
+from health_checker import sysmonitor
 
 def load_source(modname, filename):
     loader = importlib.machinery.SourceFileLoader(modname, filename)
@@ -354,6 +366,137 @@ def test_service_checker_check_by_monit(mock_run):
     assert checker._info['diskCheck'][HealthChecker.INFO_FIELD_OBJECT_STATUS] == HealthChecker.STATUS_OK
 
 
+class UnixXMLRPCRequestHandler(SimpleXMLRPCRequestHandler):
+    # TCP_NODELAY is not supported on unix sockets
+    disable_nagle_algorithm = False
+
+
+class FakeSupervisord(socketserver.ThreadingMixIn, socketserver.UnixStreamServer, SimpleXMLRPCDispatcher):
+    """Serve supervisor.getAllProcessInfo on the supervisord socket of a fake container folder"""
+    daemon_threads = True
+
+    def __init__(self, container_folder, process_info):
+        self.logRequests = False
+        self.socket_path = SupervisorStatusCollector.get_socket_path(container_folder)
+        os.makedirs(os.path.dirname(self.socket_path), exist_ok=True)
+        SimpleXMLRPCDispatcher.__init__(self, allow_none=False, encoding=None)
+        socketserver.UnixStreamServer.__init__(self, self.socket_path, UnixXMLRPCRequestHandler)
+        self.register_function(lambda: process_info, 'supervisor.getAllProcessInfo')
+        # A short poll interval keeps shutdown() fast
+        self.thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+fake_process_info = [
+    {'name': 'snmpd', 'group': 'snmpd', 'statename': 'RUNNING'},
+    {'name': 'snmp-subagent', 'group': 'snmp-subagent', 'statename': 'EXITED'},
+    {'name': 'lldpd', 'group': 'lldp', 'statename': 'RUNNING'},
+]
+
+
+@patch('health_checker.utils.run_command')
+def test_supervisor_collector(mock_run):
+    mock_run.return_value = mock_supervisorctl_output
+    tmp_dir = tempfile.mkdtemp()
+    servers = []
+    try:
+        for name in ['snmp', 'lldp']:
+            servers.append(FakeSupervisord(os.path.join(tmp_dir, name), fake_process_info))
+
+        collector = SupervisorStatusCollector()
+        status = collector.collect({
+            'snmp': servers[0].socket_path,
+            'lldp': servers[1].socket_path,
+            'radv': SupervisorStatusCollector.get_socket_path(os.path.join(tmp_dir, 'radv')),
+            'swss': None,
+        })
+        expected = {'snmpd': 'RUNNING', 'snmp-subagent': 'EXITED', 'lldp:lldpd': 'RUNNING'}
+        assert status['snmp'] == expected
+        assert status['lldp'] == expected
+        # No supervisord socket, the status is read via docker exec
+        assert status['radv'] == {'snmpd': 'RUNNING', 'snmp-subagent': 'EXITED'}
+        assert status['swss'] == {'snmpd': 'RUNNING', 'snmp-subagent': 'EXITED'}
+        assert collector.rpc_count == 2
+        assert collector.exec_count == 2
+        mock_run.assert_any_call('docker exec radv bash -c "supervisorctl status"')
+
+        # supervisord is gone, fall back to docker exec which fails as well
+        servers[0].stop()
+        mock_run.return_value = None
+        assert collector.collect({'snmp': servers[0].socket_path}) == {'snmp': None}
+        collector.shutdown()
+    finally:
+        for server in servers[1:]:
+            server.stop()
+        shutil.rmtree(tmp_dir)
+
+
+def test_supervisor_collector_many_containers():
+    """Compare the process status read from the supervisord sockets against serial supervisorctl execs"""
+    num_containers = 5
+    tmp_dir = tempfile.mkdtemp()
+    servers = []
+    try:
+        containers = {}
+        for i in range(num_containers):
+            container = 'container{}'.format(i)
+            server = FakeSupervisord(os.path.join(tmp_dir, container), fake_process_info)
+            servers.append(server)
+            containers[container] = server.socket_path
+        status_file = os.path.join(tmp_dir, 'status')
+        with open(status_file, 'w') as f:
+            f.write(mock_supervisorctl_output)
+
+        # Serial exec path, a process is spawned per container like "docker exec" does
+        collector = SupervisorStatusCollector()
+        collector.EXEC_STATUS_CMD = 'cat {} # {{}}'.format(status_file)
+        exec_status = {container: collector.get_process_status(container, None) for container in containers}
+
+        rpc_status = collector.collect(containers)
+        collector.shutdown()
+
+        assert collector.exec_count == num_containers
+        assert collector.rpc_count == num_containers
+        for container in containers:
+            assert exec_status[container]['snmpd'] == rpc_status[container]['snmpd'] == 'RUNNING'
+            assert exec_status[container]['snmp-subagent'] == rpc_status[container]['snmp-subagent'] == 'EXITED'
+    finally:
+        for server in servers:
+            server.stop()
+        shutil.rmtree(tmp_dir)
+
+
+@patch('health_checker.service_checker.ServiceChecker.fill_critical_process_by_container')
+@patch('docker.DockerClient')
+def test_service_checker_container_restart(mock_docker_client, mock_fill):
+    mock_snmp_container = MagicMock()
+    mock_snmp_container.name = 'snmp'
+    mock_snmp_container.id = 'abc'
+    mock_snmp_container.attrs = {'State': {'StartedAt': '2024-01-01T00:00:00Z'}, 'GraphDriver': {'Data': {'MergedDir': test_path}}}
+    mock_docker_client.return_value.containers.list = MagicMock(return_value=[mock_snmp_container])
+
+    checker = ServiceChecker()
+    checker.container_critical_processes = {'snmp': ['snmpd']}
+    assert checker.get_current_running_containers() == {'snmp'}
+    assert checker._get_container_folder('snmp') == test_path
+    mock_fill.assert_not_called()
+
+    # The docker client is reused and the cached critical processes are kept
+    assert checker.get_current_running_containers() == {'snmp'}
+    assert mock_docker_client.call_count == 1
+    mock_fill.assert_not_called()
+
+    # Restarted container reloads its critical processes
+    mock_snmp_container.attrs = {'State': {'StartedAt': '2024-01-01T01:00:00Z'}, 'GraphDriver': {'Data': {'MergedDir': test_path}}}
+    checker.get_current_running_containers()
+    mock_fill.assert_called_once_with('snmp')
+    assert 'snmp' not in checker.container_critical_processes
+
+
 def test_hardware_checker():
     MockConnector.data.update({
         'TEMPERATURE_INFO|ASIC': {
@@ -688,6 +831,55 @@ def test_manager(mock_hw_info, mock_service_info, mock_udc_info):
     chassis.set_status_led.side_effect = RuntimeError()
     manager._set_system_led(chassis)
 
+@patch('swsscommon.swsscommon.ConfigDBConnector', MagicMock())
+@patch('swsscommon.swsscommon.ConfigDBConnector.connect', MagicMock())
+@patch('health_checker.service_checker.ServiceChecker.check', MagicMock())
+@patch('health_checker.hardware_checker.HardwareChecker.check', MagicMock())
+@patch('health_checker.service_checker.ServiceChecker.get_info', MagicMock(return_value={}))
+@patch('health_checker.hardware_checker.HardwareChecker.get_info', MagicMock(return_value={}))
+@patch('health_checker.user_defined_checker.UserDefinedChecker.get_category', MagicMock(return_value='UserDefine'))
+@patch('health_checker.user_defined_checker.UserDefinedChecker.get_info', MagicMock(return_value={}))
+@patch('health_checker.user_defined_checker.UserDefinedChecker.check')
+def test_manager_checker_timeout(mock_udc_check):
+    import threading
+    chassis = MagicMock()
+    manager = HealthCheckerManager()
+    manager.config.user_defined_checkers = ['slow check']
+    manager.config.checker_timeout = 0.1
+    release = threading.Event()
+    mock_udc_check.side_effect = lambda config: release.wait(5)
+
+    # Slow checker doesn't delay the other checkers and is reported as not OK
+    stat = manager.check(chassis)
+    assert stat['Internal']['UserDefinedChecker - slow check']['status'] == 'Not OK'
+    assert 'timed out' in stat['Internal']['UserDefinedChecker - slow check']['message']
+    assert 'ServiceChecker' not in stat['Internal']
+    assert HealthChecker.summary == HealthChecker.STATUS_NOT_OK
+
+    # Slow checker is not started again while it is still running
+    stat = manager.check(chassis)
+    assert 'still running' in stat['Internal']['UserDefinedChecker - slow check']['message']
+    assert mock_udc_check.call_count == 1
+    checker_stats = manager.get_checker_stats()
+    assert checker_stats['UserDefinedChecker - slow check']['timeout_count'] == 2
+    assert checker_stats['ServiceChecker']['timeout_count'] == 0
+    assert checker_stats['ServiceChecker']['last_run'] > 0
+
+    # Slow checker finished, it runs again
+    release.set()
+    manager._executor.shutdown(wait=True)
+    manager._executor = ThreadPoolExecutor(max_workers=HealthCheckerManager.MAX_CHECKER_WORKERS)
+    stat = manager.check(chassis)
+    assert 'Internal' not in stat
+    assert mock_udc_check.call_count == 2
+    assert manager.get_checker_stats()['UserDefinedChecker - slow check']['timeout_count'] == 2
+    manager.shutdown()
+
+    daemon = HealthDaemon()
+    daemon._process_checker_stats(manager.get_checker_stats())
+    assert MockConnector.data['SYSTEM_HEALTH_CHECKER_STATS|UserDefinedChecker - slow check']['timeout_count'] == '2'
+
+
 def test_utils():
     output = utils.run_command('some invalid command')
     assert not output
@@ -960,6 +1152,23 @@ def test_system_service():
     sysmon.task_stop()
 
 
+@patch('health_checker.sysmonitor.MonitorSystemBusTask', MagicMock())
+@patch('health_checker.sysmonitor.MonitorStateDbTask', MagicMock())
+@patch('health_checker.sysmonitor.Sysmonitor.update_system_status', MagicMock())
+def test_system_service_unit_files_changed():
+    sysmon = Sysmonitor()
+    sysmon.state_db = MagicMock()
+    sysmon.unit_cache = MagicMock()
+    sysmon.feature_srv_list = ['swss.service']
+    sysmon.feature_table = {'swss': {'state': 'enabled'}}
+    sysmon.myQ = MagicMock()
+    sysmon.myQ.get.side_effect = [{'unit': None, 'evt_src': 'unitfiles', 'time': 0}, 'stop']
+    sysmon.system_service()
+    sysmon.unit_cache.invalidate_unit_files.assert_called_once()
+    # The service list is built again from the target wants dirs
+    assert sysmon.feature_srv_list is None
+    assert sysmon.feature_table == {'swss': {'state': 'enabled'}}
+
 @patch('sonic_py_common.device_info.get_device_runtime_metadata', MagicMock(return_value=device_runtime_metadata))
 def test_get_service_from_feature_table():
     sysmon = Sysmonitor()
@@ -991,6 +1200,199 @@ def test_get_service_from_feature_table():
     assert 'swss.service' not in dir_list
 
 
+@patch('sonic_py_common.device_info.get_device_runtime_metadata', MagicMock(return_value=device_runtime_metadata))
+@patch('health_checker.sysmonitor.glob.glob', MagicMock(side_effect=lambda path: ['/etc/systemd/system/sonic.target.wants/swss.service'] if 'sonic' in path else []))
+def test_get_all_service_list_cache():
+    sysmon = Sysmonitor()
+    sysmon.config_db = MagicMock()
+    sysmon.config_db.get_table = MagicMock(return_value={'radv': {'state': 'enabled'}})
+    assert sysmon.get_all_service_list() == ['radv.service', 'swss.service']
+    calls = sysmon.config_db.get_table.call_count
+    sysmon.get_app_ready_status('radv.service')
+
+    # The FEATURE table is not read again until a FEATURE table event
+    assert sysmon.get_all_service_list() == ['radv.service', 'swss.service']
+    sysmon.get_app_ready_status('radv.service')
+    assert sysmon.config_db.get_table.call_count == calls + 1
+
+    sysmon.config_db.get_table.return_value = {'radv': {'state': 'disabled'}}
+    sysmon.invalidate_feature_cache()
+    assert sysmon.get_all_service_list() == ['swss.service']
+
+
+
+@patch('sonic_py_common.device_info.get_device_runtime_metadata', MagicMock(return_value=device_runtime_metadata))
+@patch('health_checker.sysmonitor.glob.glob', MagicMock(side_effect=lambda path: ['/etc/systemd/system/sonic.target.wants/swss.service'] if 'sonic' in path else []))
+@patch('health_checker.sysmonitor.time.sleep', MagicMock())
+def test_get_all_service_list_not_ready():
+    sysmon = Sysmonitor()
+    sysmon.config_db = MagicMock()
+    sysmon.config_db.get_table = MagicMock(return_value={'radv': {}})
+    assert sysmon.get_all_service_list() == ['swss.service']
+    sysmon.get_app_ready_status('radv.service')
+
+    # A FEATURE table which is not fully ready is not cached
+    assert sysmon.feature_srv_list is None
+    assert sysmon.feature_table is None
+    sysmon.config_db.get_table.return_value = {'radv': {'state': 'enabled'}}
+    assert sysmon.get_all_service_list() == ['radv.service', 'swss.service']
+    sysmon.get_app_ready_status('radv.service')
+    assert sysmon.feature_srv_list == ['swss.service', 'radv.service']
+    assert sysmon.feature_table == {'radv': {'state': 'enabled'}}
+
+def test_monitor_sysbus_properties_changed():
+    assert sysmonitor.unit_name_from_path('/org/freedesktop/systemd1/unit/radv_2eservice') == 'radv.service'
+    assert sysmonitor.unit_name_from_path('/org/freedesktop/systemd1/unit/systemd_2djournald_2eservice') == 'systemd-journald.service'
+    assert sysmonitor.unit_name_from_path('/org/freedesktop/systemd1') is None
+
+    task = MonitorSystemBusTask(MagicMock())
+    task.on_properties_changed('org.freedesktop.systemd1.Unit', {'ActiveState': 'active', 'ActiveEnterTimestamp': 1}, [],
+                               path='/org/freedesktop/systemd1/unit/radv_2eservice')
+    msg = task.task_queue.put.call_args[0][0]
+    assert msg['unit'] == 'radv.service'
+    assert msg['evt_src'] == 'props'
+    assert msg['changed'] == {'ActiveState': 'active'}
+
+    # Units which are not monitored and unrelated properties are not forwarded
+    task.task_queue.put.reset_mock()
+    task.on_properties_changed('org.freedesktop.systemd1.Unit', {'ActiveState': 'active'}, [],
+                               path='/org/freedesktop/systemd1/unit/dev_2dsda_2edevice')
+    task.on_properties_changed('org.freedesktop.systemd1.Service', {'MainPID': 10}, [],
+                               path='/org/freedesktop/systemd1/unit/radv_2eservice')
+    task.task_queue.put.assert_not_called()
+
+
+def test_systemd_unit_cache_update():
+    cache = SystemdUnitCache()
+    cache.units['radv.service'] = dict(mock_srv_props['mock_radv.service'])
+    cache.update('radv.service', {'ActiveState': 'failed', 'Result': 'exit-code'})
+    assert cache.get('radv.service')['ActiveState'] == 'failed'
+    assert cache.get('radv.service')['Result'] == 'exit-code'
+
+    # Updates of units which are not cached are ignored
+    cache.update('bgp.service', {'ActiveState': 'failed'})
+    assert 'bgp.service' not in cache.units
+
+    cache.invalidate_unit_files()
+    assert 'UnitFileState' not in cache.units['radv.service']
+
+
+def systemd_unit_path(unit):
+    return sysmonitor.SYSTEMD_UNIT_PATH_PREFIX + ''.join(c if c.isalnum() else '_{:02x}'.format(ord(c)) for c in unit)
+
+
+fake_systemd_units = {
+    'radv.service': {'LoadState': 'loaded', 'ActiveState': 'active', 'SubState': 'running', 'UnitFileState': 'enabled',
+                     'Type': 'simple', 'Result': 'success'},
+    'bgp.service': {'LoadState': 'loaded', 'ActiveState': 'inactive', 'SubState': 'dead', 'UnitFileState': 'enabled',
+                    'Type': 'simple', 'Result': 'success'},
+    'sockets.target': {'LoadState': 'loaded', 'ActiveState': 'active', 'SubState': 'active', 'UnitFileState': 'static'},
+}
+
+
+def run_fake_systemd(address):
+    """Serve a fake systemd manager on a private D-Bus daemon"""
+    import dbus
+    import dbus.service
+    from gi.repository import GLib
+    from dbus.mainloop.glib import DBusGMainLoop
+
+    class FakeUnit(dbus.service.Object):
+        def __init__(self, bus, name, props):
+            dbus.service.Object.__init__(self, bus, systemd_unit_path(name))
+            self.interfaces = {
+                sysmonitor.SYSTEMD_UNIT_INTERFACE: {prop: value for prop, value in props.items() if prop not in ['Type', 'Result']},
+                sysmonitor.UNIT_TYPE_INTERFACES['service']: {prop: value for prop, value in props.items() if prop in ['Type', 'Result']},
+            }
+            self.interfaces[sysmonitor.SYSTEMD_UNIT_INTERFACE]['Id'] = name
+
+        @dbus.service.method(sysmonitor.DBUS_PROPERTIES_INTERFACE, in_signature='s', out_signature='a{sv}')
+        def GetAll(self, interface):
+            return self.interfaces.get(interface, {})
+
+        @dbus.service.method(sysmonitor.DBUS_PROPERTIES_INTERFACE, in_signature='ss', out_signature='v')
+        def Get(self, interface, prop):
+            if prop not in self.interfaces.get(interface, {}):
+                raise dbus.exceptions.DBusException('Unknown property', name='org.freedesktop.DBus.Error.UnknownProperty')
+            return self.interfaces[interface][prop]
+
+    class FakeManager(dbus.service.Object):
+        def __init__(self, bus):
+            dbus.service.Object.__init__(self, bus, sysmonitor.SYSTEMD_OBJECT_PATH)
+            self.bus = bus
+            self.units = {name: FakeUnit(bus, name, props) for name, props in fake_systemd_units.items()}
+
+        @dbus.service.method(sysmonitor.SYSTEMD_MANAGER_INTERFACE, out_signature='a(ssssssouso)')
+        def ListUnits(self):
+            return [(name, '', props['LoadState'], props['ActiveState'], props['SubState'], '', systemd_unit_path(name), 0, '', '/')
+                    for name, props in fake_systemd_units.items()]
+
+        @dbus.service.method(sysmonitor.SYSTEMD_MANAGER_INTERFACE, in_signature='s', out_signature='o')
+        def LoadUnit(self, name):
+            if name not in self.units:
+                self.units[name] = FakeUnit(self.bus, name, {'LoadState': 'not-found', 'ActiveState': 'inactive', 'SubState': 'dead'})
+            return systemd_unit_path(name)
+
+    DBusGMainLoop(set_as_default=True)
+    bus = dbus.bus.BusConnection(address)
+    manager = FakeManager(bus)
+    bus_name = dbus.service.BusName(sysmonitor.SYSTEMD_BUS_NAME, bus)
+    GLib.MainLoop().run()
+
+
+@pytest.fixture
+def fake_systemd_bus():
+    dbus = pytest.importorskip('dbus')
+    pytest.importorskip('gi.repository.GLib')
+    if not shutil.which('dbus-daemon'):
+        pytest.skip('dbus-daemon is not available')
+
+    import multiprocessing
+    daemon = subprocess.Popen(['dbus-daemon', '--session', '--nofork', '--print-address'], stdout=subprocess.PIPE, universal_newlines=True)
+    address = daemon.stdout.readline().strip()
+    systemd = multiprocessing.Process(target=run_fake_systemd, args=(address,), daemon=True)
+    systemd.start()
+    bus = dbus.bus.BusConnection(address)
+    try:
+        for _ in range(100):
+            if bus.name_has_owner(sysmonitor.SYSTEMD_BUS_NAME):
+                break
+            time.sleep(0.05)
+        yield bus
+    finally:
+        bus.close()
+        systemd.terminate()
+        daemon.terminate()
+        daemon.wait()
+
+
+@patch('health_checker.sysmonitor.Sysmonitor.run_systemctl_show')
+@patch('health_checker.sysmonitor.Sysmonitor.get_app_ready_status', MagicMock(return_value=('Up','-','-')))
+@patch('health_checker.sysmonitor.Sysmonitor.post_unit_status', MagicMock())
+def test_systemd_unit_cache(mock_systemctl_show, fake_systemd_bus):
+    cache = SystemdUnitCache()
+    cache.load(fake_systemd_bus)
+    assert set(cache.units.keys()) == {'radv.service', 'bgp.service'}
+    assert cache.units['bgp.service']['ActiveState'] == 'inactive'
+
+    props = cache.get('radv.service')
+    for prop in sysmonitor.UNIT_PROPERTIES:
+        assert props[prop] == ('radv.service' if prop == 'Id' else fake_systemd_units['radv.service'][prop])
+    assert cache.get('ztp.service')['LoadState'] == 'not-found'
+
+    # Signaled changes are served from the cache
+    cache.update('radv.service', {'ActiveState': 'inactive', 'SubState': 'dead', 'Result': 'exit-code'}, [])
+    assert cache.get('radv.service')['ActiveState'] == 'inactive'
+    cache.invalidate_unit_files()
+    assert cache.get('radv.service')['ActiveState'] == 'active'
+
+    sysmon = Sysmonitor()
+    sysmon.unit_cache = cache
+    assert sysmon.get_unit_status('radv.service') == 'OK'
+    assert sysmon.get_unit_status('bgp.service') == 'NOT OK'
+    mock_systemctl_show.assert_not_called()
+
+
 @patch('healthd.time.time')
 @patch('healthd.HealthDaemon.log_notice', side_effect=lambda *args, **kwargs: None)
 @patch('healthd.HealthDaemon.log_warning', side_effect=lambda *args, **kwargs: None)